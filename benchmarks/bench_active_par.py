@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+
+"""
+Benchmark: active parameter detection
+=====================================
+Compares the time spent on the linear backward stepwise elimination of
+:meth:`~prism.emulator.Emulator._get_active_par` between the native backward
+selection, which handles all emulator systems at once, and the reference
+`mlxtend` sequential feature selector it replaced, which handles every
+emulator system separately. The number of emulator systems with differently
+selected parameters is reported as well. The reference is skipped if `mlxtend`
+is not installed.
+
+"""
+
+
+# %% IMPORTS
+# Package imports
+import numpy as np
+from sklearn.linear_model import LinearRegression as LR
+
+# PRISM imports
+from prism.emulator._selection import select_backward
+
+# Benchmark imports
+from common import get_pipeline, print_row, time_func
+
+# Optional reference imports
+try:
+    from mlxtend.feature_selection import SequentialFeatureSelector as SFS
+except ImportError:  # pragma: no cover
+    SFS = None
+
+
+# %% BENCHMARK
+# Reference implementation using mlxtend
+def sfs_select(sam_set, mod_sets, n_cross_val):
+    sfs_obj = SFS(LR(), k_features='parsimonious', forward=False,
+                  floating=False, scoring='r2', cv=n_cross_val)
+    return([sorted(sfs_obj.fit(sam_set, mod_set).k_feature_idx_)
+            for mod_set in mod_sets.T])
+
+
+if(__name__ == '__main__'):
+    print_row('n_par', 'n_data', 'mlxtend (s)', 'native (s)', 'speed-up',
+              'n_diff')
+    for n_gaussians, n_data in ((1, 10), (2, 10), (3, 10), (3, 50)):
+        pipe = get_pipeline(n_gaussians, n_data, construct=False)
+        modellink = pipe._modellink
+
+        # Obtain a sample set and the model outputs of all data points
+        np.random.seed(0)
+        sam_set = modellink._to_par_space(
+            np.random.rand(300, modellink._n_par))
+        mod_sets = np.array([modellink.call_model(
+            1, dict(zip(modellink._par_name, par_set)),
+            modellink._data_idx) for par_set in sam_set])
+
+        # Time the native selection method
+        t_nat, idx_nat = time_func(select_backward, sam_set, mod_sets, 5)
+
+        # Time the reference selection method if it is available
+        if SFS is None:
+            print_row(modellink._n_par, n_data, '-', '%.4g' % (t_nat), '-',
+                      '-')
+            continue
+        t_sfs, idx_sfs = time_func(sfs_select, sam_set, mod_sets, 5,
+                                   n_repeat=1)
+
+        print_row(modellink._n_par, n_data, '%.4g' % (t_sfs), '%.4g' % (t_nat),
+                  '%.1f' % (t_sfs/t_nat),
+                  sum(a != b for a, b in zip(idx_sfs, idx_nat)))
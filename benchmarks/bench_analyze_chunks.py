@@ -0,0 +1,45 @@
+# -*- coding: utf-8 -*-
+
+"""
+Benchmark: streamed analysis
+============================
+Compares the time and peak amount of memory spent on analyzing an emulator
+iteration for different numbers of emulator evaluation samples and different
+chunk sizes (see :attr:`~prism.Pipeline.analyze_chunk_size`).
+When the evaluation sample set is streamed, the peak amount of memory should
+not depend on the total number of emulator evaluation samples.
+
+"""
+
+
+# %% IMPORTS
+# Built-in imports
+from contextlib import redirect_stdout
+from io import StringIO
+import tracemalloc
+
+# Benchmark imports
+from common import get_pipeline, print_row, time_func
+
+
+# %% BENCHMARK
+# This function analyzes the first iteration and measures its peak memory
+def analyze(pipe):
+    tracemalloc.start()
+    with redirect_stdout(StringIO()):
+        pipe.analyze()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return(peak, pipe._n_impl_sam[1])
+
+
+if(__name__ == '__main__'):
+    print_row('n_eval_sam', 'chunk_size', 'analyze (s)', 'peak (MiB)',
+              'n_impl_sam')
+    for base_eval_sam in (500, 1000):
+        for chunk_size in (0, 500, 250):
+            pipe = get_pipeline(1, 8, base_eval_sam=base_eval_sam,
+                                analyze_chunk_size=chunk_size)
+            t, (peak, n_impl_sam) = time_func(analyze, pipe, n_repeat=1)
+            print_row(pipe._get_n_eval_sam(1), chunk_size, '%.4g' % (t),
+                      '%.4g' % (peak/2**20), n_impl_sam)
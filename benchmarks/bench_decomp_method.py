@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+
+"""
+Benchmark: covariance matrix decomposition methods
+==================================================
+Compares the 'pinv' and 'cholesky' values of the `decomp_method` *PRISM*
+parameter in terms of decomposition time, evaluation rate and the number of
+bytes that are stored per emulator system.
+
+"""
+
+
+# %% IMPORTS
+# Package imports
+from e13tools.sampling import lhd
+
+# Benchmark imports
+from common import get_pipeline, print_row, time_func
+
+
+# %% BENCHMARK
+def bench_evaluate(emulator, emul_i, sam_set):
+    batch_size = emulator._get_batch_size(emul_i)
+    return([emulator._evaluate_batch(emul_i, sam_set[i:i+batch_size])
+            for i in range(0, sam_set.shape[0], batch_size)])
+
+
+if(__name__ == '__main__'):
+    print_row('n_sam_init', 'decomp_method', 'decomp (s)', 'eval (eval/s)',
+              'stored (MiB)')
+    for n_sam_init in (250, 500, 1000):
+        for decomp_method in ('pinv', 'cholesky'):
+            pipe = get_pipeline(n_sam_init=n_sam_init,
+                                decomp_method=repr(decomp_method))
+            emulator = pipe._emulator
+            modellink = pipe._modellink
+            emul_s_seq = emulator._active_emul_s[1]
+
+            # Time the decomposition of the first covariance matrix
+            cov_mat = emulator._get_cov(1, emul_s_seq[:1], None, None)[0]
+            if(decomp_method == 'pinv'):
+                t_decomp, _ = time_func(emulator._get_inv_matrix, cov_mat)
+                n_bytes = 2*cov_mat.nbytes
+            else:
+                t_decomp, _ = time_func(emulator._get_chol_matrix, cov_mat)
+                n_bytes = cov_mat.nbytes
+
+            # Time the evaluation of the emulator
+            n_eval = 2000
+            sam_set = lhd(n_eval, modellink._n_par, modellink._par_rng)
+            t_eval, _ = time_func(bench_evaluate, emulator, 1, sam_set)
+
+            print_row(n_sam_init, decomp_method, '%.4g' % (t_decomp),
+                      '%.4g' % (n_eval/t_eval), '%.3g' % (n_bytes/2**20))
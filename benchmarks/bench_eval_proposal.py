@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+
+"""
+Benchmark: evaluation proposal regions
+======================================
+Compares the time spent on analyzing the second emulator iteration when the
+emulator evaluation sample set is created in different proposal regions (see
+:attr:`~prism.Pipeline.eval_proposal`), together with the fraction of
+evaluation samples that are plausible and the estimated percentage of
+parameter space that remains plausible.
+With a proposal region, far more of the evaluation samples are plausible,
+while the estimated percentage of parameter space should remain the same.
+
+"""
+
+
+# %% IMPORTS
+# Built-in imports
+from contextlib import redirect_stdout
+from io import StringIO
+
+# Package imports
+import numpy as np
+
+# Benchmark imports
+from common import get_pipeline, print_row, time_func
+
+
+# %% BENCHMARK
+# This function analyzes the second iteration
+def analyze(pipe):
+    # Use the same random state for every proposal region
+    np.random.seed(1)
+    with redirect_stdout(StringIO()):
+        pipe.analyze()
+    return(pipe._n_impl_sam[2], pipe._n_eval_sam[2], pipe._par_space_rem[2])
+
+
+if(__name__ == '__main__'):
+    print_row('eval_proposal', 'analyze (s)', 'n_impl_sam', 'plausible (%)',
+              'par_space (%)')
+    for eval_proposal in ('full', 'box', 'ellipsoid', 'kdtree'):
+        # Construct the first two iterations
+        pipe = get_pipeline(2, 5, construct=False, eval_proposal=eval_proposal)
+        with redirect_stdout(StringIO()):
+            pipe.construct(1)
+            pipe.construct(2, analyze=False)
+
+        # Time the analysis of the second iteration
+        t, (n_impl_sam, n_eval_sam, par_space_rem) = time_func(
+            analyze, pipe, n_repeat=1)
+        print_row(eval_proposal, '%.4g' % (t), n_impl_sam,
+                  '%.3g' % (n_impl_sam/n_eval_sam*100),
+                  '%.3g' % (par_space_rem*100))
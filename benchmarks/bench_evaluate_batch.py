@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+
+"""
+Benchmark: batched emulator evaluations
+=======================================
+Compares the emulator evaluation rate of evaluating samples one-by-one with
+:meth:`~prism.emulator.Emulator._evaluate` against evaluating them in batches
+with :meth:`~prism.emulator.Emulator._evaluate_batch`.
+
+"""
+
+
+# %% IMPORTS
+# Package imports
+from e13tools.sampling import lhd
+
+# Benchmark imports
+from common import get_pipeline, print_row, time_func
+
+
+# %% BENCHMARK
+def bench_single(emulator, emul_i, sam_set):
+    return([emulator._evaluate(emul_i, par_set) for par_set in sam_set])
+
+
+def bench_batch(emulator, emul_i, sam_set):
+    batch_size = emulator._get_batch_size(emul_i)
+    return([emulator._evaluate_batch(emul_i, sam_set[i:i+batch_size])
+            for i in range(0, sam_set.shape[0], batch_size)])
+
+
+if(__name__ == '__main__'):
+    print_row('n_sam_init', 'n_eval', 'single (eval/s)', 'batch (eval/s)',
+              'speed-up')
+    for n_sam_init in (100, 500, 1000):
+        pipe = get_pipeline(n_sam_init=n_sam_init)
+        emulator = pipe._emulator
+        modellink = pipe._modellink
+        n_eval = 2000
+        sam_set = lhd(n_eval, modellink._n_par, modellink._par_rng)
+        t_single, _ = time_func(bench_single, emulator, 1, sam_set)
+        t_batch, _ = time_func(bench_batch, emulator, 1, sam_set)
+        print_row(n_sam_init, n_eval, '%.4g' % (n_eval/t_single),
+                  '%.4g' % (n_eval/t_batch), '%.2fx' % (t_single/t_batch))
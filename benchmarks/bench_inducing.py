@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+
+"""
+Benchmark: inducing-point approximation
+=======================================
+Compares the exact Gaussian covariances with the inducing-point approximation
+that is enabled by the `n_inducing` *PRISM* parameter, in terms of evaluation
+rate and the deviation of the adjusted expectation and variance values from
+the exact ones.
+
+"""
+
+
+# %% IMPORTS
+# Package imports
+from e13tools.sampling import lhd
+import numpy as np
+
+# Benchmark imports
+from common import get_pipeline, print_row, time_func
+
+
+# %% BENCHMARK
+def bench_evaluate(emulator, emul_i, sam_set):
+    batch_size = emulator._get_batch_size(emul_i)
+    adj_vals = [emulator._evaluate_batch(emul_i, sam_set[i:i+batch_size])
+                for i in range(0, sam_set.shape[0], batch_size)]
+    return(np.concatenate([adj_val[0] for adj_val in adj_vals]),
+           np.concatenate([adj_val[1] for adj_val in adj_vals]))
+
+
+if(__name__ == '__main__'):
+    print_row('n_sam_init', 'n_inducing', 'eval (eval/s)', 'max |d_exp|',
+              'var ratio')
+    for n_sam_init in (1000, 2000):
+        # Use the same evaluation samples for all values of n_inducing
+        np.random.seed(1)
+        n_eval = 2000
+        sam_set = None
+
+        for n_inducing in (0, 100, 250, 500):
+            pipe = get_pipeline(n_sam_init=n_sam_init, n_inducing=n_inducing)
+            emulator = pipe._emulator
+            modellink = pipe._modellink
+            if sam_set is None:
+                sam_set = lhd(n_eval, modellink._n_par, modellink._par_rng)
+
+            # Time the evaluation of the emulator
+            t_eval, (adj_exp, adj_var) = time_func(bench_evaluate, emulator,
+                                                   1, sam_set)
+
+            # Compare the results with those of the exact method
+            if not n_inducing:
+                exact_exp, exact_var = adj_exp, adj_var
+            d_exp = np.max(np.abs(adj_exp-exact_exp))
+            var_ratio = np.mean(adj_var)/np.mean(exact_var)
+
+            print_row(n_sam_init, n_inducing, '%.4g' % (n_eval/t_eval),
+                      '%.3g' % (d_exp), '%.3g' % (var_ratio))
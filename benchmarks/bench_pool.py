@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+
+"""
+Benchmark: worker pools
+=======================
+Compares the time spent on constructing an emulator iteration on a single MPI
+rank for different numbers and types of pool workers (see
+:attr:`~prism.Pipeline.n_pool_workers` and :attr:`~prism.Pipeline.pool_type`).
+The speed-up that can be obtained depends on the number of available cores.
+
+"""
+
+
+# %% IMPORTS
+# Built-in imports
+from contextlib import redirect_stdout
+from io import StringIO
+from os import cpu_count
+
+# Package imports
+import numpy as np
+
+# Benchmark imports
+from common import get_pipeline, print_row, time_func
+
+
+# %% BENCHMARK
+# This function constructs the first iteration of a new emulator
+def construct(n_pool_workers, pool_type):
+    pipe = get_pipeline(3, 32, construct=False, n_sam_init=500,
+                        n_pool_workers=n_pool_workers, pool_type=pool_type)
+    with redirect_stdout(StringIO()):
+        pipe.construct(1, analyze=False)
+    emul = pipe._emulator
+    return([emul._poly_coef[1][emul_s] for emul_s in emul._active_emul_s[1]])
+
+
+if(__name__ == '__main__'):
+    print("Number of available cores: %i" % (cpu_count()))
+    print_row('pool_type', 'n_workers', 'construct (s)', 'speed-up',
+              'max |d_coef|')
+    t_ref, coef_ref = time_func(construct, 1, 'thread', n_repeat=1)
+    print_row('-', 1, '%.4g' % (t_ref), '1', '0')
+    for pool_type in ('thread', 'process'):
+        for n_pool_workers in (2, 4, 8):
+            t, coef = time_func(construct, n_pool_workers, pool_type,
+                                n_repeat=1)
+            d_coef = max([np.max(np.abs(a-b)) for a, b in
+                          zip(coef, coef_ref)])
+            print_row(pool_type, n_pool_workers, '%.4g' % (t),
+                      '%.2f' % (t_ref/t), '%.3g' % (d_coef))
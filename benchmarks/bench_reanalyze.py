@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+
+"""
+Benchmark: reanalysis
+=====================
+Compares the time spent on reanalyzing an emulator iteration with different
+implausibility cut-off values, either by evaluating the emulator for a new
+emulator evaluation sample set or by reusing the univariate implausibility
+values that were saved during the previous analysis (see
+:attr:`~prism.Pipeline.n_saved_impl_vals`).
+
+"""
+
+
+# %% IMPORTS
+# Built-in imports
+from contextlib import redirect_stdout
+from io import StringIO
+
+# Benchmark imports
+from common import get_pipeline, print_row, time_func
+
+
+# %% GLOBALS
+IMPL_CUTS = ([4.0, 3.8, 3.5], [3.0, 2.8, 2.5], [2.0, 1.8, 1.5])
+
+
+# %% BENCHMARK
+# This function reanalyzes the first iteration with the given impl_cut
+def reanalyze(pipe, impl_cut, reuse_impl_vals):
+    with redirect_stdout(StringIO()):
+        pipe.analyze(impl_cut=impl_cut, reuse_impl_vals=reuse_impl_vals)
+    return(pipe._n_impl_sam[1])
+
+
+if(__name__ == '__main__'):
+    print_row('n_eval_sam', 'impl_cut', 'analyze (s)', 'reuse (s)',
+              'n_impl_sam')
+    for base_eval_sam in (500, 1000, 2000):
+        # Analyze the first iteration once to save the impl_vals
+        pipe = get_pipeline(1, 8, base_eval_sam=base_eval_sam,
+                            n_saved_impl_vals=8)
+        reanalyze(pipe, IMPL_CUTS[0], False)
+
+        # Time both ways of reanalyzing with every impl_cut
+        for impl_cut in IMPL_CUTS:
+            t_reuse, n_impl_sam = time_func(reanalyze, pipe, impl_cut, True)
+            t_anal, _ = time_func(reanalyze, pipe, impl_cut, False,
+                                  n_repeat=1)
+            print_row(pipe._n_eval_sam[1], impl_cut[0], '%.4g' % (t_anal),
+                      '%.4g' % (t_reuse), n_impl_sam)
@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+
+"""
+Benchmark: regression covariances
+=================================
+Compares the evaluation time of the regression covariances (used when the
+`use_regr_cov` *PRISM* parameter is *True*) between the quadratic form that is
+used by :meth:`~prism.emulator.Emulator._get_regr_cov` and the reference
+Kronecker product formulation it replaced.
+
+"""
+
+
+# %% IMPORTS
+# Package imports
+from e13tools.sampling import lhd
+import numpy as np
+from sklearn.preprocessing import PolynomialFeatures as PF
+
+# Benchmark imports
+from common import get_pipeline, print_row, time_func
+
+
+# %% BENCHMARK
+# Reference implementation using Kronecker products
+def kron_regr_cov(emulator, emul_i, emul_s_seq, par_set):
+    regr_cov = np.zeros([len(emul_s_seq), emulator._n_sam[emul_i]])
+    for i, emul_s in enumerate(emul_s_seq):
+        active_par = emulator._active_par_data[emul_i][emul_s]
+        poly_terms1 = np.product(pow(par_set[active_par],
+                                     emulator._poly_powers[emul_i][emul_s]),
+                                 axis=-1)
+        poly_terms2 = PF(emulator._poly_order).fit_transform(
+            emulator._sam_set[emul_i][:, active_par])[
+                :, emulator._poly_idx[emul_i][emul_s]]
+        prod_terms = np.kron(poly_terms1, poly_terms2)
+        regr_cov[i] = np.sum(
+            emulator._poly_coef_cov[emul_i][emul_s].flatten()*prod_terms,
+            axis=-1)
+    return(regr_cov)
+
+
+def bench_kron(emulator, emul_i, sam_set):
+    emul_s_seq = emulator._active_emul_s[emul_i]
+    return([kron_regr_cov(emulator, emul_i, emul_s_seq, par_set)
+            for par_set in sam_set])
+
+
+def bench_quad(emulator, emul_i, sam_set):
+    emul_s_seq = emulator._active_emul_s[emul_i]
+    return([emulator._get_regr_cov(emul_i, emul_s_seq, par_set, None)
+            for par_set in sam_set])
+
+
+if(__name__ == '__main__'):
+    print_row('n_sam_init', 'n_eval', 'kron (s)', 'quad form (s)',
+              'batch eval (s)', 'max rel diff')
+    for n_sam_init in (100, 300, 1000):
+        pipe = get_pipeline(n_sam_init=n_sam_init, use_regr_cov='True')
+        emulator = pipe._emulator
+        modellink = pipe._modellink
+        n_eval = 200
+        sam_set = lhd(n_eval, modellink._n_par, modellink._par_rng)
+        t_kron, res_kron = time_func(bench_kron, emulator, 1, sam_set)
+        t_quad, res_quad = time_func(bench_quad, emulator, 1, sam_set)
+        t_batch, _ = time_func(emulator._evaluate_batch, 1, sam_set)
+        res_kron = np.array(res_kron)
+        diff = np.max(np.abs(np.array(res_quad)-res_kron) /
+                      np.max(np.abs(res_kron)))
+        print_row(n_sam_init, n_eval, '%.4g' % (t_kron), '%.4g' % (t_quad),
+                  '%.4g' % (t_batch), '%.3g' % (diff))
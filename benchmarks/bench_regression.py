@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+
+"""
+Benchmark: forward stepwise regression
+======================================
+Compares the time spent on selecting the polynomial terms of the regression
+process between the native forward selection that is used by
+:meth:`~prism.emulator.Emulator._do_regression` and the reference `mlxtend`
+sequential feature selector it replaced, for an increasing number of active
+model parameters. The number of differently selected terms is reported as
+well. The reference is skipped if `mlxtend` is not installed.
+
+"""
+
+
+# %% IMPORTS
+# Package imports
+import numpy as np
+from sklearn.linear_model import LinearRegression as LR
+from sklearn.preprocessing import PolynomialFeatures as PF
+
+# PRISM imports
+from prism.emulator._selection import select_forward
+
+# Benchmark imports
+from common import get_pipeline, print_row, time_func
+
+
+# Optional reference imports
+try:
+    from mlxtend.feature_selection import SequentialFeatureSelector as SFS
+except ImportError:  # pragma: no cover
+    SFS = None
+
+
+# %% BENCHMARK
+# Reference implementation using mlxtend
+def sfs_select(sam_set_poly, mod_set, n_cross_val):
+    sfs_obj = SFS(LR(), k_features='best', forward=True, floating=False,
+                  scoring='neg_mean_squared_error', cv=n_cross_val)
+    sfs_obj.fit(sam_set_poly, mod_set)
+    return(sorted(sfs_obj.k_feature_idx_))
+
+
+if(__name__ == '__main__'):
+    print_row('n_par', 'n_terms', 'mlxtend (s)', 'native (s)', 'speed-up',
+              'n_diff')
+    for n_gaussians in (1, 2, 3):
+        pipe = get_pipeline(n_gaussians, n_sam_init=300, construct=False)
+        modellink = pipe._modellink
+
+        # Obtain the polynomial terms of a sample set and the model outputs
+        np.random.seed(0)
+        sam_set = modellink._to_par_space(
+            np.random.rand(300, modellink._n_par))
+        sam_set_poly = PF(3, include_bias=False).fit_transform(sam_set)
+        mod_set = np.array([modellink.call_model(
+            1, dict(zip(modellink._par_name, par_set)),
+            modellink._data_idx)[0] for par_set in sam_set])
+
+        # Time the native selection method
+        t_nat, idx_nat = time_func(select_forward, sam_set_poly, mod_set, 5)
+
+        # Time the reference selection method if it is available
+        if SFS is None:
+            print_row(modellink._n_par, sam_set_poly.shape[1], '-',
+                      '%.4g' % (t_nat), '-', '-')
+            continue
+        t_sfs, idx_sfs = time_func(sfs_select, sam_set_poly, mod_set, 5,
+                                   n_repeat=1)
+
+        print_row(modellink._n_par, sam_set_poly.shape[1], '%.4g' % (t_sfs),
+                  '%.4g' % (t_nat), '%.1f' % (t_sfs/t_nat),
+                  len(set(idx_sfs) ^ set(idx_nat)))
@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+
+"""
+Benchmark: samplers
+===================
+Compares the time spent on creating emulator evaluation sample sets of
+different sizes with all built-in samplers (see
+:attr:`~prism.Pipeline.eval_sampler`), and the smallest distance between any
+two samples in the unit hypercube, which is the quantity the maximin criterion
+maximizes.
+The :func:`~e13tools.sampling.lhd` sampler is only used for the smallest
+sample sets, as it requires quadratic time and memory.
+
+"""
+
+
+# %% IMPORTS
+# Package imports
+import numpy as np
+from scipy.spatial import cKDTree
+
+# PRISM imports
+from prism._sampling import SAMPLERS, get_sam_set
+
+# Benchmark imports
+from common import print_row, time_func
+
+
+# %% GLOBALS
+N_PAR = 5                                   # Number of model parameters
+PAR_RNG = np.array([[0, 1]]*N_PAR)          # Parameter ranges
+MAX_LHD_SAM = 10**3                         # Max number of samples for 'lhd'
+MAX_DIST_SAM = 10**6                        # Max number of samples for dist
+
+
+# %% BENCHMARK
+# This function creates an emulator evaluation sample set
+def sample(sampler, n_sam):
+    np.random.seed(0)
+    return(get_sam_set(sampler, n_sam, PAR_RNG, method='center',
+                       criterion='maximin', iterations=100))
+
+
+if(__name__ == '__main__'):
+    print_row('n_eval_sam', 'sampler', 'time (s)', 'min dist')
+    for n_sam in (10**3, 10**4, 10**5, 10**6, 10**7):
+        for sampler in SAMPLERS:
+            # Skip the quadratic sampler for large sample sets
+            if(sampler == 'lhd' and n_sam > MAX_LHD_SAM):
+                print_row(n_sam, sampler, '-', '-')
+                continue
+
+            # Time the sampler
+            t, sam_set = time_func(sample, sampler, n_sam, n_repeat=1)
+
+            # Determine the smallest distance between two samples
+            if(n_sam <= MAX_DIST_SAM):
+                min_dist = cKDTree(sam_set).query(
+                    sam_set, k=2, workers=-1)[0][:, 1].min()
+                min_dist = '%.3g' % (min_dist)
+            else:
+                min_dist = '-'
+            print_row(n_sam, sampler, '%.4g' % (t), min_dist)
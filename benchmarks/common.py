@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+
+"""
+Benchmark utilities
+===================
+Provides helper functions that are shared by all *PRISM* benchmark scripts in
+this directory. The benchmarks are not part of the test suite and can be ran
+directly, e.g.::
+
+    python benchmarks/bench_evaluate_batch.py
+
+"""
+
+
+# %% IMPORTS
+# Built-in imports
+from contextlib import redirect_stdout
+from io import StringIO
+import logging
+from os import path
+from tempfile import mkdtemp
+from time import time
+
+# Package imports
+import numpy as np
+
+# PRISM imports
+from prism import Pipeline
+from prism.modellink import GaussianLink
+
+# All declaration
+__all__ = ['get_pipeline', 'print_row', 'time_func']
+
+
+# %% FUNCTION DEFINITIONS
+# This function creates and constructs a Pipeline for benchmarking
+def get_pipeline(n_gaussians=1, n_data=5, *, emul_i=1, construct=True,
+                 **prism_par):
+    """
+    Returns a :obj:`~prism.Pipeline` object using a
+    :class:`~prism.modellink.GaussianLink` model with `n_gaussians` Gaussians
+    and `n_data` data points, working in a new temporary directory. If
+    `construct` is *True*, the emulator is constructed up to iteration
+    `emul_i`.
+
+    All provided `prism_par` are used as *PRISM* parameters.
+
+    """
+
+    # Make sure that logging is not slowing down the benchmarks
+    logging.disable(logging.INFO)
+
+    # Set the random seed to make benchmarks reproducible
+    np.random.seed(0)
+
+    # Create temporary working directory
+    tmpdir = mkdtemp(prefix='prism_bench_')
+
+    # Create the model data using the model at its parameter estimates
+    modellink_obj = GaussianLink(n_gaussians, model_data={0: [1, 0.05]})
+    data_idx = list(np.linspace(1, 9, n_data))
+    data_val = modellink_obj.call_model(
+        0, dict(zip(modellink_obj._par_name, modellink_obj._par_est)),
+        data_idx)
+    model_data = {idx: [val, 0.05] for idx, val in zip(data_idx, data_val)}
+    modellink_obj = GaussianLink(n_gaussians, model_data=model_data)
+
+    # Initialize Pipeline
+    pipe = Pipeline(modellink_obj, root_dir=path.dirname(tmpdir),
+                    working_dir=path.basename(tmpdir), prism_par=prism_par)
+
+    # Construct the emulator if requested
+    if construct:
+        with redirect_stdout(StringIO()):
+            pipe.construct(emul_i, analyze=False)
+
+    # Return it
+    return(pipe)
+
+
+# This function times a function call
+def time_func(func, *args, n_repeat=3, **kwargs):
+    """
+    Calls `func` with provided `args` and `kwargs` `n_repeat` times and
+    returns the fastest time in seconds and the result of the last call.
+
+    """
+
+    # Create list of times
+    times = []
+
+    # Call func n_repeat times
+    for _ in range(n_repeat):
+        start_time = time()
+        result = func(*args, **kwargs)
+        times.append(time()-start_time)
+
+    # Return the fastest time and the result
+    return(min(times), result)
+
+
+# This function prints a row of a benchmark table
+def print_row(*values, width=16):
+    """
+    Prints all provided `values` as a single row of a benchmark table, using
+    a column width of `width`.
+
+    """
+
+    print("".join(["{0: <{1}}".format(value, width) for value in values]))
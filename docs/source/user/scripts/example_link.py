@@ -17,7 +17,7 @@ class ExampleLink(ModelLink):
         # Perform any custom operations here
         pass
 
-        # Set ModelLink flags (name, call_type, MPI_call)
+        # Set ModelLink flags (name, call_type, MPI_call, parallel_call)
         pass
 
         # Call superclass constructor
@@ -432,10 +432,11 @@ save_data_doc =\
         ---------
         The specified data is saved to the HDF5-file."""
 save_data_doc_p = save_data_doc.format(
-    "", "{'impl_par'; 'impl_sam'; 'n_eval_sam'}")
+    "", "{'impl_par'; 'impl_sam'; 'impl_sam_chunk'; 'impl_vals'; "
+    "'impl_vals_chunk'; 'n_eval_sam'; 'par_space_rem'}")
 save_data_doc_e = save_data_doc.format(
     std_emul_i_doc+"\n\t"+lemul_s_doc+"\n\t", "{'active_par'; "
-    "'active_par_data'; 'cov_mat'; 'exp_dot_term'; 'mod_real_set'; "
-    "'regression'}")
+    "'active_par_data'; 'cov_mat'; 'eval_cost'; 'exp_dot_term'; "
+    "'mod_real_set'; 'regression'; 'reject_power'}")
 save_data_doc_pr = save_data_doc.format(std_emul_i_doc+"\n\t",
                                         "{'nD_proj_hcube'}")
@@ -10,6 +10,8 @@ Contains a collection of support classes/functions for the *PRISM* package.
 
 # %% IMPORTS
 # Built-in imports
+from contextlib import contextmanager
+from functools import wraps
 import logging
 import logging.config
 import os
@@ -36,7 +38,7 @@ __all__ = ['CFilter', 'FeatureWarning', 'PRISM_Logger', 'RFilter',
            'RequestError', 'RequestWarning', 'check_compatibility',
            'check_vals', 'get_bibtex', 'get_PRISM_File', 'get_formatter',
            'get_handler', 'get_info', 'getCLogger', 'getLogger', 'getRLogger',
-           'move_logger', 'np_array', 'set_base_logger']
+           'move_logger', 'np_array', 'pool_hdf5_files', 'set_base_logger']
 
 # Determine MPI size and ranks
 size = MPI.COMM_WORLD.Get_size()
@@ -466,7 +468,9 @@ def get_PRISM_File(prism_hdf5_file):
 
     This class definition is a specialized version of the :class:`~h5py.File`
     class with the filename automatically set to `prism_hdf5_file` and added
-    logging to the constructor and destructor methods.
+    logging to the constructor and destructor methods. Within its
+    :meth:`~PRISM_File.pool` context manager, opened HDF5-files are kept open
+    and reused.
 
     Parameters
     ----------
@@ -492,6 +496,35 @@ def get_PRISM_File(prism_hdf5_file):
 
         """
 
+        # Dict of all HDF5-files that are kept open while pooling
+        _pool = {}
+
+        # Number of active pool context managers
+        _pool_depth = 0
+
+        # Override __new__() to reuse pooled HDF5-files
+        def __new__(cls, mode, emul_s=None, **kwargs):
+            # Check if this HDF5-file is currently pooled
+            file = cls._pool.pop(emul_s, None)
+
+            # If so, check if it can be reused
+            if file is not None:
+                # Reuse if pooling and requested mode is compatible
+                if(cls._pool_depth and not kwargs and file.id.valid and
+                   (mode == 'r' or (mode == 'r+' and file.mode == 'r+'))):
+                    cls._pool[emul_s] = file
+                    file._reused = True
+                    return(file)
+
+                # Else, close it
+                else:
+                    file._close_pooled()
+
+            # Create a new PRISM_File instance
+            file = super().__new__(cls)
+            file._reused = False
+            return(file)
+
         # Override __init__() to include default settings and logging
         def __init__(self, mode, emul_s=None, **kwargs):
             """
@@ -515,6 +548,10 @@ def get_PRISM_File(prism_hdf5_file):
 
             """
 
+            # If this HDF5-file is reused from the pool, it is already open
+            if self._reused:
+                return
+
             # Save emul_s as a property
             self.emul_s = emul_s
 
@@ -548,8 +585,18 @@ def get_PRISM_File(prism_hdf5_file):
             # Inheriting File __init__()
             super().__init__(filename, mode, **hdf5_kwargs)
 
+            # If pooling, add this HDF5-file to the pool
+            if(self._pool_depth and mode in ('r', 'r+') and not kwargs):
+                self._pool[self.emul_s] = self
+
         # Override __exit__() to include logging
         def __exit__(self, *args):
+            # If this HDF5-file is pooled, only flush it
+            if(self._pool.get(self.emul_s) is self):
+                if(self.mode == 'r+'):
+                    self.flush()
+                return
+
             # Log that an HDF5-file will be closed
             if self.emul_s is None:
                 logger = getCLogger('M-HDF5')
@@ -561,6 +608,49 @@ def get_PRISM_File(prism_hdf5_file):
             # Inheriting File __exit__()
             super().__exit__(*args)
 
+        # This function closes a pooled HDF5-file
+        def _close_pooled(self):
+            """
+            Closes this HDF5-file after it was removed from the pool, if it is
+            still open.
+
+            """
+
+            # Close this HDF5-file with logging if it is still open
+            if self.id.valid:
+                self.__exit__()
+
+        # This function keeps HDF5-files open during a specific phase
+        @classmethod
+        @contextmanager
+        def pool(cls):
+            """
+            Special context manager within which all HDF5-files that are opened
+            in modes 'r' or 'r+' are kept open, and are reused whenever they
+            are opened again in a compatible mode. A pooled HDF5-file is
+            flushed instead of closed when its own context manager exits, and
+            all pooled HDF5-files are closed when the outermost pool context
+            manager exits.
+
+            As every MPI rank has its own pool, this context manager can be
+            used while in :attr:`~prism.Pipeline.worker_mode`.
+
+            """
+
+            # Increase the pooling depth
+            cls._pool_depth += 1
+
+            # Yield control
+            try:
+                yield
+
+            # Decrease the pooling depth and close all files if it reaches 0
+            finally:
+                cls._pool_depth -= 1
+                if not cls._pool_depth:
+                    while cls._pool:
+                        cls._pool.popitem()[1]._close_pooled()
+
     # Return PRISM_File class definition
     return(PRISM_File)
 
@@ -818,6 +908,26 @@ def np_array(obj, *args, **kwargs):
     return(np.array(obj, *args, copy=copy, **kwargs))
 
 
+# This function makes a decorator that pools HDF5-files during a method call
+def pool_hdf5_files(method):
+    """
+    Decorator that keeps all HDF5-files open during a call to the provided
+    `method` of a :obj:`~prism.Pipeline` or :obj:`~prism.emulator.Emulator`
+    instance, by using the :meth:`~PRISM_File.pool` context manager of its
+    :func:`~get_PRISM_File` class.
+
+    """
+
+    # Define wrapper function that uses the pool context manager
+    @wraps(method)
+    def pooled_method(self, *args, **kwargs):
+        with self._File.pool():
+            return(method(self, *args, **kwargs))
+
+    # Return the wrapper function
+    return(pooled_method)
+
+
 # This function sets the base PRISM logger
 # TODO: Make base logger unique to Pipeline instance
 # This requires a lot of rewriting and many functions to be moved to Pipeline
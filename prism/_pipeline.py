@@ -12,8 +12,11 @@ Provides the definition of the main class of the *PRISM* package, the
 # %% IMPORTS
 # Built-in imports
 from ast import literal_eval
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from hashlib import sha1
 from inspect import isclass
 import logging
+import multiprocessing
 import os
 from os import path
 import sys
@@ -27,6 +30,7 @@ from e13tools.sampling import lhd
 from e13tools.utils import (
     delist, docstring_append, docstring_copy, docstring_substitute,
     get_outer_frame, raise_error, raise_warning, split_seq)
+import h5py
 from mpi4pyd import MPI
 from mpi4pyd.MPI import get_HybridComm_obj
 import numpy as np
@@ -42,8 +46,10 @@ from prism._docstrings import (
     save_data_doc_p, set_par_doc, std_emul_i_doc, user_emul_i_doc)
 from prism._internal import (
     RequestError, RequestWarning, check_vals, getCLogger, get_PRISM_File,
-    getRLogger, move_logger, np_array, set_base_logger)
+    getRLogger, move_logger, np_array, pool_hdf5_files, set_base_logger)
 from prism._projection import Projection
+from prism._sampling import (check_proposal, check_sampler, get_proposal,
+                             get_sam_set, get_sam_set_slice)
 from prism.emulator import Emulator
 
 # All declaration
@@ -506,6 +512,76 @@ class Pipeline(Projection, object):
             else:
                 self._criterion = criterion
 
+    @property
+    def init_sampler(self):
+        """
+        str or callable: The sampler that is used for creating the initial set
+        of model evaluation samples when constructing the first emulator
+        iteration. This is either one of the built-in samplers 'lhd',
+        'lhd_kdtree', 'sobol', 'halton' or 'random', or a custom sampler
+        function ``sampler(n_sam, val_rng, *, method, criterion, iterations,
+        constraints)`` that returns `n_sam` samples within `val_rng`.
+
+        """
+
+        return(self._init_sampler)
+
+    @init_sampler.setter
+    def init_sampler(self, init_sampler):
+        self._init_sampler = check_sampler(init_sampler, 'init_sampler')
+
+    @property
+    def eval_sampler(self):
+        """
+        str or callable: The sampler that is used for creating the emulator
+        evaluation sample sets when analyzing an emulator iteration. Takes the
+        same values as :attr:`~init_sampler`.
+
+        """
+
+        return(self._eval_sampler)
+
+    @eval_sampler.setter
+    def eval_sampler(self, eval_sampler):
+        self._eval_sampler = check_sampler(eval_sampler, 'eval_sampler')
+
+    @property
+    def eval_proposal(self):
+        """
+        str: The proposal region that emulator evaluation sample sets are
+        created in when analyzing an emulator iteration after the first.
+        If 'full', the entire parameter space is used. Otherwise, the region
+        is built around the plausible samples of the previous emulator
+        iteration, and is either their padded bounding box ('box'), their
+        enlarged bounding ellipsoid ('ellipsoid') or a mixture of boxes
+        around every plausible sample ('kdtree'). The importance weights of
+        the samples are used to determine the fraction of parameter space
+        that remains plausible, which assumes that the region covers all
+        plausible parts of parameter space.
+
+        """
+
+        return(self._eval_proposal)
+
+    @eval_proposal.setter
+    def eval_proposal(self, eval_proposal):
+        self._eval_proposal = check_proposal(eval_proposal, 'eval_proposal')
+
+    @property
+    def proj_sampler(self):
+        """
+        str or callable: The sampler that is used for creating the values of
+        the hidden parameters in projection hypercubes. Takes the same values
+        as :attr:`~init_sampler`.
+
+        """
+
+        return(self._proj_sampler)
+
+    @proj_sampler.setter
+    def proj_sampler(self, proj_sampler):
+        self._proj_sampler = check_sampler(proj_sampler, 'proj_sampler')
+
     @property
     def do_active_anal(self):
         """
@@ -600,6 +676,189 @@ class Pipeline(Projection, object):
         self._base_eval_sam = check_vals(base_eval_sam, 'base_eval_sam', 'int',
                                          'pos')
 
+    @property
+    def analyze_chunk_size(self):
+        """
+        int: Maximum number of emulator evaluation samples that are generated
+        and evaluated at once during an analysis. If larger than 0 and smaller
+        than :attr:`~n_eval_sam`, the evaluation sample set is streamed in
+        chunks of this size, such that the memory used by an analysis does not
+        depend on the total number of samples. If 0, all samples are evaluated
+        at once.
+
+        """
+
+        return(self._analyze_chunk_size)
+
+    @analyze_chunk_size.setter
+    def analyze_chunk_size(self, analyze_chunk_size):
+        self._analyze_chunk_size = check_vals(
+            analyze_chunk_size, 'analyze_chunk_size', 'int', 'nneg')
+
+    @property
+    def distribute_eval_sam(self):
+        """
+        bool: Whether or not every MPI rank creates and analyzes its own slice
+        of the emulator evaluation sample set during an analysis, using a seed
+        shared by all MPI ranks. Every MPI rank then evaluates its slice in
+        all emulator systems, and only the plausible samples are gathered on
+        the controller rank, such that the full sample set never exists on a
+        single MPI rank.
+
+        """
+
+        return(bool(self._distribute_eval_sam))
+
+    @distribute_eval_sam.setter
+    def distribute_eval_sam(self, distribute_eval_sam):
+        self._distribute_eval_sam = check_vals(
+            distribute_eval_sam, 'distribute_eval_sam', 'bool')
+
+    @property
+    def n_saved_impl_vals(self):
+        """
+        int: Number of highest univariate implausibility values that are saved
+        to the HDF5-file for every emulator evaluation sample that is analyzed
+        in the last emulator iteration. If larger than 0, the emulator can be
+        reanalyzed with different implausibility parameters without evaluating
+        it again (see :meth:`~analyze`). If 0, no implausibility values are
+        saved.
+
+        """
+
+        return(self._n_saved_impl_vals)
+
+    @n_saved_impl_vals.setter
+    def n_saved_impl_vals(self, n_saved_impl_vals):
+        self._n_saved_impl_vals = check_vals(
+            n_saved_impl_vals, 'n_saved_impl_vals', 'int', 'nneg')
+
+    @property
+    def n_eval_groups(self):
+        """
+        int: Number of groups the active emulator systems on every MPI rank
+        are divided in during an analysis. If larger than 1, these groups are
+        evaluated consecutively in order of decreasing rejection power, and
+        samples that are guaranteed to be implausible are not evaluated in the
+        remaining groups.
+
+        """
+
+        return(self._n_eval_groups)
+
+    @n_eval_groups.setter
+    def n_eval_groups(self, n_eval_groups):
+        self._n_eval_groups = check_vals(n_eval_groups, 'n_eval_groups', 'int',
+                                         'pos')
+
+    @property
+    def eval_dtype(self):
+        """
+        str: The floating point precision that is used for evaluating the
+        emulator, which is either 'float64' or 'float32'. The emulator is
+        always constructed in double precision, but single precision halves
+        the memory traffic of evaluations, at the cost of slightly deviating
+        implausibility values (see
+        :func:`~prism.utils.get_impl_deviation`).
+
+        """
+
+        return(self._eval_dtype)
+
+    @eval_dtype.setter
+    def eval_dtype(self, eval_dtype):
+        # Make logger
+        logger = getRLogger('CHECK')
+
+        # Check if eval_dtype is a valid precision
+        eval_dtype = check_vals(eval_dtype, 'eval_dtype', 'str').lower()
+        if eval_dtype not in ('float64', 'float32'):
+            err_msg = ("Input argument 'eval_dtype' is invalid (%r)!"
+                       % (eval_dtype))
+            raise_error(err_msg, ValueError, logger)
+        self._eval_dtype = eval_dtype
+
+    @property
+    def cov_mem_size(self):
+        """
+        float: The maximum amount of memory in MiB that the temporary arrays
+        used for calculating the covariance matrices of the emulator systems
+        can use at once on every MPI rank. This does not include the memory
+        required for a few full covariance matrices themselves, as every
+        matrix is calculated and decomposed separately.
+
+        """
+
+        return(self._cov_mem_size)
+
+    @cov_mem_size.setter
+    def cov_mem_size(self, cov_mem_size):
+        self._cov_mem_size = check_vals(cov_mem_size, 'cov_mem_size',
+                                        'float', 'pos')
+
+    @property
+    def n_pool_workers(self):
+        """
+        int: The number of workers in the pool that every MPI rank uses for
+        constructing its emulator systems concurrently. If unity, all emulator
+        systems on an MPI rank are constructed one after another. The number of
+        BLAS threads on an MPI rank is divided over these workers.
+        If only a single MPI rank is used, this is also the number of model
+        instances that are called simultaneously if
+        :attr:`~prism.modellink.ModelLink.parallel_call` is *True*.
+
+        """
+
+        return(self._n_pool_workers)
+
+    @n_pool_workers.setter
+    def n_pool_workers(self, n_pool_workers):
+        self._n_pool_workers = check_vals(n_pool_workers, 'n_pool_workers',
+                                          'int', 'pos')
+
+    @property
+    def pool_type(self):
+        """
+        str: The type of worker pool that is used if :attr:`~n_pool_workers`
+        is larger than unity, which is either 'thread' or 'process'. A thread
+        pool shares the emulator data between its workers, while a process
+        pool is not limited by Python's global interpreter lock.
+
+        """
+
+        return(self._pool_type)
+
+    @pool_type.setter
+    def pool_type(self, pool_type):
+        # Make logger
+        logger = getRLogger('CHECK')
+
+        # Check if pool_type is a valid pool type
+        pool_type = check_vals(pool_type, 'pool_type', 'str').lower()
+        if pool_type not in ('thread', 'process'):
+            err_msg = ("Input argument 'pool_type' is invalid (%r)!"
+                       % (pool_type))
+            raise_error(err_msg, ValueError, logger)
+        self._pool_type = pool_type
+
+    @property
+    def use_model_cache(self):
+        """
+        bool: Whether or not to store the outputs of all model evaluations in
+        a cache in the working directory, such that a sample that was
+        evaluated before at the same data points is not evaluated again.
+        The cache assumes that the model outputs only depend on the parameter
+        values and data identifiers.
+
+        """
+
+        return(bool(self._use_model_cache))
+
+    @use_model_cache.setter
+    def use_model_cache(self, use_model_cache):
+        self._use_model_cache = check_vals(use_model_cache, 'use_model_cache',
+                                           'bool')
+
     @property
     def impl_cut(self):
         """
@@ -747,8 +1006,6 @@ class Pipeline(Projection, object):
         return(WorkerMode.make_call_workers(self, exec_fn, *args, **kwargs))
 
     # This function evaluates the model for a given set of evaluation samples
-    # TODO: If not MPI_call, all ranks evaluate part of sam_set simultaneously?
-    # Requires check/flag that model can be evaluated in multiple instances
     # TODO: If not MPI_call, should OMP_NUM_THREADS be temporarily unset?
     # TODO: Find out how to check what the waiting mode is on an architecture
     @docstring_substitute(emul_i=std_emul_i_doc)
@@ -787,25 +1044,50 @@ class Pipeline(Projection, object):
         sam_set = np_array(sam_set, ndmin=2)
         sam_set = sort2D(sam_set, order=list(range(self._modellink._n_par)))
 
+        # If requested, obtain the outputs of all previously evaluated samples
+        if self._use_model_cache:
+            cache_mask, mod_set_cache = self._read_model_cache(sam_set,
+                                                               data_idx)
+            eval_set = sam_set[~cache_mask]
+        else:
+            eval_set = sam_set
+
+        # Check if any samples must be evaluated at all
+        if not eval_set.shape[0]:
+            mod_set = np.empty([0, len(data_idx)])
+
+        # Check if the model can be called in multiple instances
+        elif(self._modellink._parallel_call and not self._modellink._MPI_call
+             and (self._size > 1 or self._n_pool_workers > 1)):
+            mod_set = self._parallel_call_model(emul_i, eval_set, data_idx)
+
         # Check who needs to call the model
-        if self._is_controller or self._modellink._MPI_call:
+        elif self._is_controller or self._modellink._MPI_call:
             # Request all evaluation samples at once
             if self._modellink._multi_call:
-                mod_set = self._multi_call_model(emul_i, sam_set, data_idx)
+                mod_set = self._multi_call_model(emul_i, eval_set, data_idx)
 
             # Request evaluation samples one-by-one
             else:
                 # Initialize mod_set
-                mod_set = np.empty([sam_set.shape[0], self._modellink._n_data])
+                mod_set = np.empty([len(eval_set), self._modellink._n_data])
 
                 # Loop over all requested evaluation samples
-                for i, par_set in enumerate(sam_set):
+                for i, par_set in enumerate(eval_set):
                     mod_set[i] = self._call_model(emul_i, par_set, data_idx)
 
         # If workers did not call model, give them a dummy mod_set
         else:
             mod_set = []
 
+        # If requested, add the new model outputs to the cache
+        if self._use_model_cache and self._is_controller:
+            self._write_model_cache(eval_set, data_idx, mod_set)
+
+            # Combine the cached and new model outputs
+            mod_set_cache[~cache_mask] = mod_set
+            mod_set = mod_set_cache
+
         # MPI Barrier
         self._comm.Barrier()
 
@@ -824,20 +1106,14 @@ class Pipeline(Projection, object):
         logger.info("Calling model at parameters %s." % (sam))
 
         # Obtain model output
-        mod_out = self._modellink.call_model(
-            emul_i=emul_i,
-            par_set=sdict(zip(self._modellink._par_name, sam)),
-            data_idx=data_idx)
-
-        # If mod_out is a dict, convert it to a NumPy array
-        if isinstance(mod_out, dict):
-            mod_out = np_array([mod_out[idx] for idx in data_idx]).T
+        mod_out = self._get_model_output(self._modellink, emul_i, sam,
+                                         data_idx)
 
         # Log that calling model has been finished
         logger.info("Model returned %s." % (mod_out))
 
         # Return it
-        return(np_array(mod_out))
+        return(mod_out)
 
     # Function containing the model output for a given set of parameter samples
     @docstring_append(call_model_doc_m)
@@ -851,20 +1127,378 @@ class Pipeline(Projection, object):
                     % (sam_set.shape[0]))
 
         # Obtain set of model outputs
-        mod_set = self._modellink.call_model(
-            emul_i=emul_i,
-            par_set=sdict(zip(self._modellink._par_name, sam_set.T)),
-            data_idx=data_idx)
-
-        # If mod_set is a dict, convert it to a NumPy array
-        if isinstance(mod_set, dict):
-            mod_set = np_array([mod_set[idx] for idx in data_idx]).T
+        mod_set = self._get_model_output(self._modellink, emul_i, sam_set,
+                                         data_idx)
 
         # Log that multi-calling model has been finished
         logger.info("Finished model multi-call.")
 
         # Return it
-        return(np_array(mod_set))
+        return(mod_set)
+
+    # This function calls the model and returns its output as an array
+    @staticmethod
+    @docstring_substitute(emul_i=std_emul_i_doc)
+    def _get_model_output(modellink_obj, emul_i, par_set, data_idx):
+        """
+        Calls the model wrapped by `modellink_obj` at emulator iteration
+        `emul_i` for the parameter values `par_set` and returns the data
+        values corresponding to `data_idx`. This is used by all methods that
+        call the model, such that it can be executed in a different process.
+
+        Parameters
+        ----------
+        modellink_obj : :obj:`~prism.modellink.ModelLink` object
+            The instance of the :class:`~prism.modellink.ModelLink` subclass
+            that must be called.
+        %(emul_i)s
+        par_set : 1D or 2D :obj:`~numpy.ndarray` object
+            The parameter values of a single sample, or the parameter/sample
+            set if the model is multi-called.
+        data_idx : list of tuples
+            The list of data identifiers for which the model is requested to
+            return the corresponding data values.
+
+        Returns
+        -------
+        mod_out : 1D or 2D :obj:`~numpy.ndarray` object
+            Array containing the data values corresponding to the requested
+            data points, for every sample if `par_set` is 2D.
+
+        """
+
+        # Obtain model output
+        mod_out = modellink_obj.call_model(
+            emul_i=emul_i,
+            par_set=sdict(zip(modellink_obj._par_name, par_set.T)),
+            data_idx=data_idx)
+
+        # If mod_out is a dict, convert it to a NumPy array
+        if isinstance(mod_out, dict):
+            mod_out = np_array([mod_out[idx] for idx in data_idx]).T
+
+        # Return it
+        return(np_array(mod_out))
+
+    # This function returns the cache keys of samples at given data points
+    def _get_model_cache_keys(self, sam_set, data_idx):
+        """
+        Returns the keys in the model evaluation cache of all samples in
+        `sam_set` at every data point in `data_idx`. Every key is the SHA-1
+        hash of the parameter values of a sample and the representation of a
+        data identifier.
+
+        Parameters
+        ----------
+        sam_set : 2D :obj:`~numpy.ndarray` object
+            Parameter/sample set to obtain the keys for.
+        data_idx : list of tuples
+            The list of data identifiers to obtain the keys for.
+
+        Returns
+        -------
+        keys : 2D :obj:`~numpy.ndarray` object of shape ``(n_sam, n_data)``
+            Array containing the cache key of every sample and data point.
+
+        """
+
+        # Initialize empty array of keys
+        keys = np.empty([sam_set.shape[0], len(data_idx)], dtype='S40')
+
+        # Obtain the representations of all data identifiers
+        data_idx_repr = [repr(idx).encode() for idx in data_idx]
+
+        # Loop over all samples and hash them with every data identifier
+        for i, par_set in enumerate(sam_set):
+            sam_hash = sha1(np.ascontiguousarray(par_set, dtype=float))
+            for j, idx_repr in enumerate(data_idx_repr):
+                key_hash = sam_hash.copy()
+                key_hash.update(idx_repr)
+                keys[i, j] = key_hash.hexdigest()
+
+        # Return keys
+        return(keys)
+
+    # This function reads the cached model outputs of a sample set
+    def _read_model_cache(self, sam_set, data_idx):
+        """
+        Determines which samples in `sam_set` have been evaluated in the model
+        before at all data points in `data_idx`, and reads their model outputs
+        from the model evaluation cache (see :attr:`~use_model_cache`).
+
+        This method must be called by all MPI ranks simultaneously.
+
+        Parameters
+        ----------
+        sam_set : 2D :obj:`~numpy.ndarray` object
+            Parameter/sample set to look up in the cache.
+        data_idx : list of tuples
+            The list of data identifiers to look up in the cache.
+
+        Returns
+        -------
+        cache_mask : 1D :obj:`~numpy.ndarray` object
+            Bool array stating which samples are fully cached.
+        mod_set : 2D :obj:`~numpy.ndarray` object or None
+            Array containing the cached model outputs of all samples, with
+            undefined values for samples that are not fully cached. Workers
+            receive *None*.
+
+        """
+
+        # Only the controller accesses the cache
+        if self._is_controller:
+            # Obtain the keys of all requested model outputs
+            keys = self._get_model_cache_keys(sam_set, data_idx)
+            mod_set = np.empty(keys.shape)
+            found = np.zeros(keys.shape, dtype=bool)
+
+            # Look up all keys in the cache if it exists
+            cache_file = path.join(self._working_dir,
+                                   'prism_model_cache.hdf5')
+            if path.exists(cache_file):
+                with h5py.File(cache_file, 'r') as file:
+                    cache_keys = file['keys'][()]
+                    cache_vals = file['values'][()]
+
+                # Search for the keys in the sorted cache keys
+                idx = np.searchsorted(cache_keys, keys)
+                idx[idx == cache_keys.shape[0]] = 0
+                found = (cache_keys[idx] == keys) if len(cache_keys) else found
+                mod_set[found] = cache_vals[idx[found]]
+
+            # Determine which samples are fully cached
+            cache_mask = np.all(found, axis=1)
+
+            # Log the number of cached samples
+            logger = getCLogger('MODEL_CACHE')
+            logger.info("Found %i/%i model evaluation samples in the cache."
+                        % (sum(cache_mask), sam_set.shape[0]))
+
+            # Save the number of cache hits and misses
+            self._model_cache_stats = (sum(cache_mask), sum(~cache_mask))
+
+        # Workers only receive which samples are cached
+        else:
+            cache_mask = None
+            mod_set = None
+
+        # Broadcast cache_mask to workers and return
+        cache_mask = self._comm.bcast(cache_mask, 0)
+        return(cache_mask, mod_set)
+
+    # This function adds the model outputs of a sample set to the cache
+    def _write_model_cache(self, sam_set, data_idx, mod_set):
+        """
+        Adds the model outputs `mod_set` of all samples in `sam_set` at all
+        data points in `data_idx` to the model evaluation cache (see
+        :attr:`~use_model_cache`). The cache is stored as a sorted array of
+        keys and an array of corresponding model outputs in the working
+        directory.
+
+        Parameters
+        ----------
+        sam_set : 2D :obj:`~numpy.ndarray` object
+            Parameter/sample set that was evaluated.
+        data_idx : list of tuples
+            The list of data identifiers the samples were evaluated at.
+        mod_set : 2D :obj:`~numpy.ndarray` object
+            Array containing the model outputs of all samples.
+
+        """
+
+        # If no samples were evaluated, there is nothing to add
+        if not sam_set.shape[0]:
+            return
+
+        # Obtain the keys of all model outputs
+        keys = self._get_model_cache_keys(sam_set, data_idx).ravel()
+        vals = np_array(mod_set, dtype=float).ravel()
+
+        # Combine them with the existing cache
+        cache_file = path.join(self._working_dir, 'prism_model_cache.hdf5')
+        with h5py.File(cache_file, 'a') as file:
+            if 'keys' in file:
+                keys = np.concatenate([file['keys'][()], keys])
+                vals = np.concatenate([file['values'][()], vals])
+                del file['keys']
+                del file['values']
+
+            # Sort the cache on its keys, keeping the newest values
+            keys, idx = np.unique(keys[::-1], return_index=True)
+            vals = vals[::-1][idx]
+
+            # Save the cache
+            file.create_dataset('keys', data=keys)
+            file.create_dataset('values', data=vals)
+
+    # This function evaluates the model in multiple instances simultaneously
+    @docstring_substitute(emul_i=std_emul_i_doc)
+    def _parallel_call_model(self, emul_i, sam_set, data_idx):
+        """
+        Evaluates the model for provided evaluation sample set `sam_set` at
+        given data points `data_idx`, using multiple independent instances of
+        the model as allowed by
+        :attr:`~prism.modellink.ModelLink.parallel_call`.
+
+        If multiple MPI ranks are used, every rank keeps requesting the next
+        task from a counter on the controller until all tasks have been taken.
+        Otherwise, all tasks are distributed over a pool of
+        :attr:`~n_pool_workers` workers of type :attr:`~pool_type`. A task is a
+        single sample, or an equal part of `sam_set` for every model instance
+        if the model can be multi-called.
+
+        This method must be called by all MPI ranks simultaneously.
+
+        Parameters
+        ----------
+        %(emul_i)s
+        sam_set : 2D :obj:`~numpy.ndarray` object
+            Sorted parameter/sample set to evaluate in the model.
+        data_idx : list of tuples
+            The list of data identifiers for which the model is requested to
+            return the corresponding data values.
+
+        Returns
+        -------
+        mod_set : 2D :obj:`~numpy.ndarray` object of shape ``(n_sam, n_data)``
+            Array containing the data values corresponding to the requested
+            data points, in the same order as `sam_set`. Workers return an
+            empty list.
+
+        """
+
+        # Make sure that all MPI ranks use the same sample set
+        sam_set = self._comm.bcast(sam_set, 0)
+        n_sam = sam_set.shape[0]
+
+        # Determine the number of model instances
+        n_inst = self._size if self._size > 1 else self._n_pool_workers
+
+        # Log that the model is being called in multiple instances
+        logger = getCLogger('CALL_MODEL')
+        logger.info("Calling model for sample set of size %i using %i model "
+                    "instances." % (n_sam, n_inst))
+
+        # Divide the sample set into tasks
+        if self._modellink._multi_call:
+            tasks = np.array_split(np.arange(n_sam), min(n_sam, n_inst))
+        else:
+            tasks = np.array_split(np.arange(n_sam), n_sam)
+
+        # If multiple MPI ranks are used, distribute the tasks dynamically
+        if(self._size > 1):
+            # Create a task counter on the controller that all ranks can use
+            counter = np.zeros(int(self._is_controller), dtype=np.int64)
+            win = MPI.Win.Create(counter, counter.itemsize, comm=self._comm)
+            task_idx = np.zeros(1, dtype=np.int64)
+
+            # Keep evaluating the next task until all tasks have been taken
+            results = {}
+            while True:
+                # Obtain the next task and increase the counter
+                win.Lock(0)
+                win.Fetch_and_op(np.ones(1, dtype=np.int64), task_idx, 0)
+                win.Unlock(0)
+                i = int(task_idx[0])
+
+                # Stop if no tasks are left
+                if(i >= len(tasks)):
+                    break
+
+                # Evaluate this task
+                results[i] = self._call_model_task(
+                    self._modellink, emul_i, sam_set[tasks[i]], data_idx)
+
+            # Free the task counter
+            win.Free()
+
+            # Gather the results of all ranks on the controller
+            results_list = self._comm.gather(results, 0)
+            if self._is_controller:
+                for results_rank in results_list:
+                    results.update(results_rank)
+
+        # Else, distribute the tasks over a pool of workers
+        else:
+            # Determine which type of pool must be used
+            if(self._pool_type == 'thread'):
+                pool_obj = ThreadPoolExecutor(n_inst)
+            else:
+                pool_obj = ProcessPoolExecutor(
+                    n_inst, mp_context=multiprocessing.get_context('spawn'))
+
+            # Submit all tasks and wait for their results
+            with pool_obj as pool:
+                futures = [pool.submit(
+                    Pipeline._call_model_task, self._modellink, emul_i,
+                    sam_set[task], data_idx) for task in tasks]
+                results = {i: future.result()
+                           for i, future in enumerate(futures)}
+
+        # Reassemble the results of all tasks on the controller
+        if self._is_controller:
+            mod_set = np.empty([n_sam, len(data_idx)])
+            for i, task in enumerate(tasks):
+                mod_set[task] = results[i]
+
+        # Workers receive a dummy mod_set
+        else:
+            mod_set = []
+
+        # Log that calling the model has been finished
+        logger.info("Finished calling model in multiple instances.")
+
+        # Return mod_set
+        return(mod_set)
+
+    # This function evaluates a single model instance for a given task
+    @staticmethod
+    @docstring_substitute(emul_i=std_emul_i_doc)
+    def _call_model_task(modellink_obj, emul_i, sam_set, data_idx):
+        """
+        Evaluates the model wrapped by `modellink_obj` for all samples in
+        `sam_set` at given data points `data_idx`. This is a single task of
+        :meth:`~_parallel_call_model`, which can be executed in a different
+        process.
+
+        Parameters
+        ----------
+        modellink_obj : :obj:`~prism.modellink.ModelLink` object
+            The instance of the :class:`~prism.modellink.ModelLink` subclass
+            that must be called.
+        %(emul_i)s
+        sam_set : 2D :obj:`~numpy.ndarray` object
+            Parameter/sample set to evaluate in the model.
+        data_idx : list of tuples
+            The list of data identifiers for which the model is requested to
+            return the corresponding data values.
+
+        Returns
+        -------
+        mod_set : 2D :obj:`~numpy.ndarray` object of shape ``(n_sam, n_data)``
+            Array containing the data values corresponding to the requested
+            data points.
+
+        """
+
+        # Request all evaluation samples at once
+        if modellink_obj._multi_call:
+            mod_set = Pipeline._get_model_output(modellink_obj, emul_i,
+                                                 sam_set, data_idx)
+
+        # Request evaluation samples one-by-one
+        else:
+            # Initialize mod_set
+            mod_set = np.empty([sam_set.shape[0], len(data_idx)])
+
+            # Loop over all requested evaluation samples
+            for i, par_set in enumerate(sam_set):
+                mod_set[i] = Pipeline._get_model_output(
+                    modellink_obj, emul_i, par_set, data_idx)
+
+        # Return mod_set
+        return(mod_set)
 
     # This function reads in the parameters from the provided parameters
     def _read_parameters(self, prism_par):
@@ -933,8 +1567,21 @@ class Pipeline(Projection, object):
         # Create parameter dict with default parameters
         par_dict = {'n_sam_init': '500',
                     'base_eval_sam': '800',
+                    'analyze_chunk_size': '0',
+                    'distribute_eval_sam': 'False',
+                    'n_saved_impl_vals': '0',
                     'impl_cut': '[0, 4.0, 3.8, 3.5]',
+                    'n_eval_groups': '1',
+                    'eval_dtype': "'float64'",
+                    'cov_mem_size': '256',
+                    'n_pool_workers': '1',
+                    'pool_type': "'thread'",
+                    'use_model_cache': 'False',
                     'criterion': "None",
+                    'init_sampler': "'lhd'",
+                    'eval_sampler': "'lhd'",
+                    'eval_proposal': "'full'",
+                    'proj_sampler': "'lhd'",
                     'do_active_anal': 'True',
                     'freeze_active_par': 'True',
                     'pot_active_par': 'None'}
@@ -966,6 +1613,31 @@ class Pipeline(Projection, object):
         # Set base number of emulator evaluation samples
         self.base_eval_sam = split_seq(par_dict['base_eval_sam'])[0]
 
+        # Set the number of emulator evaluation samples analyzed at once
+        self.analyze_chunk_size = split_seq(par_dict['analyze_chunk_size'])[0]
+
+        # Set the bool determining whether to distribute sample set creation
+        self.distribute_eval_sam = par_dict['distribute_eval_sam']
+
+        # Set the number of implausibility values saved per evaluation sample
+        self.n_saved_impl_vals = split_seq(par_dict['n_saved_impl_vals'])[0]
+
+        # Set number of emulator system groups used for early rejection
+        self.n_eval_groups = split_seq(par_dict['n_eval_groups'])[0]
+
+        # Set the floating point precision used for evaluating the emulator
+        self.eval_dtype = split_seq(par_dict['eval_dtype'])[0]
+
+        # Set the memory budget for calculating covariance matrices
+        self.cov_mem_size = split_seq(par_dict['cov_mem_size'])[0]
+
+        # Set the number and type of workers used for constructing the emulator
+        self.n_pool_workers = split_seq(par_dict['n_pool_workers'])[0]
+        self.pool_type = split_seq(par_dict['pool_type'])[0]
+
+        # Set the bool determining whether to cache model evaluations
+        self.use_model_cache = par_dict['use_model_cache']
+
         # Convert criterion to a string
         criterion = str(par_dict['criterion'])
 
@@ -977,6 +1649,14 @@ class Pipeline(Projection, object):
         else:
             self.criterion = split_seq(criterion)[0]
 
+        # Set the samplers used for creating sample sets
+        self.init_sampler = split_seq(par_dict['init_sampler'])[0]
+        self.eval_sampler = split_seq(par_dict['eval_sampler'])[0]
+        self.proj_sampler = split_seq(par_dict['proj_sampler'])[0]
+
+        # Set the proposal region used for creating evaluation sample sets
+        self.eval_proposal = split_seq(par_dict['eval_proposal'])[0]
+
         # Set the bool determining whether to do an active parameters analysis
         self.do_active_anal = par_dict['do_active_anal']
 
@@ -1317,6 +1997,7 @@ class Pipeline(Projection, object):
         self._impl_cut = [[]]
         self._cut_idx = [[]]
         self._n_eval_sam = [[]]
+        self._par_space_rem = [[]]
         self._impl_sam = []
 
         # If an emulator currently exists, load in all data
@@ -1345,6 +2026,11 @@ class Pipeline(Projection, object):
                         self._n_impl_sam.append(emul.attrs['n_impl_sam'])
                         self._n_eval_sam.append(emul.attrs['n_eval_sam'])
 
+                        # Older HDF5-files do not store the par_space_rem
+                        self._par_space_rem.append(emul.attrs.get(
+                            'par_space_rem', self._n_impl_sam[i] /
+                            max(self._n_eval_sam[i], 1)))
+
                 # Read in the samples that survived the implausibility check
                 self._impl_sam = emul['impl_sam'][()]
                 self._impl_sam.dtype = float
@@ -1392,27 +2078,112 @@ class Pipeline(Projection, object):
 
                 # IMPL_SAM
                 elif(keyword == 'impl_sam'):
+                    # Remove the previously saved impl_sam data if it exists
+                    if 'impl_sam' in data_set:
+                        del data_set['impl_sam']
+
+                    # If no data is provided, swap in the streamed impl_sam
+                    if data is None:
+                        data_set.move('impl_sam_stream', 'impl_sam')
+                        data = data_set['impl_sam'][()]
+                        data.dtype = float
+
+                    # Else, save the provided data as a compound data set
+                    else:
+                        # Remove any partially streamed impl_sam data
+                        if 'impl_sam_stream' in data_set:
+                            del data_set['impl_sam_stream']
+
+                        # Convert data to a compound data set
+                        dtype = [(n, float) for n in self._modellink._par_name]
+                        data_c = data.copy()
+                        data_c.dtype = dtype
+                        data_set.create_dataset('impl_sam', data=data_c,
+                                                maxshape=(None,)*data_c.ndim)
+
                     # Check if any plausible regions have been found at all
                     n_impl_sam = np.shape(data)[0]
 
-                    # Convert data to a compound data set
-                    dtype = [(n, float) for n in self._modellink._par_name]
-                    data_c = data.copy()
-                    data_c.dtype = dtype
-
                     # Check if impl_sam data has been saved before
                     try:
                         self._n_impl_sam[emul_i] = n_impl_sam
                     except IndexError:
-                        data_set.create_dataset('impl_sam', data=data_c)
                         self._n_impl_sam.append(n_impl_sam)
-                    else:
-                        del data_set['impl_sam']
-                        data_set.create_dataset('impl_sam', data=data_c)
                     finally:
                         self._impl_sam = data
                         data_set.attrs['n_impl_sam'] = n_impl_sam
 
+                # IMPL_SAM_CHUNK
+                elif(keyword == 'impl_sam_chunk'):
+                    # If no data is provided, start a new impl_sam stream
+                    if data is None:
+                        # Remove any partially streamed impl_sam data
+                        if 'impl_sam_stream' in data_set:
+                            del data_set['impl_sam_stream']
+
+                        # Create an empty data set that can be appended to
+                        dtype = [(n, float) for n in self._modellink._par_name]
+                        data_set.create_dataset('impl_sam_stream', (0, 1),
+                                                dtype=dtype,
+                                                maxshape=(None, None))
+
+                    # Else, append data to the streamed impl_sam data set
+                    # The saved impl_sam is only replaced once it is complete
+                    else:
+                        # Convert data to a compound data set
+                        dtype = [(n, float) for n in self._modellink._par_name]
+                        data_c = data.copy()
+                        data_c.dtype = dtype
+
+                        # Append data to the streamed impl_sam data set
+                        impl_sam_set = data_set['impl_sam_stream']
+                        n_impl_sam = impl_sam_set.shape[0]+data_c.shape[0]
+                        impl_sam_set.resize(n_impl_sam, axis=0)
+                        impl_sam_set[n_impl_sam-data_c.shape[0]:] = data_c
+
+                # IMPL_VALS
+                elif(keyword == 'impl_vals'):
+                    # Remove any previously saved implausibility values
+                    for name in ('impl_vals_sam', 'impl_vals',
+                                 'impl_vals_weights'):
+                        if name in data_set:
+                            del data_set[name]
+
+                    # Save the provided samples and implausibility values
+                    if data is not None:
+                        # Convert sam_set to a compound data set
+                        dtype = [(n, float) for n in self._modellink._par_name]
+                        sam_set_c = data[0].copy()
+                        sam_set_c.dtype = dtype
+
+                        # Save both data sets such that they can be appended
+                        data_set.create_dataset(
+                            'impl_vals_sam', data=sam_set_c,
+                            maxshape=(None,)*sam_set_c.ndim)
+                        data_set.create_dataset(
+                            'impl_vals', data=data[1],
+                            maxshape=(None, data[1].shape[1]))
+                        data_set.create_dataset(
+                            'impl_vals_weights', data=data[2],
+                            maxshape=(None,))
+
+                # IMPL_VALS_CHUNK
+                elif(keyword == 'impl_vals_chunk'):
+                    # Convert sam_set to a compound data set
+                    dtype = [(n, float) for n in self._modellink._par_name]
+                    sam_set_c = data[0].copy()
+                    sam_set_c.dtype = dtype
+
+                    # Append the data to the saved implausibility values
+                    for name, data_c in zip(
+                            ('impl_vals_sam', 'impl_vals',
+                             'impl_vals_weights'),
+                            (sam_set_c, data[1], data[2])):
+                        impl_vals_set = data_set[name]
+                        n_sam = impl_vals_set.shape[0]+data_c.shape[0]
+                        impl_vals_set.resize(n_sam, axis=0)
+                        impl_vals_set[n_sam-data_c.shape[0]:] = data_c
+
                 # N_EVAL_SAM
                 elif(keyword == 'n_eval_sam'):
                     # Check if n_eval_sam has been saved before
@@ -1423,6 +2194,16 @@ class Pipeline(Projection, object):
                     finally:
                         data_set.attrs['n_eval_sam'] = data
 
+                # PAR_SPACE_REM
+                elif(keyword == 'par_space_rem'):
+                    # Check if par_space_rem has been saved before
+                    try:
+                        self._par_space_rem[emul_i] = data
+                    except IndexError:
+                        self._par_space_rem.append(data)
+                    finally:
+                        data_set.attrs['par_space_rem'] = data
+
                 # INVALID KEYWORD
                 else:
                     err_msg = "Invalid keyword argument provided!"
@@ -1605,6 +2386,14 @@ class Pipeline(Projection, object):
                 'tot_model_eval_time': ['%#.3g' % (end_time), 's'],
                 'avg_model_eval_time': ['%#.3g' % (eval_rate), 's'],
                 'MPI_comm_size_model': ['%i' % (self._size), '']})
+
+            # Save the number of cache hits and misses if the cache was used
+            if self._use_model_cache and n_sam:
+                self._save_statistics(emul_i, {
+                    'n_model_cache_hits': ['%i' % (self._model_cache_stats[0]),
+                                           ''],
+                    'n_model_cache_misses': [
+                        '%i' % (self._model_cache_stats[1]), '']})
             logger.info(msg)
             print(msg)
 
@@ -1614,16 +2403,31 @@ class Pipeline(Projection, object):
     # This function generates a large Latin Hypercube sample set to analyze
     # the emulator at
     @docstring_substitute(emul_i=std_emul_i_doc)
-    def _get_eval_sam_set(self, emul_i):
+    def _get_eval_sam_set(self, emul_i, n_eval_sam=None, seed=None,
+                          proposal=None):
         """
         Generates an emulator evaluation sample set to be used for analyzing an
-        emulator iteration. Currently uses the :func:`~e13tools.sampling.lhd`
-        function.
+        emulator iteration using the sampler set by :attr:`~eval_sampler`.
 
         Parameters
         ----------
         %(emul_i)s
 
+        Optional
+        --------
+        n_eval_sam : int or None. Default: None
+            The number of evaluation samples to generate.
+            If *None*, the total number of emulator evaluation samples at
+            emulator iteration `emul_i` is used (see :attr:`~n_eval_sam`).
+        seed : int or None. Default: None
+            If int, the seed shared by all MPI ranks that is used to create
+            only the slice of the sample set that belongs to this MPI rank.
+            If *None*, the entire sample set is created.
+        proposal : object or None. Default: None
+            The proposal region obtained with :meth:`~_get_eval_proposal`
+            that the sample set is created in.
+            If *None*, the entire parameter space is used.
+
         Returns
         -------
         eval_sam_set : 2D :obj:`~numpy.ndarray` object
@@ -1634,122 +2438,300 @@ class Pipeline(Projection, object):
         # Log about this
         logger = getCLogger('EVAL_SAMS')
 
-        # Obtain number of samples
-        n_eval_sam = self._get_n_eval_sam(emul_i)
+        # Obtain number of samples if not provided
+        if n_eval_sam is None:
+            n_eval_sam = self._get_n_eval_sam(emul_i)
 
         # Create array containing all samples for analyzing the emulator
         logger.info("Creating emulator evaluation sample set with size %i."
                     % (n_eval_sam))
-        eval_sam_set = lhd(n_eval_sam, self._modellink._n_par,
-                           self._modellink._par_rng, 'center',
-                           self._criterion, 100,
-                           constraints=self._emulator._sam_set[emul_i])
+        kwargs = {'method': 'center',
+                  'criterion': self._criterion,
+                  'iterations': 100,
+                  'constraints': self._emulator._sam_set[emul_i]}
+
+        # If a proposal region is given, create the samples within it
+        if proposal is not None and seed is not None:
+            eval_sam_set = proposal.sample_slice(
+                self._eval_sampler, n_eval_sam, self._rank, self._size, seed,
+                **kwargs)
+        elif proposal is not None:
+            eval_sam_set = proposal.sample(self._eval_sampler, n_eval_sam,
+                                           **kwargs)
+
+        # If a seed is given, only create the slice of this MPI rank
+        elif seed is not None:
+            eval_sam_set = get_sam_set_slice(
+                self._eval_sampler, n_eval_sam, self._modellink._par_rng,
+                self._rank, self._size, seed, **kwargs)
+        else:
+            eval_sam_set = get_sam_set(
+                self._eval_sampler, n_eval_sam, self._modellink._par_rng,
+                **kwargs)
         logger.info("Finished creating sample set.")
 
         # Return it
         return(eval_sam_set)
 
-    # This function performs an implausibility cut-off check on a given sample
+    # This function returns the proposal region for evaluation sample sets
+    @docstring_substitute(emul_i=std_emul_i_doc)
+    def _get_eval_proposal(self, emul_i):
+        """
+        Returns the proposal region set by :attr:`~eval_proposal` that is
+        built around the plausible samples of the emulator iteration before
+        emulator iteration `emul_i`, which is used for creating the emulator
+        evaluation sample set of `emul_i`.
+
+        This method is only called by the controller.
+
+        Parameters
+        ----------
+        %(emul_i)s
+
+        Returns
+        -------
+        proposal : object or None
+            The proposal region (see :func:`~prism._sampling.get_proposal`).
+            If the entire parameter space must be used, *None* is returned
+            instead.
+
+        """
+
+        # The first iteration and the 'full' proposal use all of par_space
+        if(self._eval_proposal == 'full' or emul_i == 1):
+            return(None)
+
+        # Read in the plausible samples of the previous iteration
+        with self._File('r', None) as file:
+            impl_sam = file['%i/impl_sam' % (emul_i-1)][()]
+        impl_sam.dtype = float
+
+        # If there are too few plausible samples, use all of par_space
+        if(impl_sam.shape[0] <= self._modellink._n_par):
+            logger = getCLogger('EVAL_SAMS')
+            logger.info("Too few plausible samples to build %r proposal "
+                        "region. Using entire parameter space."
+                        % (self._eval_proposal))
+            return(None)
+
+        # Build the proposal region and return it
+        return(get_proposal(self._eval_proposal, impl_sam,
+                            self._modellink._par_rng))
+
+    # This function performs an implausibility cut-off check on given samples
     # TODO: Implement dynamic impl_cut
     @docstring_substitute(emul_i=std_emul_i_doc)
-    def _do_impl_check(self, emul_i, uni_impl_val):
+    def _do_impl_check(self, emul_i, uni_impl_vals):
         """
         Performs an implausibility cut-off check on the provided implausibility
-        values `uni_impl_val` at emulator iteration `emul_i`.
+        values `uni_impl_vals` at emulator iteration `emul_i`.
 
         Parameters
         ----------
         %(emul_i)s
-        uni_impl_val : 1D array_like
+        uni_impl_vals : 2D array_like
             Array containing all univariate implausibility values corresponding
-            to a certain parameter set for all data points.
+            to a set of parameter sets for all data points.
 
         Returns
         -------
-        result : bool
-            1 if check was successful, 0 if it was not.
-        impl_cut_val : float
-            Implausibility value at the first real implausibility cut-off.
+        impl_check_vals : 1D :obj:`~numpy.ndarray` object
+            Bool array stating for every parameter set if the check was
+            successful.
+        impl_cut_vals : 1D :obj:`~numpy.ndarray` object
+            Implausibility values at the first real implausibility cut-off for
+            every parameter set.
 
         """
 
-        # Sort impl_val to compare with the impl_cut list
-        sorted_impl_val = np.flip(np.sort(
-            uni_impl_val, axis=-1), axis=-1)[self._cut_idx[emul_i]:]
+        # Make sure that uni_impl_vals is a 2D array
+        uni_impl_vals = np_array(uni_impl_vals, ndmin=2)
 
-        # Save the implausibility value at the first real cut-off
-        impl_cut_val = sorted_impl_val[0]
+        # Determine how many of the highest impl_vals are compared to impl_cut
+        cut_idx = self._cut_idx[emul_i]
+        n_cut = min(cut_idx+len(self._impl_cut[emul_i]),
+                    uni_impl_vals.shape[1])
 
-        # Scan over all data points in this sample
-        for impl_val, cut_val in zip(sorted_impl_val, self._impl_cut[emul_i]):
-            # If impl_val is not below impl_cut, break
-            if(impl_val > cut_val):
-                return(0, impl_cut_val)
+        # Obtain the n_cut highest impl_vals without sorting all of them
+        if(n_cut < uni_impl_vals.shape[1]):
+            top_impl_vals = np.partition(-uni_impl_vals, n_cut-1,
+                                         axis=1)[:, :n_cut]
         else:
-            # If for-loop ended in a normal way, the check was successful
-            return(1, impl_cut_val)
+            top_impl_vals = -uni_impl_vals
+
+        # Sort these impl_vals to compare with the impl_cut list
+        sorted_impl_vals = -np.sort(top_impl_vals, axis=1)[:, cut_idx:]
+
+        # Save the implausibility values at the first real cut-off
+        impl_cut_vals = sorted_impl_vals[:, 0]
+
+        # Check for all samples if no impl_val is above its impl_cut
+        impl_check_vals = np.all(
+            sorted_impl_vals <=
+            self._impl_cut[emul_i][:sorted_impl_vals.shape[1]], axis=1)
+
+        # Return the results
+        return(impl_check_vals, impl_cut_vals)
+
+    # This function returns the highest univariate implausibility values
+    def _get_top_impl_vals(self, uni_impl_vals):
+        """
+        Returns the :attr:`~n_saved_impl_vals` highest univariate
+        implausibility values of every parameter set in the provided
+        `uni_impl_vals`, sorted from highest to lowest.
+
+        Parameters
+        ----------
+        uni_impl_vals : 2D array_like
+            Array containing all univariate implausibility values corresponding
+            to a set of parameter sets for all data points.
+
+        Returns
+        -------
+        top_impl_vals : 2D :obj:`~numpy.ndarray` object
+            Array containing the highest univariate implausibility values of
+            every parameter set, which can be passed to
+            :meth:`~_do_impl_check` instead of `uni_impl_vals`.
+
+        """
+
+        # Make sure that uni_impl_vals is a 2D array
+        uni_impl_vals = np_array(uni_impl_vals, ndmin=2)
+
+        # Determine how many of the highest impl_vals are returned
+        n_top = min(self._n_saved_impl_vals, uni_impl_vals.shape[1])
+
+        # Obtain the n_top highest impl_vals without sorting all of them
+        if(n_top < uni_impl_vals.shape[1]):
+            top_impl_vals = np.partition(-uni_impl_vals, n_top-1,
+                                         axis=1)[:, :n_top]
+        else:
+            top_impl_vals = -uni_impl_vals
+
+        # Sort and return them
+        return(-np.sort(top_impl_vals, axis=1))
+
+    # This function calculates the univariate implausibility values
+    # This is function 'I²(x)'
+    @docstring_substitute(emul_i=std_emul_i_doc)
+    def _get_uni_impl(self, emul_i, sam_set, adj_exp_val, adj_var_val,
+                      emul=None, act_idx=None):
+        """
+        Calculates the univariate implausibility values at a given emulator
+        iteration `emul_i` for specified expectation and variance values
+        `adj_exp_val` and `adj_var_val`, corresponding to given `sam_set`.
+
+        Parameters
+        ----------
+        %(emul_i)s
+        sam_set : 2D :obj:`~numpy.ndarray` object
+            Array containing model parameter value sets to calculate the
+            univariate implausibility values for. Only used to pass to the
+            :meth:`~prism.modellink.ModelLink.get_md_var` method.
+        adj_exp_val, adj_var_val : 2D array_like
+            The adjusted expectation and variance values of all samples in
+            `sam_set` to calculate the univariate implausibility for.
+
+        Optional
+        --------
+        emul : :obj:`~prism.emulator.Emulator` object or None. Default: None
+            The emulator (replica) that holds the data of the requested
+            emulator systems. If *None*, :attr:`~emulator` is used.
+        act_idx : 1D array_like of int or None. Default: None
+            The indices of the active emulator systems that `adj_exp_val` and
+            `adj_var_val` correspond to. If *None*, all active emulator systems
+            are used.
+
+        Returns
+        -------
+        uni_impl_vals : 2D :obj:`~numpy.ndarray` object
+            Univariate implausibility values of all samples in `sam_set` for
+            all requested emulator systems.
+
+        """
+
+        # Use the emulator of this pipeline if no emulator is provided
+        if emul is None:
+            emul = self._emulator
+
+        # Obtain model discrepancy variance of the first sample
+        md_var = self._get_md_var(emul_i, sam_set[0], emul)
+
+        # If md_var is not the default, obtain it for all other samples as well
+        if md_var is not emul._md_var_def.get(emul_i):
+            md_var = np_array([md_var]+[
+                self._get_md_var(emul_i, par_set, emul)
+                for par_set in sam_set[1:]])
+
+        # Obtain the data values and squared data errors
+        data_val, data_err_sq = self._get_impl_data(emul_i, emul)
+
+        # Select the requested emulator systems if required
+        if act_idx is not None:
+            md_var = md_var[..., act_idx, :]
+            data_val = data_val[act_idx]
+            data_err_sq = data_err_sq[act_idx]
+
+        # Use the lower errors if adj_exp_val < data_val, upper otherwise
+        err_var = np.where(adj_exp_val < data_val,
+                           md_var[..., 1]+data_err_sq[:, 1],
+                           md_var[..., 0]+data_err_sq[:, 0])
+
+        # Calculate the univariate implausibility values
+        uni_impl_vals = np.sqrt(pow(adj_exp_val-data_val, 2) /
+                                (adj_var_val+err_var))
+
+        # Return it
+        return(uni_impl_vals)
 
-    # This function calculates the univariate implausibility values
-    # This is function 'I²(x)'
+    # This function returns the data values and errors used for implausibility
     @docstring_substitute(emul_i=std_emul_i_doc)
-    def _get_uni_impl(self, emul_i, par_set, adj_exp_val, adj_var_val):
+    def _get_impl_data(self, emul_i, emul):
         """
-        Calculates the univariate implausibility values at a given emulator
-        iteration `emul_i` for specified expectation and variance values
-        `adj_exp_val` and `adj_var_val`, corresponding to given `par_set`.
+        Returns the data values and squared data errors of all active emulator
+        systems at emulator iteration `emul_i` as NumPy arrays. These arrays
+        are calculated once per emulator iteration and cached afterward.
 
         Parameters
         ----------
         %(emul_i)s
-        par_set : 1D :obj:`~numpy.ndarray` object
-            Model parameter value set to calculate the univariate
-            implausibility values for. Only used to pass to the
-            :meth:`~prism.modellink.ModelLink.get_md_var` method.
-        adj_exp_val, adj_var_val : 1D array_like
-            The adjusted expectation and variance values to calculate the
-            univariate implausibility for.
+        emul : :obj:`~prism.emulator.Emulator` object
+            The emulator (replica) that holds the data of the requested
+            emulator systems.
 
         Returns
         -------
-        uni_impl_val : 1D :obj:`~numpy.ndarray` object
-            Univariate implausibility value for all requested emulator systems.
+        data_val : 1D :obj:`~numpy.ndarray` object
+            The data values of all active emulator systems.
+        data_err_sq : 2D :obj:`~numpy.ndarray` object
+            The squared upper and lower data errors of all active emulator
+            systems.
 
         """
 
-        # Obtain model discrepancy variance
-        md_var = self._get_md_var(emul_i, par_set)
-
-        # Determine the active emulator systems for this iteration
-        active_emul_s = self._emulator._active_emul_s[emul_i]
-
-        # Initialize empty univariate implausibility
-        uni_impl_val_sq = np.zeros(len(active_emul_s))
-
-        # Calculate the univariate implausibility values
-        for i, emul_s in enumerate(active_emul_s):
-            # Use the upper errors by default
-            err_idx = 0
-
-            # If adj_exp_val < data_val, use the lower error instead
-            if(adj_exp_val[i] < self._emulator._data_val[emul_i][emul_s]):
-                err_idx = 1
+        # Check if these arrays have been calculated before
+        try:
+            return(emul._impl_data[emul_i])
 
-            # Calculate the univariate implausibility value
-            uni_impl_val_sq[i] =\
-                pow(adj_exp_val[i]-self._emulator._data_val[emul_i][emul_s],
-                    2)/(adj_var_val[i]+md_var[i][err_idx] +
-                        pow(self._emulator._data_err[emul_i][emul_s][err_idx],
-                            2))
+        # If not, calculate them
+        except KeyError:
+            # Obtain the data values and errors of all active emulator systems
+            active_emul_s = emul._active_emul_s[emul_i]
+            data_val = np_array([emul._data_val[emul_i][emul_s]
+                                 for emul_s in active_emul_s], dtype=float)
+            data_err = np_array([emul._data_err[emul_i][emul_s]
+                                 for emul_s in active_emul_s], dtype=float)
 
-        # Take square root
-        uni_impl_val = np.sqrt(uni_impl_val_sq)
+            # Save the data values and squared data errors
+            emul._impl_data[emul_i] = (data_val,
+                                       pow(data_err, 2).reshape(-1, 2))
 
-        # Return it
-        return(uni_impl_val)
+            # Return them
+            return(emul._impl_data[emul_i])
 
     # This function calculates the model discrepancy variance
     @docstring_substitute(emul_i=std_emul_i_doc)
-    def _get_md_var(self, emul_i, par_set):
+    def _get_md_var(self, emul_i, par_set, emul=None):
         """
         Retrieves the model discrepancy variances, which includes all variances
         that are created by the model provided by the
@@ -1766,6 +2748,12 @@ class Pipeline(Projection, object):
             Model parameter value set to calculate the model discrepancy
             variances for.
 
+        Optional
+        --------
+        emul : :obj:`~prism.emulator.Emulator` object or None. Default: None
+            The emulator (replica) that holds the data of the requested
+            emulator systems. If *None*, :attr:`~emulator` is used.
+
         Returns
         -------
         var_md : 2D :obj:`~numpy.ndarray` object
@@ -1773,16 +2761,69 @@ class Pipeline(Projection, object):
 
         """
 
+        # Use the emulator of this pipeline if no emulator is provided
+        if emul is None:
+            emul = self._emulator
+
         # Obtain md variances
         # Try to use the user-defined md variances
         try:
             md_var = self._modellink.get_md_var(
                 emul_i=emul_i,
                 par_set=sdict(zip(self._modellink._par_name, par_set)),
-                data_idx=delist(self._emulator._data_idx[emul_i]))
+                data_idx=delist(emul._data_idx[emul_i]))
 
-        # If it was not user-defined, use a default value
+        # If it was not user-defined, use the default value
         except NotImplementedError:
+            md_var = self._get_md_var_def(emul_i, emul)
+
+        # If it was user-defined, check if the values are compatible
+        else:
+            # If md_var is a dict, convert it to a NumPy array
+            if isinstance(md_var, dict):
+                data_idx = delist(emul._data_idx[emul_i])
+                md_var = np_array([md_var[idx] for idx in data_idx])
+
+            # Make sure that md_var is a NumPy array
+            md_var = np_array(md_var)
+
+            # If single values were given, duplicate them
+            if(md_var.ndim == 1):
+                md_var = np_array([md_var]*2).T
+
+        # Return it
+        return(md_var)
+
+    # This function calculates the default model discrepancy variance
+    @docstring_substitute(emul_i=std_emul_i_doc)
+    def _get_md_var_def(self, emul_i, emul):
+        """
+        Returns the default model discrepancy variances at emulator iteration
+        `emul_i`, which are ``1/6th`` the data values if the data value space
+        is linear. If the data value space is not linear, then this default
+        value is calculated such to reflect that. The default variances are
+        calculated once per emulator iteration and cached afterward.
+
+        Parameters
+        ----------
+        %(emul_i)s
+        emul : :obj:`~prism.emulator.Emulator` object
+            The emulator (replica) that holds the data of the requested
+            emulator systems.
+
+        Returns
+        -------
+        var_md : 2D :obj:`~numpy.ndarray` object
+            Default variance of the model discrepancy.
+
+        """
+
+        # Check if md_var has been calculated before
+        try:
+            return(emul._md_var_def[emul_i])
+
+        # If not, calculate it
+        except KeyError:
             # Use factor 2 difference on 2 sigma as acceptable
             # Imagine that 2 sigma range is given if lower and upper are factor
             # 2 apart. This gives that sigma must be 1/6th of the data value
@@ -1792,8 +2833,8 @@ class Pipeline(Projection, object):
 
             # Loop over all data points and check their values spaces
             for data_val, data_spc in zip(
-                    delist(self._emulator._data_val[emul_i]),
-                    delist(self._emulator._data_spc[emul_i])):
+                    delist(emul._data_val[emul_i]),
+                    delist(emul._data_spc[emul_i])):
                 # If value space is linear, take 1/6th of the data value
                 if(data_spc == 'lin'):
                     md_var.append([pow(data_val/6, 2)]*2)
@@ -1811,25 +2852,11 @@ class Pipeline(Projection, object):
                 else:
                     raise NotImplementedError
 
-            # Make sure that md_var is a NumPy array
-            md_var = np_array(md_var, ndmin=2)
-
-        # If it was user-defined, check if the values are compatible
-        else:
-            # If md_var is a dict, convert it to a NumPy array
-            if isinstance(md_var, dict):
-                data_idx = self._emulator._data_idx[emul_i]
-                md_var = np_array([md_var[idx] for idx in data_idx])
-
-            # Make sure that md_var is a NumPy array
-            md_var = np_array(md_var)
-
-            # If single values were given, duplicate them
-            if(md_var.ndim == 1):
-                md_var = np_array([md_var]*2).T
+            # Save md_var as a NumPy array
+            emul._md_var_def[emul_i] = np_array(md_var, ndmin=2)
 
-        # Return it
-        return(md_var)
+            # Return it
+            return(emul._md_var_def[emul_i])
 
     # This function sets the impl_cut list from read-in parameter dict
     # TODO: Make impl_cut dynamic
@@ -2005,6 +3032,24 @@ class Pipeline(Projection, object):
         code_objects['analyze'] = (pre_code, eval_code, anal_code, post_code,
                                    exit_code)
 
+        # ANALYZE_IMPL
+        # Define the various code snippets
+        # The highest impl_vals are saved of all samples in the last iteration
+        pre_code = compile("impl_vals = None", '<string>', 'exec')
+        eval_code = compile("", '<string>', 'exec')
+        anal_code = compile(dedent("""
+            if(i == emul_i):
+                impl_vals = (sam_set[sam_idx],
+                             self._get_top_impl_vals(uni_impl_vals_array))
+            """), '<string>', 'exec')
+        post_code = compile("self.results = (sam_set[sam_idx], impl_vals)",
+                            '<string>', 'exec')
+        exit_code = compile("", '<string>', 'exec')
+
+        # Combine code snippets into a tuple and add to dict
+        code_objects['analyze_impl'] = (pre_code, eval_code, anal_code,
+                                        post_code, exit_code)
+
         # EVALUATE
         # Define the various code snippets
         # We have to use lists here to account for n_data differing with emul_i
@@ -2019,7 +3064,7 @@ class Pipeline(Projection, object):
             adj_var_val[sam_idx[j]] = adj_val[1]
             uni_impl_val_list[sam_idx[j]] = uni_impl_vals[j]
             """), '<string>', 'exec')
-        anal_code = compile("emul_i_stop[sam_idx[j]] = i", '<string>', 'exec')
+        anal_code = compile("emul_i_stop[sam_idx] = i", '<string>', 'exec')
         post_code = compile(dedent("""
             adj_exp_val = self._comm.gather(np_array(adj_exp_val), 0)
             adj_var_val = self._comm.gather(np_array(adj_var_val), 0)
@@ -2040,11 +3085,12 @@ class Pipeline(Projection, object):
 
         # HYBRID
         # Define the various code snippets
+        # Hybrid sampling always evaluates a single sample
         pre_code = compile("lnprior = 0", '<string>', 'exec')
         eval_code = compile("", '<string>', 'exec')
         anal_code = compile(dedent("""
-            lnprior = (np.log(1-impl_cut_val/self._impl_cut[i][0]) if
-                       impl_check_val else -np.infty)
+            lnprior = (np.log(1-impl_cut_vals[0]/self._impl_cut[i][0]) if
+                       impl_check_vals[0] else -np.infty)
             """), '<string>', 'exec')
         post_code = compile(dedent("""
             lnprior = self._comm.bcast(lnprior, 0)
@@ -2060,7 +3106,7 @@ class Pipeline(Projection, object):
         # Define the various code snippets
         pre_code = compile("impl_cut = np.zeros([n_sam])", '<string>', 'exec')
         eval_code = compile("", '<string>', 'exec')
-        anal_code = compile("impl_cut[sam_idx[j]] = impl_cut_val", '<string>',
+        anal_code = compile("impl_cut[sam_idx] = impl_cut_vals", '<string>',
                             'exec')
         post_code = compile("", '<string>', 'exec')
         exit_code = compile("self.results = (impl_check, impl_cut)",
@@ -2091,12 +3137,13 @@ class Pipeline(Projection, object):
         sam_set : 2D :obj:`~numpy.ndarray` object
             Array containing model parameter value sets to be evaluated in all
             emulator systems in emulator iteration `emul_i`.
-        exec_code : {'analyze', 'evaluate', 'hybrid', 'project'} or tuple
+        exec_code : str or tuple
             Tuple of five code snippets ``(pre_code, eval_code, anal_code,
             post_code, exit_code)`` to be executed at specific points during
             the analysis.
             If string, use one of the built-in tuples in :attr:`~code_objects`
-            instead.
+            instead ('analyze', 'analyze_impl', 'evaluate', 'hybrid' or
+            'project').
 
         Other parameters
         ----------------
@@ -2107,8 +3154,12 @@ class Pipeline(Projection, object):
             Code snippet to be executed after the evaluation of each sample in
             `sam_set`.
         anal_code : str or code object
-            Code snippet to be executed after the analysis of each sample in
-            `sam_set`. This code snippet is only executed by the controller.
+            Code snippet to be executed after the implausibility analysis of
+            all still plausible samples in `sam_set` in every emulator
+            iteration. The results of this analysis are available as the
+            arrays `impl_check_vals` and `impl_cut_vals`, which correspond to
+            the sample indices in `sam_idx`. This code snippet is only executed
+            by the controller.
         post_code : str or code object
             Code snippet to be executed after the evaluation of `sam_set` ends.
         exit_code : str or code object
@@ -2129,6 +3180,13 @@ class Pipeline(Projection, object):
         If any of the code snippets is provided as a string, it will be
         compiled into a code object before starting the evaluation.
 
+        If one of the built-in 'analyze', 'analyze_impl', 'hybrid' or 'project'
+        tuples is used and an emulator iteration has fewer active emulator
+        systems than MPI ranks, `sam_set` is distributed over all MPI ranks
+        instead of the emulator systems. Every MPI rank then evaluates all
+        emulator systems using a replica made by
+        :meth:`~prism.emulator.Emulator._get_replica`.
+
         """
 
         # Determine number of samples
@@ -2172,6 +3230,11 @@ class Pipeline(Projection, object):
         # Set the results property to None
         self.results = None
 
+        # Initialize the evaluation statistics
+        eval_time = 0
+        n_sam_dist_iter = 0
+        n_evals_saved = 0
+
         # Execute the pre_code snippet
         exec(pre_code)
 
@@ -2186,19 +3249,109 @@ class Pipeline(Projection, object):
                 logger.info("Analyzing evaluation sample set of size %i in "
                             "emulator iteration %i." % (n_sam, i))
 
-                # Make empty uni_impl_vals list
-                uni_impl_vals = np.zeros([n_sam, self._emulator._n_data[i]])
-
-                # Loop over all still plausible samples in sam_set
-                for j, par_set in enumerate(eval_sam_set):
-                    # Evaluate par_set
-                    adj_val = self._emulator._evaluate(i, par_set)
-
-                    # Calculate univariate implausibility value
-                    uni_impl_vals[j] = self._get_uni_impl(i, par_set, *adj_val)
+                # Obtain a replica of all emulator systems if samples are
+                # distributed over the MPI ranks instead of emulator systems
+                if(exec_code in ('analyze', 'analyze_impl', 'hybrid',
+                                 'project')):
+                    replica = self._emulator._get_replica(i)
+                else:
+                    replica = None
+
+                # If a replica is used, evaluate a chunk of sam_set
+                # Results are then combined per sample instead of per system
+                if replica is not None:
+                    emul = replica
+                    sam_bounds = np.linspace(0, n_sam, self._size+1, dtype=int)
+                    sam_lo, sam_hi = sam_bounds[self._rank:self._rank+2]
+                    axis = 0
+                    n_sam_dist_iter += 1
+
+                # Else, evaluate all samples in sam_set
+                else:
+                    emul = self._emulator
+                    sam_lo, sam_hi = 0, n_sam
+                    axis = 1
+
+                # Determine the groups of active emulator systems that are
+                # evaluated consecutively, ordered on their rejection power
+                if(self._n_eval_groups > 1 and
+                   exec_code in ('analyze', 'hybrid')):
+                    eval_groups = emul._get_eval_groups(i, self._n_eval_groups)
+                else:
+                    eval_groups = [np.arange(emul._n_data[i])]
 
-                    # Execute the eval_code snippet
-                    exec(eval_code)
+                # Make empty uni_impl_vals list
+                uni_impl_vals = np.zeros([sam_hi-sam_lo, emul._n_data[i]])
+
+                # Mark all samples as not rejected
+                eval_mask = np.ones(n_sam, dtype=bool)
+
+                # Determine how many samples can be evaluated at once
+                batch_size = emul._get_batch_size(i)
+
+                # Save the time at which the evaluation starts
+                start_time = time()
+
+                # Loop over all groups of emulator systems
+                for g, act_idx in enumerate(eval_groups):
+                    # Determine which samples have not been rejected yet
+                    eval_idx = np.nonzero(eval_mask[sam_lo:sam_hi])[0]
+                    n_evals_saved +=\
+                        (sam_hi-sam_lo-len(eval_idx))*len(act_idx)
+
+                    # Obtain the emulator systems in this group
+                    emul_s_seq = [emul._active_emul_s[i][idx]
+                                  for idx in act_idx]
+
+                    # Loop over all these samples in batches
+                    for k in range(0, len(eval_idx), batch_size):
+                        # Obtain this batch of samples
+                        batch_idx = eval_idx[k:k+batch_size]
+                        sam_batch = eval_sam_set[sam_lo+batch_idx]
+
+                        # Evaluate this batch of samples
+                        adj_exp_batch, adj_var_batch =\
+                            emul._evaluate_batch(i, sam_batch, emul_s_seq)
+
+                        # Calculate univariate implausibility values
+                        uni_impl_vals[np.ix_(batch_idx, act_idx)] =\
+                            self._get_uni_impl(i, sam_batch, adj_exp_batch,
+                                               adj_var_batch, emul, act_idx)
+
+                        # Loop over all samples in this batch
+                        for b, (j, par_set) in enumerate(
+                                zip(sam_lo+batch_idx, sam_batch)):
+                            # Obtain the evaluation results of par_set
+                            adj_val = (adj_exp_batch[b], adj_var_batch[b])
+
+                            # Execute the eval_code snippet
+                            exec(eval_code)
+
+                    # Update the rejection power of grouped emulator systems
+                    if(len(eval_groups) > 1):
+                        emul._update_reject_power(
+                            i, emul_s_seq,
+                            uni_impl_vals[np.ix_(eval_idx, act_idx)])
+
+                    # Check if this is not the last group of emulator systems
+                    if(g < len(eval_groups)-1):
+                        # Gather the results on the controller
+                        uni_impl_vals_list = self._comm.gather(uni_impl_vals,
+                                                               0)
+
+                        # Controller checks which samples are implausible
+                        # Unevaluated values are zero, so this is a lower bound
+                        if self._is_controller:
+                            uni_impl_vals_array = np.concatenate(
+                                uni_impl_vals_list, axis=axis)
+                            eval_mask = self._do_impl_check(
+                                i, uni_impl_vals_array)[0]
+
+                        # Broadcast the samples that are not rejected
+                        eval_mask = self._comm.bcast(eval_mask, 0)
+
+                # Add the time spent on evaluating to the total
+                eval_time += time()-start_time
 
                 # Gather the results on the controller after evaluating
                 uni_impl_vals_list = self._comm.gather(uni_impl_vals, 0)
@@ -2206,19 +3359,18 @@ class Pipeline(Projection, object):
                 # Controller performs implausibility analysis
                 if self._is_controller:
                     # Convert uni_impl_vals_list to an array
-                    uni_impl_vals_array =\
-                        np.concatenate(uni_impl_vals_list, axis=1)
+                    uni_impl_vals_array = np.concatenate(uni_impl_vals_list,
+                                                         axis=axis)
 
                     # Perform implausibility cutoff check on all elements
-                    for j, uni_impl_val in enumerate(uni_impl_vals_array):
-                        impl_check_val, impl_cut_val =\
-                            self._do_impl_check(i, uni_impl_val)
+                    impl_check_vals, impl_cut_vals =\
+                        self._do_impl_check(i, uni_impl_vals_array)
 
-                        # Modify impl_check with obtained impl_check_val
-                        impl_check[sam_idx[j]] = impl_check_val
+                    # Modify impl_check with obtained impl_check_vals
+                    impl_check[sam_idx] = impl_check_vals
 
-                        # Execute the anal_code snippet
-                        exec(anal_code)
+                    # Execute the anal_code snippet
+                    exec(anal_code)
 
                     # Modify sam_idx with those that are still plausible
                     sam_idx = sam_idx_full[impl_check]
@@ -2241,6 +3393,9 @@ class Pipeline(Projection, object):
         else:
             raise NotImplementedError
 
+        # Save the evaluation statistics of this MPI rank
+        self._eval_stats = (eval_time, n_sam_dist_iter, n_evals_saved)
+
         # Execute the post_code snippet
         exec(post_code)
 
@@ -2258,14 +3413,274 @@ class Pipeline(Projection, object):
         # Return the results
         return(results)
 
+    # This function analyzes a slice of a sample set on a single MPI rank
+    @docstring_substitute(emul_i=std_emul_i_doc)
+    def _analyze_sam_slice(self, emul_i, sam_set):
+        """
+        Analyzes the slice `sam_set` of an emulator evaluation sample set that
+        belongs to this MPI rank at a given emulator iteration `emul_i`, and
+        returns the samples that survive the implausibility checks, together
+        with the highest univariate implausibility values of all samples that
+        were evaluated in `emul_i` if :attr:`~n_saved_impl_vals` is not 0.
+        Every MPI rank evaluates its slice in all active emulator systems,
+        using the replicas made by
+        :meth:`~prism.emulator.Emulator._get_replica`.
+
+        This method must be called by all MPI ranks simultaneously.
+
+        Parameters
+        ----------
+        %(emul_i)s
+        sam_set : 2D :obj:`~numpy.ndarray` object
+            Array containing the slice of model parameter value sets of this
+            MPI rank.
+
+        Returns
+        -------
+        impl_sam : 2D :obj:`~numpy.ndarray` object
+            Array containing all samples in `sam_set` that survived the
+            implausibility checks.
+        impl_vals : tuple or None
+            Tuple containing the samples in `sam_set` that were evaluated in
+            emulator iteration `emul_i` and their highest univariate
+            implausibility values (see :meth:`~_get_top_impl_vals`). If no
+            implausibility values are saved or no samples were evaluated in
+            `emul_i`, *None* is returned instead.
+
+        """
+
+        # Initialize the evaluation time and saved implausibility values
+        eval_time = 0
+        impl_vals = None
+
+        # Analyze sam_set in every emulator iteration
+        # All MPI ranks must take part in every iteration to make the replicas
+        for i in range(1, emul_i+1):
+            # Obtain a replica of all active emulator systems
+            emul = self._emulator._get_replica(i, force=True)
+
+            # Make a filled bool list containing which samples are plausible
+            impl_check = np.ones(sam_set.shape[0], dtype=bool)
+
+            # Check if the highest impl_vals of this iteration must be saved
+            save_impl = (i == emul_i and self._n_saved_impl_vals and
+                         emul is not None)
+            top_impl_vals = []
+
+            # Determine how many samples can be evaluated at once
+            batch_size = emul._get_batch_size(i) if emul is not None else 1
+
+            # Save the time at which the evaluation starts
+            start_time = time()
+
+            # Loop over all samples in batches if there are emulator systems
+            for k in range(0, sam_set.shape[0] if emul is not None else 0,
+                           batch_size):
+                # Obtain this batch of samples
+                sam_batch = sam_set[k:k+batch_size]
+
+                # Evaluate this batch of samples
+                adj_exp_batch, adj_var_batch = emul._evaluate_batch(
+                    i, sam_batch, emul._active_emul_s[i])
+
+                # Calculate univariate implausibility values
+                uni_impl_vals = self._get_uni_impl(
+                    i, sam_batch, adj_exp_batch, adj_var_batch, emul)
+
+                # Perform implausibility cutoff check on this batch
+                impl_check[k:k+batch_size] =\
+                    self._do_impl_check(i, uni_impl_vals)[0]
+
+                # Save the highest impl_vals of this batch if requested
+                if save_impl:
+                    top_impl_vals.append(
+                        self._get_top_impl_vals(uni_impl_vals))
+
+            # Add the time spent on evaluating to the total
+            eval_time += time()-start_time
+
+            # Combine the highest impl_vals of all batches
+            if save_impl and top_impl_vals:
+                impl_vals = (sam_set, np.concatenate(top_impl_vals, axis=0))
+
+            # Only keep the samples that are still plausible
+            sam_set = sam_set[impl_check]
+
+        # Save the evaluation statistics of this MPI rank
+        self._eval_stats = (eval_time, emul_i, 0)
+
+        # Return the plausible samples and saved implausibility values
+        return(sam_set, impl_vals)
+
+    # This function checks if enough plausible samples were found
+    def _check_n_impl_sam(self, n_impl_sam, logger):
+        """
+        Checks if the provided number of plausible samples `n_impl_sam` is
+        sufficient to construct the next emulator iteration, and raises a
+        :class:`~prism._internal.RequestWarning` if it is not.
+
+        Parameters
+        ----------
+        n_impl_sam : int
+            The number of emulator evaluation samples that survived the
+            implausibility checks.
+        logger : :obj:`~logging.Logger` object
+            The logger to log the raised warnings with.
+
+        """
+
+        # Raise warning if no plausible samples were found
+        if not n_impl_sam:
+            warn_msg = ("No plausible regions were found. Constructing the "
+                        "next iteration will not be possible.")
+            raise_warning(warn_msg, RequestWarning, logger, 3)
+
+        # Raise warning if n_impl_sam is less than n_cross_val
+        elif(n_impl_sam < self._emulator._n_cross_val):
+            warn_msg = ("Number of plausible samples is lower than the number "
+                        "of cross validations used during regression (%i < "
+                        "%i). Constructing the next iteration will not be "
+                        "possible."
+                        % (n_impl_sam, self._emulator._n_cross_val))
+            raise_warning(warn_msg, RequestWarning, logger, 3)
+
+        # Raise warning if n_impl_sam is less than n_sam_init
+        elif(n_impl_sam < self._emulator._n_sam[1]):
+            warn_msg = ("Number of plausible samples is lower than the number "
+                        "of samples in the first iteration (%i < %i). "
+                        "Constructing the next iteration might not produce a "
+                        "more accurate emulator."
+                        % (n_impl_sam, self._emulator._n_sam[1]))
+            raise_warning(warn_msg, RequestWarning, logger, 3)
+
+    # This function reanalyzes an iteration using saved implausibility values
+    @docstring_substitute(emul_i=std_emul_i_doc)
+    def _reanalyze_impl_vals(self, emul_i, start_time):
+        """
+        Reanalyzes the emulator at the provided emulator iteration `emul_i`,
+        by performing the implausibility checks on the univariate
+        implausibility values that were saved during the previous analysis of
+        `emul_i` (see :attr:`~n_saved_impl_vals`), instead of evaluating the
+        emulator again.
+
+        This method is only called by the controller.
+
+        Parameters
+        ----------
+        %(emul_i)s
+        start_time : float
+            The time at which the reanalysis started.
+
+        Generates
+        ---------
+        impl_sam : 2D :obj:`~numpy.ndarray` object
+            Array containing all saved emulator evaluation samples that
+            survived the implausibility checks.
+
+        """
+
+        # Begin logging
+        logger = getCLogger('REANALYZE')
+        logger.info("Reanalyzing emulator iteration %i using saved "
+                    "implausibility values." % (emul_i))
+
+        # Open hdf5-file
+        with self._File('r', None) as file:
+            # Obtain the data group of this iteration
+            data_set = file['%i' % (emul_i)]
+
+            # Check if implausibility values were saved for this iteration
+            # An iteration that is not analyzed cannot have any saved values
+            if('impl_vals' not in data_set or
+               not self._n_eval_sam[emul_i]):
+                err_msg = ("Emulator iteration %i has no saved implausibility "
+                           "values. Reanalysis using these values is not "
+                           "possible." % (emul_i))
+                raise_error(err_msg, RequestError, logger)
+
+            # Obtain the saved samples, implausibility values and weights
+            sam_set_d = data_set['impl_vals_sam']
+            impl_vals_d = data_set['impl_vals']
+            weights_d = data_set['impl_vals_weights']
+            n_sam, n_top = impl_vals_d.shape
+
+            # Check if enough implausibility values were saved per sample
+            n_cut = min(self._cut_idx[emul_i]+len(self._impl_cut[emul_i]),
+                        self._emulator._n_data_tot[emul_i])
+            if(n_top < n_cut):
+                err_msg = ("Emulator iteration %i only has the %i highest "
+                           "implausibility values saved per sample, while the"
+                           " provided implausibility parameters require %i. "
+                           "Reanalysis using these values is not possible."
+                           % (emul_i, n_top, n_cut))
+                raise_error(err_msg, RequestError, logger)
+
+            # Determine the number of samples that are checked at once
+            chunk_size = self._analyze_chunk_size
+            if not chunk_size:
+                chunk_size = max(n_sam, 1)
+
+            # Check all saved samples in chunks
+            impl_sam = [np.empty([0, self._modellink._n_par])]
+            impl_weight = 0
+            for k in range(0, n_sam, chunk_size):
+                # Perform implausibility cutoff check on this chunk
+                impl_check = self._do_impl_check(
+                    emul_i, impl_vals_d[k:k+chunk_size])[0]
+
+                # Obtain the samples in this chunk that are plausible
+                sam_set = sam_set_d[k:k+chunk_size]
+                sam_set.dtype = float
+                impl_sam.append(sam_set[impl_check])
+
+                # Add the importance weights of these samples to the total
+                impl_weight += weights_d[k:k+chunk_size][impl_check].sum()
+
+        # Combine all plausible samples
+        impl_sam = np.concatenate(impl_sam, axis=0)
+        n_impl_sam = len(impl_sam)
+
+        # Check if enough plausible samples were found
+        self._check_n_impl_sam(n_impl_sam, logger)
+
+        # Save the results together with the impl_par that were used
+        par_space_rem = impl_weight/self._n_eval_sam[emul_i]
+        self._save_data({
+            'impl_par': {
+                'impl_cut': self._impl_cut[emul_i],
+                'cut_idx': self._cut_idx[emul_i]},
+            'impl_sam': impl_sam,
+            'par_space_rem': par_space_rem})
+
+        # Save statistics about reanalyze time and par_space
+        time_diff_total = time()-start_time
+        par_space_rem *= 100
+        self._save_statistics(emul_i, {
+            'tot_analyze_time': ['%.2f' % (time_diff_total), 's'],
+            'par_space_remaining': ['%#.3g' % (par_space_rem), '%']})
+
+        # Log that reanalysis has been finished
+        msg1 = ("Finished reanalysis of emulator iteration in %.2f seconds."
+                % (time_diff_total))
+        msg2 = ("There is %#.3g%% of parameter space remaining."
+                % (par_space_rem))
+        logger.info(msg1)
+        logger.info(msg2)
+        print(msg1)
+        print(msg2)
+
     # %% VISIBLE CLASS METHODS
     # This function analyzes the emulator and determines the plausible regions
-    def analyze(self, *, impl_cut=None):
+    @pool_hdf5_files
+    def analyze(self, *, impl_cut=None, reuse_impl_vals=False):
         """
         Analyzes the emulator at the last emulator iteration for a large number
         of emulator evaluation samples. All samples that survive the
         implausibility checks set by the provided `impl_cut`, are used in the
         construction of the next emulator iteration.
+        If :attr:`~analyze_chunk_size` is smaller than the number of emulator
+        evaluation samples, the samples are generated and analyzed in chunks,
+        and the plausible samples of every chunk are appended to the HDF5-file.
 
         Optional
         --------
@@ -2276,6 +3691,13 @@ class Pipeline(Projection, object):
             (:attr:`~impl_cut`) will be used if this is the first analysis or
             the 'impl_cut' value in :attr:`~prism_dict` is used if this is a
             reanalysis.
+        reuse_impl_vals : bool. Default: False
+            Whether or not to reanalyze the emulator using the univariate
+            implausibility values that were saved during the previous analysis
+            of this emulator iteration (see :attr:`~n_saved_impl_vals`),
+            instead of evaluating the emulator for a new evaluation sample set.
+            This allows for quickly changing the implausibility parameters of
+            an emulator iteration.
 
         Generates
         ---------
@@ -2315,81 +3737,234 @@ class Pipeline(Projection, object):
             # Save current time
             start_time1 = time()
 
+            # Save the current impl_par in case the reanalysis fails
+            impl_par = (list(self._impl_cut), list(self._cut_idx))
+
             # Set the impl_cut list if analyzed before or impl_cut is not None
             # This is to keep the impl_par set by the user if initial analyze
             if impl_cut is not None or self._n_eval_sam[emul_i]:
                 self._set_impl_par(impl_cut)
 
-            # Save impl_par to hdf5
-            self._save_data({
-                'impl_par': {
-                    'impl_cut': self._impl_cut[emul_i],
-                    'cut_idx': self._cut_idx[emul_i]}})
+            # Save impl_par to hdf5 if the emulator is evaluated
+            # A reanalysis only saves it after it has finished
+            if not reuse_impl_vals:
+                self._save_data({
+                    'impl_par': {
+                        'impl_cut': self._impl_cut[emul_i],
+                        'cut_idx': self._cut_idx[emul_i]}})
+
+            # Determine the number of evaluation samples analyzed at once
+            n_eval_sam = self._get_n_eval_sam(emul_i)
+            chunk_size = self._analyze_chunk_size
+            if not chunk_size or (chunk_size > n_eval_sam):
+                chunk_size = n_eval_sam
+
+        # Remaining workers get dummy values
+        else:
+            n_eval_sam = None
+            chunk_size = None
 
-            # Create an emulator evaluation sample set
-            eval_sam_set = self._get_eval_sam_set(emul_i)
-            n_eval_sam = eval_sam_set.shape[0]
+        # If requested, reanalyze using the saved implausibility values
+        if reuse_impl_vals:
+            # Controller determines the plausible samples from these values
+            if self._is_controller:
+                try:
+                    self._reanalyze_impl_vals(emul_i, start_time1)
+                # If this is not possible, restore the previous impl_par
+                except RequestError:
+                    self._impl_cut[:], self._cut_idx[:] = impl_par
+                    raise
+
+            # Display details about current state of pipeline
+            self.details()
+            return
 
-        # Remaining workers get dummy eval_sam_set
+        # Controller obtains the proposal region of the evaluation sample set
+        if self._is_controller:
+            proposal = self._get_eval_proposal(emul_i)
         else:
-            eval_sam_set = []
+            proposal = None
+
+        # Broadcast n_eval_sam and chunk_size to workers
+        n_eval_sam, chunk_size = self._comm.bcast((n_eval_sam, chunk_size), 0)
+
+        # Determine the number of chunks the evaluation sample set is split in
+        n_chunks = int(np.ceil(n_eval_sam/chunk_size))
 
-        # Broadcast eval_sam_set to workers
-        eval_sam_set = self._comm.bcast(eval_sam_set, 0)
+        # If the sample set is streamed, start the stream of impl_sam chunks
+        if(n_chunks > 1 and self._is_controller):
+            self._save_data({'impl_sam_chunk': None})
+            n_impl_sam = 0
 
-        # Save current time again
-        start_time2 = time()
+        # If no impl_vals are saved, remove those of the previous analysis
+        if(not self._n_saved_impl_vals and self._is_controller):
+            self._save_data({'impl_vals': None})
 
-        # Analyze eval_sam_set
-        impl_sam = self._evaluate_sam_set(emul_i, eval_sam_set, 'analyze')
+        # If the sample set is distributed, workers require the impl_par
+        if self._distribute_eval_sam:
+            # Controller sends the impl_par and proposal region to the workers
+            if self._is_controller:
+                impl_par = (self._impl_cut, self._cut_idx, proposal)
+            else:
+                impl_par = None
+            self._impl_cut, self._cut_idx, proposal =\
+                self._comm.bcast(impl_par, 0)
+
+        # Initialize the evaluation time and statistics
+        time_diff_eval = 0
+        eval_stats = [0, 0, 0]
+
+        # Loop over all chunks of the evaluation sample set
+        for c in range(n_chunks):
+            # Determine the number of samples in this chunk
+            n_chunk_sam = min(chunk_size, n_eval_sam-c*chunk_size)
+
+            # If requested, every MPI rank analyzes its own slice of the chunk
+            if self._distribute_eval_sam:
+                # Controller creates the seed that is shared by all MPI ranks
+                seed = randint(2**31) if self._is_controller else None
+                seed = self._comm.bcast(seed, 0)
+
+                # Create the slice of this MPI rank
+                eval_sam_set = self._get_eval_sam_set(emul_i, n_chunk_sam,
+                                                      seed, proposal)
+
+                # Save current time again
+                start_time2 = time()
+
+                # Analyze the slice and gather all plausible samples
+                impl_sam, impl_vals = self._analyze_sam_slice(emul_i,
+                                                              eval_sam_set)
+                impl_sam = self._comm.gather(impl_sam, 0)
+                impl_vals = self._comm.gather(impl_vals, 0)
+                if self._is_controller:
+                    impl_sam = np.concatenate(impl_sam, axis=0)
+
+                    # Combine the saved impl_vals of all MPI ranks
+                    impl_vals = [vals for vals in impl_vals
+                                 if vals is not None]
+                    impl_vals = (tuple(map(np.concatenate, zip(*impl_vals)))
+                                 if impl_vals else None)
+
+            # Else, controller creates the entire chunk
+            else:
+                if self._is_controller:
+                    eval_sam_set = self._get_eval_sam_set(
+                        emul_i, n_chunk_sam, proposal=proposal)
+
+                # Remaining workers get dummy eval_sam_set
+                else:
+                    eval_sam_set = []
+
+                # Broadcast eval_sam_set to workers
+                eval_sam_set = self._comm.bcast(eval_sam_set, 0)
+
+                # Save current time again
+                start_time2 = time()
+
+                # Analyze eval_sam_set, saving the impl_vals if requested
+                if self._n_saved_impl_vals:
+                    impl_sam, impl_vals = self._evaluate_sam_set(
+                        emul_i, eval_sam_set, 'analyze_impl')
+                else:
+                    impl_sam = self._evaluate_sam_set(emul_i, eval_sam_set,
+                                                      'analyze')
+                    impl_vals = None
+
+            # Add the evaluation time and statistics of this chunk
+            time_diff_eval += time()-start_time2
+            eval_stats = [a+b for a, b in zip(eval_stats, self._eval_stats)]
+
+            # If requested, controller saves the impl_vals of this chunk
+            if(self._n_saved_impl_vals and self._is_controller):
+                # Use empty sets if no samples reached the last iteration
+                if impl_vals is None:
+                    impl_vals = (
+                        np.empty([0, self._modellink._n_par]),
+                        self._get_top_impl_vals(np.empty(
+                            [0, self._emulator._n_data_tot[emul_i]])))
+
+                # Add the importance weights of the samples in the impl_vals
+                if proposal is None:
+                    weights = np.ones(impl_vals[0].shape[0])
+                else:
+                    weights = proposal.get_weights(impl_vals[0])
+                impl_vals = (*impl_vals, weights)
+
+                # Save the impl_vals, appending them if this is not the first
+                self._save_data({
+                    'impl_vals_chunk' if c else 'impl_vals': impl_vals})
+
+            # If the sample set is streamed, controller saves this chunk
+            if(n_chunks > 1 and self._is_controller):
+                # Append the plausible samples of this chunk to the stream
+                self._save_data({'impl_sam_chunk': impl_sam})
+                n_impl_sam += len(impl_sam)
+
+                # Log and print the progress of the analysis
+                msg = ("Analyzed chunk %i/%i of the emulator evaluation "
+                       "sample set, with %i plausible samples found so far."
+                       % (c+1, n_chunks, n_impl_sam))
+                logger.info(msg)
+                print(msg)
+
+        # If the sample set was streamed, replace impl_sam with the stream
+        if(n_chunks > 1 and self._is_controller):
+            self._save_data({'impl_sam': None})
+            impl_sam = self._impl_sam
+
+        # Save the combined evaluation statistics of this MPI rank
+        self._eval_stats = tuple(eval_stats)
+
+        # Gather the evaluation statistics of all MPI ranks
+        eval_times = self._comm.gather(self._eval_stats[0], 0)
+        n_evals_saved = self._comm.reduce(self._eval_stats[2], root=0)
+
+        # Save the measured evaluation costs and rejection powers
+        # Those measured by replicas are first added to the emulator systems
+        self._emulator._merge_replicas()
+        self._emulator._save_eval_cost()
+        self._emulator._save_reject_power()
 
         # Controller finishing up
         if self._is_controller:
             # Obtain some timers
             end_time = time()
             time_diff_total = end_time-start_time1
-            time_diff_eval = end_time-start_time2
 
             # Calculate the number of plausible samples left
             n_impl_sam = len(impl_sam)
 
-            # Raise warning if no plausible samples were found
-            if not n_impl_sam:
-                warn_msg = ("No plausible regions were found. Constructing the"
-                            " next iteration will not be possible.")
-                raise_warning(warn_msg, RequestWarning, logger, 2)
-
-            # Raise warning if n_impl_sam is less than n_cross_val
-            elif(n_impl_sam < self._emulator._n_cross_val):
-                warn_msg = ("Number of plausible samples is lower than the "
-                            "number of cross validations used during "
-                            "regression (%i < %i). Constructing the next "
-                            "iteration will not be possible."
-                            % (n_impl_sam, self._emulator._n_cross_val))
-                raise_warning(warn_msg, RequestWarning, logger, 2)
-
-            # Raise warning if n_impl_sam is less than n_sam_init
-            elif(n_impl_sam < self._emulator._n_sam[1]):
-                warn_msg = ("Number of plausible samples is lower than the "
-                            "number of samples in the first iteration (%i < "
-                            "%i). Constructing the next iteration might not "
-                            "produce a more accurate emulator."
-                            % (n_impl_sam, self._emulator._n_sam[1]))
-                raise_warning(warn_msg, RequestWarning, logger, 2)
+            # Check if enough plausible samples were found
+            self._check_n_impl_sam(n_impl_sam, logger)
+
+            # Determine the fraction of par_space that is still plausible
+            # If a proposal region is used, the samples are importance weighted
+            if proposal is None:
+                par_space_rem = n_impl_sam/n_eval_sam
+            else:
+                par_space_rem = proposal.get_weights(impl_sam).sum()/n_eval_sam
 
             # Save the results
+            if(n_chunks == 1):
+                self._save_data({'impl_sam': impl_sam})
             self._save_data({
-                'impl_sam': impl_sam,
-                'n_eval_sam': n_eval_sam})
+                'n_eval_sam': n_eval_sam,
+                'par_space_rem': par_space_rem})
 
             # Save statistics about analyze time, evaluation rate, par_space
+            # The MPI efficiency is the fraction of time the ranks evaluated
             avg_eval_rate = n_eval_sam/time_diff_eval
-            par_space_rem = (n_impl_sam/n_eval_sam)*100
+            par_space_rem *= 100
+            mpi_eff = (sum(eval_times)/(self._size*time_diff_eval))*100
             self._save_statistics(emul_i, {
                 'tot_analyze_time': ['%.2f' % (time_diff_total), 's'],
                 'avg_emul_eval_rate': ['%.2f' % (avg_eval_rate), '1/s'],
                 'par_space_remaining': ['%#.3g' % (par_space_rem), '%'],
-                'MPI_comm_size_anal': ['%i' % (self._size), '']})
+                'MPI_comm_size_anal': ['%i' % (self._size), ''],
+                'MPI_anal_efficiency': ['%#.3g' % (mpi_eff), '%'],
+                'MPI_anal_sam_dist_iter': ['%i' % (self._eval_stats[1]), ''],
+                'n_emul_evals_saved': ['%i' % (n_evals_saved), '']})
 
             # Log that analysis has been finished
             msg1 = ("Finished analysis of emulator iteration in %.2f seconds, "
@@ -2402,6 +3977,11 @@ class Pipeline(Projection, object):
             print(msg1)
             print(msg2)
 
+            # Log how many emulator system evaluations were saved
+            if(self._n_eval_groups > 1):
+                logger.info("Early rejection saved %i emulator system "
+                            "evaluations." % (n_evals_saved))
+
         # Display details about current state of pipeline
         self.details()
 
@@ -2560,10 +4140,11 @@ class Pipeline(Projection, object):
                             logger.info("Creating initial model evaluation "
                                         "sample set of size %i."
                                         % (n_sam_init))
-                            add_sam_set =\
-                                lhd(n_sam_init, self._modellink._n_par,
-                                    self._modellink._par_rng, 'center',
-                                    self._criterion, constraints=ext_sam_set)
+                            add_sam_set = get_sam_set(
+                                self._init_sampler, n_sam_init,
+                                self._modellink._par_rng, method='center',
+                                criterion=self._criterion,
+                                constraints=ext_sam_set)
                             logger.info("Finished creating initial sample "
                                         "set.")
                         else:
@@ -2633,7 +4214,9 @@ class Pipeline(Projection, object):
             # Save that emulator iteration has not been analyzed yet
             self._save_data({
                 'impl_sam': np_array([]),
-                'n_eval_sam': 0})
+                'n_eval_sam': 0,
+                'par_space_rem': 0,
+                'impl_vals': None})
             self._set_impl_par(None)
 
             # Log that construction has been completed
@@ -2736,6 +4319,10 @@ class Pipeline(Projection, object):
             The total number of emulator systems that are required in this
             emulator. The number of active emulator systems is equal to the
             number of data points.
+        Polynomial terms cache size
+            The total amount of memory used on all MPI ranks for caching the
+            polynomial terms of the model evaluation samples of all emulator
+            systems. Only printed if regression is used.
 
         ----
 
@@ -2770,6 +4357,10 @@ class Pipeline(Projection, object):
         # Gather ccheck information on the controller
         ccheck_list = self._comm.gather(self._emulator._ccheck[emul_i], 0)
 
+        # Gather the sizes of the polynomial terms caches on the controller
+        poly_cache_size = self._comm.gather(
+            self._emulator._get_sam_set_poly_size(), 0)
+
         # Controller generating the entire details overview
         if self._is_controller:
             # Flatten the received ccheck_list
@@ -2931,8 +4522,7 @@ class Pipeline(Projection, object):
                         self._n_impl_sam[emul_i], self._n_eval_sam[emul_i]))
                     print("{0: <{1}}\t{2:#.3%}".format(
                         "% of parameter space remaining", width,
-                        (self._n_impl_sam[emul_i] /
-                         self._n_eval_sam[emul_i])))
+                        self._par_space_rem[emul_i]))
                 print("{0: <{1}}\t{2}/{3}".format(
                     "# of active/total parameters", width,
                     n_active_par, n_par))
@@ -2940,6 +4530,10 @@ class Pipeline(Projection, object):
                                               width, n_data))
                 print("{0: <{1}}\t{2}".format("# of emulator systems",
                                               width, n_emul_s))
+                if self._emulator._method in ('regression', 'full'):
+                    print("{0: <{1}}\t{2:#.3g} MiB".format(
+                        "Polynomial terms cache size", width,
+                        sum(poly_cache_size)/2**20))
 
             # If not, print which components are still missing
             else:
@@ -3063,7 +4657,7 @@ class Pipeline(Projection, object):
             samples are still within the plausible region of the emulator.
         adj_exp_val : 2D :obj:`~numpy.ndarray` object
             Array containing the adjusted expectation values for all given
-            samples.
+            samples, ordered on the global indices of the emulator systems.
         adj_var_val : 2D :obj:`~numpy.ndarray` object
             Array containing the adjusted variance values for all given
             samples.
@@ -3133,6 +4727,11 @@ class Pipeline(Projection, object):
         # Analyze sam_set
         results = self._evaluate_sam_set(emul_i, sam_set, 'evaluate')
 
+        # Gather the active emulator systems of every iteration on all ranks
+        emul_s_list = self._comm.gather(
+            [[self._emulator._emul_s[j] for j in active_emul_s]
+             for active_emul_s in self._emulator._active_emul_s], 0)
+
         # Do more logging
         logger.info("Finished evaluating emulator.")
 
@@ -3142,6 +4741,17 @@ class Pipeline(Projection, object):
             adj_exp_val, adj_var_val, uni_impl_val, emul_i_stop, impl_check =\
                 results
 
+            # Determine the global emulator system order of every iteration
+            # Results are gathered per rank, which depends on the system costs
+            sort_idx = [np.argsort(sum(emul_s_seq, [])) for emul_s_seq in
+                        zip(*emul_s_list)]
+
+            # Put the data values of every sample in this order
+            for j, i in enumerate(emul_i_stop):
+                adj_exp_val[j] = adj_exp_val[j][sort_idx[i]]
+                adj_var_val[j] = adj_var_val[j][sort_idx[i]]
+                uni_impl_val[j] = uni_impl_val[j][sort_idx[i]]
+
             # If print_output is True, print the results
             if print_output:
                 # Convert sam_set to a dict for printing purposes
@@ -3181,6 +4791,163 @@ class Pipeline(Projection, object):
     def run(self, emul_i=None, *, force=False):
         self(emul_i, force=force)
 
+    # This function updates the last emulator iteration with new realizations
+    @docstring_substitute(ext_set=ext_real_set_doc_s)
+    def update(self, ext_real_set, *, update_regr=False, analyze=True):
+        """
+        Updates the last constructed emulator iteration with an externally
+        provided set of additional model realizations, without reconstructing
+        the entire iteration.
+
+        Parameters
+        ----------
+        %(ext_set)s
+
+        Optional
+        --------
+        update_regr : bool. Default: False
+            Whether or not to redo the regression process of all emulator
+            systems using all model evaluation samples, which requires the
+            covariance matrices to be recalculated as well.
+            If *False*, the existing regression functions are kept fixed and
+            the decompositions of the covariance matrices are only extended
+            with the additional samples, which is much faster.
+        analyze : bool. Default: True
+            Bool indicating whether or not to perform an analysis after the
+            emulator iteration has been successfully updated, which is required
+            for constructing the next iteration.
+
+        Notes
+        -----
+        Only the last emulator iteration can be updated, since the analysis of
+        an iteration determines the model evaluation samples of the next.
+        The active parameters of the emulator systems are never redetermined.
+
+        The provided samples must lie within parameter space and cannot be
+        equal to each other or to any of the known model evaluation samples.
+        As they are provided externally, the iteration is always marked as
+        having used an external model realization set afterward (see
+        :meth:`~details`).
+        Any projections that were made of this iteration are removed, as they
+        no longer describe the updated emulator.
+
+        """
+
+        # Log that the emulator iteration is being updated
+        logger = getCLogger('UPDATE')
+
+        # Obtain the last emulator iteration
+        emul_i = self._emulator._emul_i
+
+        # Check if this iteration has been fully constructed on all ranks
+        ccheck_flag = int(not emul_i or
+                          len(self._emulator._ccheck) != emul_i+1 or
+                          any(self._emulator._ccheck[emul_i]))
+        if self._comm.allreduce(ccheck_flag, op=MPI.MAX):
+            err_msg = ("Updating an emulator iteration is only possible if it "
+                       "is the last iteration and has been fully constructed!")
+            raise_error(err_msg, RequestError, logger)
+
+        # Controller processing the provided model realizations
+        if self._is_controller:
+            # Save current time
+            start_time = time()
+
+            # Check if update_regr-parameter and analyze-parameter are bools
+            update_regr = check_vals(update_regr, 'update_regr', 'bool')
+            analyze = check_vals(analyze, 'analyze', 'bool')
+
+            # Process ext_real_set
+            ext_sam_set, ext_mod_set = self._get_ext_real_set(ext_real_set)
+
+            # Check if any model realizations were provided
+            if not ext_sam_set.shape[0]:
+                err_msg = ("Input argument 'ext_real_set' must contain at "
+                           "least one model evaluation sample!")
+                raise_error(err_msg, ValueError, logger)
+
+            # Check if all provided samples are unique
+            if(np.unique(ext_sam_set, axis=0).shape[0] !=
+               ext_sam_set.shape[0]):
+                err_msg = ("Input argument 'ext_real_set' cannot contain "
+                           "duplicate model evaluation samples!")
+                raise_error(err_msg, ValueError, logger)
+
+            # Check if none of the provided samples are already known
+            sam_set = self._emulator._sam_set[emul_i]
+            if (ext_sam_set[:, np.newaxis] == sam_set).all(axis=-1).any():
+                err_msg = ("Input argument 'ext_real_set' cannot contain "
+                           "model evaluation samples that are already used "
+                           "in emulator iteration %i!" % (emul_i))
+                raise_error(err_msg, ValueError, logger)
+            logger.info("Updating emulator iteration %i with %i additional "
+                        "model realizations." % (emul_i, ext_sam_set.shape[0]))
+
+            # Flatten the corresponding data_idx_to_core
+            data_idx_flat = []
+            n_data = []
+            for data_idx_rank in self._emulator._data_idx_to_core[emul_i]:
+                data_idx_rank = delist(data_idx_rank)
+                data_idx_flat.extend(data_idx_rank)
+                n_data.append(len(data_idx_rank))
+
+            # Sort ext_mod_set accordingly to data_idx_flat
+            sort_idx = [self._modellink._data_idx.index(idx)
+                        for idx in data_idx_flat]
+            ext_mod_set = ext_mod_set[sort_idx]
+
+            # Determine what data needs to go to what rank
+            disps = np.cumsum([0, *n_data[:-1]])
+            idx = [np.arange(disp, disp+i) for i, disp in zip(n_data, disps)]
+            mod_set_list = [ext_mod_set[i] for i in idx]
+
+            # Sent the specific mod_set parts to the corresponding workers
+            sam_set = self._comm.bcast(ext_sam_set, 0)
+            mod_set = self._comm.scatter(mod_set_list, 0)
+            update_regr, analyze = self._comm.bcast((update_regr, analyze), 0)
+
+        # Workers waiting for controller to send them their data values
+        else:
+            sam_set = self._comm.bcast(None, 0)
+            mod_set = self._comm.scatter(None, 0)
+            update_regr, analyze = self._comm.bcast(None, 0)
+
+        # Update emulator iteration
+        self._emulator._update_iteration(emul_i, sam_set, mod_set, update_regr)
+
+        # Controller finishing up update process
+        if self._is_controller:
+            # Save that emulator iteration has not been analyzed yet
+            self._save_data({
+                'impl_sam': np_array([]),
+                'n_eval_sam': 0,
+                'par_space_rem': 0,
+                'impl_vals': None})
+            self._set_impl_par(None)
+
+            # Remove all projections of this iteration, as they are outdated
+            with self._File('r+', None) as file:
+                if 'proj_hcube' in file['%i' % (emul_i)]:
+                    logger.info("Removing outdated projections of emulator "
+                                "iteration %i." % (emul_i))
+                    del file['%i/proj_hcube' % (emul_i)]
+
+            # Log that updating has been completed
+            time_diff_total = time()-start_time
+            self._save_statistics(emul_i, {
+                'tot_update_time': ['%.2f' % (time_diff_total), 's']})
+            msg = ("Finished update of emulator iteration in %.2f seconds."
+                   % (time_diff_total))
+            logger.info(msg)
+            print(msg)
+
+        # Analyze the emulator iteration if requested
+        if analyze:
+            self.analyze()
+        # If not, show details
+        else:
+            self.details(emul_i)
+
 
 # %% SUPPORT CLASSES
 # Define a worker mode context manager
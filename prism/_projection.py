@@ -20,7 +20,6 @@ from time import time
 # Package imports
 from e13tools import InputError
 from e13tools.pyplot import draw_textline
-from e13tools.sampling import lhd
 from e13tools.utils import (
     docstring_append, docstring_copy, docstring_substitute, raise_error,
     raise_warning, split_seq)
@@ -41,6 +40,7 @@ from prism._docstrings import (
 from prism._gui import start_gui as _start_gui
 from prism._internal import (
     RequestError, RequestWarning, check_vals, getCLogger, np_array)
+from prism._sampling import get_sam_set
 
 # All declaration
 __all__ = ['Projection']
@@ -1090,10 +1090,10 @@ class Projection(object):
             proj_sam_set = np.linspace(*self._modellink._par_rng[par],
                                        self.__proj_res)
 
-            # Generate latin hypercube of the remaining parameters
-            hidden_sam_set = lhd(depth, self.__n_par-1,
-                                 self._modellink._par_rng[par_hid], 'fixed',
-                                 self._criterion)
+            # Generate sample set of the remaining parameters
+            hidden_sam_set = get_sam_set(
+                self._proj_sampler, depth, self._modellink._par_rng[par_hid],
+                method='fixed', criterion=self._criterion)
 
             # Fill every cell in the projection hypercube accordingly
             for i in range(self.__proj_res):
@@ -1120,10 +1120,11 @@ class Projection(object):
             proj_sam_set2 = np.linspace(*self._modellink._par_rng[par2],
                                         self.__proj_res)
 
-            # Generate Latin Hypercube of the remaining parameters
-            hidden_sam_set = lhd(self.__proj_depth, self.__n_par-2,
-                                 self._modellink._par_rng[par_hid], 'fixed',
-                                 self._criterion)
+            # Generate sample set of the remaining parameters
+            hidden_sam_set = get_sam_set(
+                self._proj_sampler, self.__proj_depth,
+                self._modellink._par_rng[par_hid], method='fixed',
+                criterion=self._criterion)
 
             # Fill every cell in the projection hypercube accordingly
             for i in range(self.__proj_res):
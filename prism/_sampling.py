@@ -0,0 +1,740 @@
+# -*- coding: utf-8 -*-
+
+"""
+Sampling
+========
+Contains the space-filling samplers that are used by the
+:class:`~prism.Pipeline` class for creating model evaluation, emulator
+evaluation and projection sample sets.
+
+Every sampler is a function with the signature ``sampler(n_sam, val_rng, *,
+method, criterion, iterations, constraints)``, which returns a 2D
+:obj:`~numpy.ndarray` object of `n_sam` samples within the value ranges
+`val_rng`. Custom samplers that use this signature can be provided directly
+wherever the name of a built-in sampler is accepted.
+
+Emulator evaluation sample sets can additionally be restricted to a proposal
+region around the plausible samples of the previous emulator iteration (see
+:obj:`~PROPOSALS`). Every proposal region provides the importance weights of
+its samples, which are used for estimating the fraction of parameter space
+that is plausible. This estimate is only unbiased if the proposal region
+covers the entire plausible region of parameter space, as plausible parts
+outside of it are never sampled and are therefore not counted.
+
+"""
+
+
+# %% IMPORTS
+# Built-in imports
+import abc
+from math import gamma
+import warnings
+
+# Package imports
+from e13tools.sampling import lhd
+from e13tools.utils import raise_error
+import numpy as np
+from numpy.random import rand, randint, randn
+from scipy.spatial import cKDTree
+from scipy.spatial.distance import cdist
+from scipy.stats import qmc
+
+# PRISM imports
+from prism._internal import getRLogger
+
+# All declaration
+__all__ = ['PROPOSALS', 'SAMPLERS', 'check_proposal', 'check_sampler',
+           'get_proposal', 'get_sam_set', 'get_sam_set_slice']
+
+
+# %% FUNCTION DEFINITIONS
+# This function creates a Latin Hypercube Design using e13Tools
+def _sample_lhd(n_sam, val_rng, *, method, criterion, iterations,
+                constraints):
+    """
+    Returns a Latin Hypercube Design created by the
+    :func:`~e13tools.sampling.lhd` function, which optimizes the design for the
+    given `criterion` using `iterations` iterations.
+
+    """
+
+    return(lhd(n_sam, val_rng.shape[0], val_rng, method, criterion,
+               iterations, constraints=constraints))
+
+
+# This function creates a Latin Hypercube Design optimized using a KD-tree
+def _sample_lhd_kdtree(n_sam, val_rng, *, method, criterion, iterations,
+                       constraints):
+    """
+    Returns a Latin Hypercube Design that is optimized for the maximin
+    criterion using nearest-neighbour distances obtained from a KD-tree.
+
+    The nearest-neighbour distances of all samples are calculated once. In
+    every one of at most `iterations` rounds, the samples with the smallest
+    distances then exchange a value with randomly chosen other samples, which
+    keeps the design a Latin Hypercube. An exchange is only kept if it
+    increases the minimum of the nearest-neighbour distances of the pair of
+    samples involved, so the distance of one of them may still decrease.
+    Only the distances of samples near the exchanged samples are updated.
+    As a round only involves a small number of samples, this scales to much
+    larger sample sets than :func:`~e13tools.sampling.lhd`, at the cost of a
+    less thoroughly optimized design.
+    The provided `criterion` is ignored.
+
+    """
+
+    # Obtain the number of values every sample has
+    n_val = val_rng.shape[0]
+
+    # Create the strata that every value of a sample is in
+    sam_set = np.argsort(rand(n_val, n_sam), axis=1).T.astype(float)
+
+    # Place the samples within their strata according to method
+    if method.lower() in ('fixed', 'f') and (n_sam > 1):
+        sam_set /= n_sam-1
+    elif method.lower() in ('random', 'r'):
+        sam_set = (sam_set+rand(n_sam, n_val))/n_sam
+    else:
+        sam_set = (sam_set+0.5)/n_sam
+
+    # Convert constraints to the unit hypercube
+    if constraints is not None and np.size(constraints):
+        constraints = np.array(constraints, ndmin=2)
+        constraints = (constraints-val_rng[:, 0])/(val_rng[:, 1]-val_rng[:, 0])
+        constraints = constraints[np.all((constraints >= 0) &
+                                         (constraints <= 1), axis=1)]
+        con_tree = cKDTree(constraints) if len(constraints) else None
+    else:
+        con_tree = None
+
+    # Determine how many samples try to exchange a value in every round
+    n_swap = min(max(1, n_sam//100), 1000, n_sam//2) if(n_val > 1) else 0
+    if not n_swap:
+        iterations = 0
+
+    # Obtain the nearest-neighbour distances of all samples
+    tree = cKDTree(sam_set)
+    nn_dist = tree.query(sam_set, k=2, workers=-1)[0][:, 1]
+    if con_tree is not None:
+        nn_dist = np.minimum(nn_dist, con_tree.query(sam_set, workers=-1)[0])
+
+    # Keep track of which samples moved since the KD-tree was built
+    stale = np.zeros(n_sam, dtype=bool)
+
+    # Optimize the design for at most the given number of rounds
+    for _ in range(iterations):
+        # Select the samples with the smallest distances
+        worst = np.argpartition(nn_dist, n_swap-1)[:n_swap]
+
+        # Select random different partners and values to exchange
+        others = np.setdiff1d(np.arange(n_sam), worst, assume_unique=True)
+        partners = others[randint(len(others), size=n_swap)]
+        partners, idx = np.unique(partners, return_index=True)
+        worst = worst[idx]
+        val_idx = randint(n_val, size=len(worst))
+
+        # Create the trial samples with exchanged values
+        trial_w = sam_set[worst]
+        trial_p = sam_set[partners]
+        trial_w[np.arange(len(worst)), val_idx] = sam_set[partners, val_idx]
+        trial_p[np.arange(len(worst)), val_idx] = sam_set[worst, val_idx]
+        moved = np.concatenate([worst, partners])
+        pairs = np.stack([moved, np.concatenate([partners, worst])], axis=1)
+        trials = np.concatenate([trial_w, trial_p])
+
+        # Obtain the distances of the trial samples to all other samples
+        # The current positions of both samples in an exchange are ignored
+        dist, nbrs = tree.query(trials, k=min(n_sam, 8))
+        dist[stale[nbrs] | (nbrs[:, :, np.newaxis] ==
+                            pairs[:, np.newaxis]).any(axis=2)] = np.inf
+        trial_dist = dist.min(axis=1)
+
+        # Samples that moved since the KD-tree was built are compared directly
+        stale_idx = np.nonzero(stale)[0]
+        if len(stale_idx):
+            stale_dist = cdist(trials, sam_set[stale_idx])
+            stale_dist[(stale_idx == pairs[:, [0]]) |
+                       (stale_idx == pairs[:, [1]])] = np.inf
+            trial_dist = np.minimum(trial_dist, stale_dist.min(axis=1))
+
+        # All trial samples are compared with each other as well
+        trial_dist_all = cdist(trials, trials)
+        trial_dist_all[np.arange(len(moved)), np.arange(len(moved))] = np.inf
+        trial_dist_all[np.arange(len(moved)),
+                       np.roll(np.arange(len(moved)), len(worst))] = np.inf
+        trial_dist = np.minimum(trial_dist, trial_dist_all.min(axis=1))
+        if con_tree is not None:
+            trial_dist = np.minimum(trial_dist, con_tree.query(trials)[0])
+
+        # Only keep exchanges that increase the minimum distance of the pair
+        keep = (np.minimum(*np.split(trial_dist, 2)) >
+                np.minimum(nn_dist[worst], nn_dist[partners]))
+
+        # Stop if no exchange improves the design anymore
+        if not keep.any():
+            break
+
+        # Perform all improving exchanges
+        keep = np.concatenate([keep, keep])
+        sam_set[moved[keep]] = trials[keep]
+        nn_dist[moved[keep]] = trial_dist[keep]
+        stale[moved[keep]] = True
+
+        # Samples close to the new positions have smaller distances now
+        np.minimum.at(nn_dist, nbrs[keep].ravel(), dist[keep].ravel())
+        if len(stale_idx):
+            nn_dist[stale_idx] = np.minimum(nn_dist[stale_idx],
+                                            stale_dist[keep].min(axis=0))
+
+        # Rebuild the KD-tree if too many samples moved
+        if(stale.sum() > 4*n_swap):
+            tree = cKDTree(sam_set)
+            stale[:] = False
+
+    # Scale sam_set to val_rng and return it
+    return(val_rng[:, 0]+sam_set*(val_rng[:, 1]-val_rng[:, 0]))
+
+
+# This function creates a scrambled Sobol sequence
+def _sample_sobol(n_sam, val_rng, *, method, criterion, iterations,
+                  constraints):
+    """
+    Returns the first `n_sam` samples of a scrambled Sobol sequence.
+    The provided `method`, `criterion`, `iterations` and `constraints` are
+    ignored.
+
+    """
+
+    return(_sample_qmc('Sobol', n_sam, val_rng))
+
+
+# This function creates a scrambled Halton sequence
+def _sample_halton(n_sam, val_rng, *, method, criterion, iterations,
+                   constraints):
+    """
+    Returns the first `n_sam` samples of a scrambled Halton sequence.
+    The provided `method`, `criterion`, `iterations` and `constraints` are
+    ignored.
+
+    """
+
+    return(_sample_qmc('Halton', n_sam, val_rng))
+
+
+# This function creates a scrambled quasi-Monte Carlo sequence
+def _sample_qmc(engine, n_sam, val_rng, seed=None, start=0):
+    """
+    Returns `n_sam` samples of the scrambled quasi-Monte Carlo sequence created
+    by the provided :mod:`scipy.stats.qmc` `engine`, starting at sample
+    `start` and scaled to `val_rng`. If `seed` is *None*, the scrambling is
+    seeded by NumPy's global random state.
+
+    """
+
+    # Obtain the seed of the scrambling
+    if seed is None:
+        seed = randint(2**31)
+
+    # Create the sequence
+    # Sobol sequences warn if n_sam is not a power of 2, which is irrelevant
+    engine = getattr(qmc, engine)(val_rng.shape[0], scramble=True, seed=seed)
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', UserWarning)
+        if start:
+            engine.fast_forward(int(start))
+        sam_set = engine.random(n_sam)
+
+    # Scale sam_set to val_rng and return it
+    return(val_rng[:, 0]+sam_set*(val_rng[:, 1]-val_rng[:, 0]))
+
+
+# This function creates uniformly random samples
+def _sample_random(n_sam, val_rng, *, method, criterion, iterations,
+                   constraints):
+    """
+    Returns `n_sam` uniformly distributed random samples.
+    The provided `method`, `criterion`, `iterations` and `constraints` are
+    ignored.
+
+    """
+
+    return(val_rng[:, 0]+rand(n_sam, val_rng.shape[0]) *
+           (val_rng[:, 1]-val_rng[:, 0]))
+
+
+# Dict of all built-in samplers
+SAMPLERS = {
+    'lhd': _sample_lhd,
+    'lhd_kdtree': _sample_lhd_kdtree,
+    'sobol': _sample_sobol,
+    'halton': _sample_halton,
+    'random': _sample_random}
+
+
+# This function checks if a provided sampler is valid
+def check_sampler(sampler, name):
+    """
+    Checks if the provided `sampler` is either the name of a built-in sampler
+    in :obj:`~SAMPLERS` or a callable, and returns it if so.
+
+    Parameters
+    ----------
+    sampler : str or callable
+        The sampler that must be checked.
+    name : str
+        The name of the variable `sampler` belongs to.
+
+    Returns
+    -------
+    sampler : str or callable
+        The lowercase name of the built-in sampler or the provided callable.
+
+    """
+
+    # Make logger
+    logger = getRLogger('CHECK')
+
+    # If sampler is callable, it is valid
+    if callable(sampler):
+        return(sampler)
+
+    # Else, check if sampler is the name of a built-in sampler
+    elif isinstance(sampler, str) and sampler.lower() in SAMPLERS:
+        return(sampler.lower())
+
+    # If not, raise error
+    else:
+        err_msg = ("Input argument %r is invalid (%r)! Valid samplers are %s "
+                   "or any callable." % (name, sampler, list(SAMPLERS)))
+        raise_error(err_msg, ValueError, logger)
+
+
+# This function creates a sample set using the provided sampler
+def get_sam_set(sampler, n_sam, val_rng, *, method='center', criterion=None,
+                iterations=1000, constraints=None):
+    """
+    Creates a sample set of `n_sam` samples within the value ranges `val_rng`
+    using the provided `sampler`.
+
+    Parameters
+    ----------
+    sampler : str or callable
+        The name of the built-in sampler in :obj:`~SAMPLERS` to use, or a
+        custom sampler function.
+    n_sam : int
+        The number of samples to create.
+    val_rng : 2D array_like
+        The lower and upper bounds of every value in a sample.
+
+    Optional
+    --------
+    method : {'random'; 'fixed'; 'center'}. Default: 'center'
+        How the values of a Latin Hypercube Design are placed within their
+        strata.
+    criterion : float, {'maximin'; 'correlation'; 'multi'} or None. \
+        Default: None
+        The criterion used for optimizing the :func:`~e13tools.sampling.lhd`
+        designs.
+    iterations : int. Default: 1000
+        The maximum number of iterations used for optimizing a design.
+    constraints : 2D array_like or None. Default: None
+        Samples that the created samples should be spread out from.
+
+    Returns
+    -------
+    sam_set : 2D :obj:`~numpy.ndarray` object
+        Array containing the created samples.
+
+    """
+
+    # Obtain the sampler function
+    if not callable(sampler):
+        sampler = SAMPLERS[sampler]
+
+    # Create the sample set and return it
+    return(sampler(n_sam, np.array(val_rng, ndmin=2), method=method,
+                   criterion=criterion, iterations=iterations,
+                   constraints=constraints))
+
+
+# This function creates a slice of a sample set using the provided sampler
+def get_sam_set_slice(sampler, n_sam, val_rng, rank, size, seed, **kwargs):
+    """
+    Creates the slice of a sample set of `n_sam` samples within the value
+    ranges `val_rng` that belongs to MPI rank `rank` out of `size` MPI ranks,
+    using the provided `sampler`. Every MPI rank creates its own slice without
+    communicating, and the slices of all MPI ranks together form the sample
+    set.
+
+    For the 'sobol' and 'halton' samplers, the slices are consecutive parts of
+    the same sequence. For all other samplers, the range of the first value
+    is divided into strata proportional to the sizes of the slices, and every
+    slice is created within its own stratum.
+
+    Parameters
+    ----------
+    sampler : str or callable
+        The name of the built-in sampler in :obj:`~SAMPLERS` to use, or a
+        custom sampler function.
+    n_sam : int
+        The total number of samples in the sample set.
+    val_rng : 2D array_like
+        The lower and upper bounds of every value in a sample.
+    rank : int
+        The rank of the calling MPI process.
+    size : int
+        The total number of MPI processes.
+    seed : int
+        The seed that is shared by all MPI ranks.
+
+    Optional
+    --------
+    kwargs : dict
+        Keyword arguments that are passed to :func:`~get_sam_set`.
+
+    Returns
+    -------
+    sam_set : 2D :obj:`~numpy.ndarray` object
+        Array containing the samples in the slice of MPI rank `rank`.
+
+    """
+
+    # Determine the samples that belong to this MPI rank
+    val_rng = np.array(val_rng, ndmin=2, dtype=float)
+    sam_bounds = np.linspace(0, n_sam, size+1, dtype=int)
+    sam_lo, sam_hi = sam_bounds[rank:rank+2]
+
+    # If this slice has no samples, return an empty sample set
+    if(sam_lo == sam_hi):
+        return(np.empty([0, val_rng.shape[0]]))
+
+    # Create consecutive parts of the quasi-Monte Carlo sequences
+    if sampler in ('sobol', 'halton'):
+        return(_sample_qmc(sampler.capitalize(), sam_hi-sam_lo, val_rng, seed,
+                           sam_lo))
+
+    # Determine the stratum of the first value of this slice
+    slice_rng = val_rng.copy()
+    slice_rng[0] = val_rng[0, 0]+np.array([sam_lo, sam_hi])/n_sam*(
+        val_rng[0, 1]-val_rng[0, 0])
+
+    # Create the slice using a random state specific to this MPI rank
+    state = np.random.get_state()
+    np.random.seed((seed+rank) % 2**32)
+    try:
+        sam_set = get_sam_set(sampler, sam_hi-sam_lo, slice_rng, **kwargs)
+    finally:
+        np.random.set_state(state)
+
+    # Return it
+    return(sam_set)
+
+
+# %% CLASS DEFINITIONS
+# Define base class for all proposal regions
+class _Proposal(object, metaclass=abc.ABCMeta):
+    """
+    Abstract base class for the proposal regions in :obj:`~PROPOSALS`, which
+    are built around a set of plausible samples `impl_sam` within the value
+    ranges `val_rng`.
+
+    All proposal regions work in the unit hypercube, in which the value ranges
+    have a volume of unity. The importance weight of a sample is therefore the
+    inverse of the probability density of the proposal region at that sample.
+
+    """
+
+    def __init__(self, impl_sam, val_rng):
+        # Save the value ranges
+        self._val_rng = np.array(val_rng, ndmin=2, dtype=float)
+        self._n_val = self._val_rng.shape[0]
+
+        # Convert impl_sam to the unit hypercube
+        self._impl_sam = self._to_unit(np.array(impl_sam, ndmin=2))
+
+        # Determine the padding that is added around the plausible samples
+        # This is the average spacing between the plausible samples
+        self._f_pad = self._impl_sam.shape[0]**(-1/self._n_val)
+
+    # This function converts samples to the unit hypercube
+    def _to_unit(self, sam_set):
+        return((sam_set-self._val_rng[:, 0]) /
+               (self._val_rng[:, 1]-self._val_rng[:, 0]))
+
+    # This function converts samples from the unit hypercube
+    def _from_unit(self, sam_set):
+        return(self._val_rng[:, 0] +
+               sam_set*(self._val_rng[:, 1]-self._val_rng[:, 0]))
+
+    # This function creates a sample set within the proposal region
+    @abc.abstractmethod
+    def sample(self, sampler, n_sam, **kwargs):
+        """
+        Creates a sample set of `n_sam` samples within this proposal region.
+        The provided `sampler` and `kwargs` are only used by proposal regions
+        that are hypercubes.
+
+        """
+
+        # Raise NotImplementedError if only super() was called
+        raise NotImplementedError("This method must be overridden by the "
+                                  "proposal region subclass!")
+
+    # This function creates a slice of a sample set within the proposal region
+    def sample_slice(self, sampler, n_sam, rank, size, seed, **kwargs):
+        """
+        Creates the slice of a sample set of `n_sam` samples within this
+        proposal region that belongs to MPI rank `rank` out of `size` MPI
+        ranks, using a random state that is specific to this MPI rank. See
+        :func:`~get_sam_set_slice` for the other arguments.
+
+        """
+
+        # Determine the number of samples that belong to this MPI rank
+        sam_bounds = np.linspace(0, n_sam, size+1, dtype=int)
+        n_slice = sam_bounds[rank+1]-sam_bounds[rank]
+
+        # Create the slice using a random state specific to this MPI rank
+        state = np.random.get_state()
+        np.random.seed((seed+rank) % 2**32)
+        try:
+            sam_set = self.sample(sampler, n_slice, **kwargs)
+        finally:
+            np.random.set_state(state)
+
+        # Return it
+        return(sam_set)
+
+    # This function returns the importance weights of samples
+    @abc.abstractmethod
+    def get_weights(self, sam_set):
+        """
+        Returns the importance weights of all samples in `sam_set`, which must
+        have been created within this proposal region.
+
+        """
+
+        # Raise NotImplementedError if only super() was called
+        raise NotImplementedError("This method must be overridden by the "
+                                  "proposal region subclass!")
+
+
+# Define proposal region that is a bounding box
+class _BoxProposal(_Proposal):
+    """
+    Proposal region that is the bounding box of all plausible samples, padded
+    on every side by their average spacing. As the region is a hypercube, the
+    provided sampler is used to create the samples.
+
+    """
+
+    def __init__(self, impl_sam, val_rng):
+        # Call super constructor
+        super().__init__(impl_sam, val_rng)
+
+        # Determine the padded bounding box of impl_sam
+        box_min = self._impl_sam.min(axis=0)
+        box_max = self._impl_sam.max(axis=0)
+        pad = (box_max-box_min)*self._f_pad
+        box_rng = np.stack([np.maximum(box_min-pad, 0),
+                            np.minimum(box_max+pad, 1)], axis=1)
+
+        # Save the bounding box and its volume
+        self._box_rng = self._from_unit(box_rng.T).T
+        self._volume = np.prod(box_rng[:, 1]-box_rng[:, 0])
+
+    def sample(self, sampler, n_sam, **kwargs):
+        return(get_sam_set(sampler, n_sam, self._box_rng, **kwargs))
+
+    def sample_slice(self, sampler, n_sam, rank, size, seed, **kwargs):
+        return(get_sam_set_slice(sampler, n_sam, self._box_rng, rank, size,
+                                 seed, **kwargs))
+
+    def get_weights(self, sam_set):
+        return(np.full(np.shape(sam_set)[0], self._volume))
+
+
+# Define proposal region that is a bounding ellipsoid
+class _EllipsoidProposal(_Proposal):
+    """
+    Proposal region that is the ellipsoid with the covariance of all plausible
+    samples that contains all of them, enlarged by their average spacing.
+    The samples are drawn uniformly from the part of the ellipsoid that lies
+    within the value ranges.
+
+    """
+
+    def __init__(self, impl_sam, val_rng):
+        # Call super constructor
+        super().__init__(impl_sam, val_rng)
+
+        # Obtain the mean and the Cholesky factor of the covariance matrix
+        self._mean = self._impl_sam.mean(axis=0)
+        cov = np.cov(self._impl_sam, rowvar=False)
+        chol = np.linalg.cholesky(np.array(cov, ndmin=2))
+
+        # Determine the radius that makes the ellipsoid contain impl_sam
+        dist = np.linalg.norm(np.linalg.solve(
+            chol, (self._impl_sam-self._mean).T), axis=0)
+        radius = dist.max()*(1+self._f_pad)
+
+        # Save the transformation from the unit ball to the ellipsoid
+        self._trans = radius*chol
+
+        # Determine the fraction of the ellipsoid within the value ranges
+        # A fixed random state makes this estimate reproducible
+        rand_state = np.random.RandomState(0)
+        self._f_inside = max(np.mean(self._is_inside(self._draw(
+            10**4, rand_state.randn, rand_state.rand))), 1e-4)
+
+        # Calculate the volume of this part of the ellipsoid
+        n = self._n_val
+        self._volume = (np.pi**(n/2)/gamma(n/2+1) *
+                        np.prod(np.diag(self._trans))*self._f_inside)
+
+    # This function draws samples uniformly from the ellipsoid
+    def _draw(self, n_sam, randn=randn, rand=rand):
+        # Draw samples uniformly from the unit ball
+        sam_set = randn(n_sam, self._n_val)
+        sam_set /= np.linalg.norm(sam_set, axis=1)[:, np.newaxis]
+        sam_set *= rand(n_sam, 1)**(1/self._n_val)
+
+        # Transform them to the ellipsoid
+        return(self._mean+sam_set @ self._trans.T)
+
+    # This function checks which samples are within the unit hypercube
+    def _is_inside(self, sam_set):
+        return(np.all((sam_set >= 0) & (sam_set <= 1), axis=1))
+
+    def sample(self, sampler, n_sam, **kwargs):
+        # Keep drawing samples until enough are within the value ranges
+        sam_set = [np.empty([0, self._n_val])]
+        n_left = n_sam
+        while(n_left > 0):
+            draws = self._draw(int(np.ceil(1.1*n_left/self._f_inside)))
+            draws = draws[self._is_inside(draws)][:n_left]
+            sam_set.append(draws)
+            n_left -= draws.shape[0]
+
+        # Convert the samples to the value ranges and return them
+        return(self._from_unit(np.concatenate(sam_set, axis=0)))
+
+    def get_weights(self, sam_set):
+        return(np.full(np.shape(sam_set)[0], self._volume))
+
+
+# Define proposal region that is a mixture of boxes around all samples
+class _KDTreeProposal(_Proposal):
+    """
+    Proposal region that is an equal-weight mixture of boxes centered on every
+    plausible sample, which all have the largest Chebyshev distance between
+    any plausible sample and its nearest neighbour as their half-width, and
+    are clipped to the value ranges. A KD-tree is used to determine the boxes
+    that contain a sample when calculating its importance weight.
+
+    """
+
+    def __init__(self, impl_sam, val_rng):
+        # Call super constructor
+        super().__init__(impl_sam, val_rng)
+
+        # Build the KD-tree and determine the half-width of the boxes
+        self._tree = cKDTree(self._impl_sam)
+        dist = self._tree.query(self._impl_sam, k=2, p=np.inf)[0][:, 1]
+        self._radius = max(dist.max(), self._f_pad)
+
+        # Determine the boxes and their inverse volumes
+        self._box_min = np.maximum(self._impl_sam-self._radius, 0)
+        self._box_max = np.minimum(self._impl_sam+self._radius, 1)
+        self._inv_volume = 1/np.prod(self._box_max-self._box_min, axis=1)
+
+    def sample(self, sampler, n_sam, **kwargs):
+        # Draw a random box for every sample and a sample within it
+        idx = randint(self._impl_sam.shape[0], size=n_sam)
+        sam_set = self._box_min[idx]+rand(n_sam, self._n_val)*(
+            self._box_max[idx]-self._box_min[idx])
+
+        # Convert the samples to the value ranges and return them
+        return(self._from_unit(sam_set))
+
+    def get_weights(self, sam_set):
+        # Obtain all boxes that contain every sample
+        sam_set = self._to_unit(np.array(sam_set, ndmin=2))
+        idx_list = self._tree.query_ball_point(
+            sam_set, self._radius*(1+1e-10), p=np.inf)
+
+        # Calculate the mixture density of every sample and invert it
+        density = np.array([self._inv_volume[idx].sum() for idx in idx_list])
+        return(self._impl_sam.shape[0]/density)
+
+
+# Dict of all built-in proposal regions
+PROPOSALS = {
+    'box': _BoxProposal,
+    'ellipsoid': _EllipsoidProposal,
+    'kdtree': _KDTreeProposal}
+
+
+# %% PROPOSAL FUNCTIONS
+# This function checks if a provided proposal region is valid
+def check_proposal(proposal, name):
+    """
+    Checks if the provided `proposal` is either 'full' or the name of a
+    built-in proposal region in :obj:`~PROPOSALS`, and returns it if so.
+
+    Parameters
+    ----------
+    proposal : str
+        The proposal region that must be checked.
+    name : str
+        The name of the variable `proposal` belongs to.
+
+    Returns
+    -------
+    proposal : str
+        The lowercase name of the proposal region.
+
+    """
+
+    # Make logger
+    logger = getRLogger('CHECK')
+
+    # Check if proposal is 'full' or the name of a built-in proposal region
+    if isinstance(proposal, str) and (proposal.lower() == 'full' or
+                                      proposal.lower() in PROPOSALS):
+        return(proposal.lower())
+
+    # If not, raise error
+    else:
+        err_msg = ("Input argument %r is invalid (%r)! Valid proposal regions "
+                   "are %s." % (name, proposal, ['full']+list(PROPOSALS)))
+        raise_error(err_msg, ValueError, logger)
+
+
+# This function creates a proposal region around plausible samples
+def get_proposal(proposal, impl_sam, val_rng):
+    """
+    Creates the proposal region `proposal` around the plausible samples
+    `impl_sam` within the value ranges `val_rng`.
+
+    Parameters
+    ----------
+    proposal : str
+        The name of the built-in proposal region in :obj:`~PROPOSALS` to use.
+    impl_sam : 2D array_like
+        The plausible samples the proposal region is built around. This must
+        contain more samples than values per sample.
+    val_rng : 2D array_like
+        The lower and upper bounds of every value in a sample.
+
+    Returns
+    -------
+    proposal_obj : object
+        The proposal region, whose ``sample(sampler, n_sam, **kwargs)`` and
+        ``sample_slice(sampler, n_sam, rank, size, seed, **kwargs)`` methods
+        create samples within it, and whose ``get_weights(sam_set)`` method
+        returns the importance weights of such samples.
+
+    """
+
+    return(PROPOSALS[proposal](impl_sam, val_rng))
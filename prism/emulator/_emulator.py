@@ -11,26 +11,30 @@ package, the :class:`~Emulator` class.
 
 # %% IMPORTS
 # Built-in imports
-from collections import Counter
+from collections import Counter, OrderedDict as odict, deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import contextmanager
+from copy import copy
+from itertools import repeat
+import multiprocessing
 import os
 from os import path
 from struct import calcsize
 from time import time
+import tracemalloc
 
 # Package imports
 from e13tools import InputError, compare_versions
-from e13tools.math import diff
 from e13tools.utils import (
     check_instance, delist, docstring_append, docstring_substitute,
     raise_error, raise_warning, split_seq)
 import h5py
-from mlxtend.feature_selection import SequentialFeatureSelector as SFS
 from mpi4pyd import MPI
 import numpy as np
-from numpy.linalg import pinv
+from numpy.linalg import LinAlgError, pinv
+from scipy.linalg import cho_solve, cholesky, solve_triangular
 from sklearn.linear_model import LinearRegression as LR
 from sklearn.metrics import mean_squared_error as mse
-from sklearn.pipeline import Pipeline as Pipeline_sk
 from sklearn.preprocessing import PolynomialFeatures as PF
 from sortedcontainers import SortedDict as sdict, SortedSet as sset
 import threadpoolctl as tpc
@@ -43,7 +47,8 @@ from prism._docstrings import (
     std_emul_i_doc)
 from prism._internal import (
     RequestError, RequestWarning, check_compatibility, check_vals, getCLogger,
-    getRLogger, np_array)
+    getRLogger, np_array, pool_hdf5_files)
+from prism.emulator._selection import select_backward, select_forward
 from prism.modellink import ModelLink
 
 # All declaration
@@ -52,6 +57,7 @@ __all__ = ['Emulator']
 
 # %% GLOBALS
 INT_SIZE = 'int%i' % (calcsize('P')*8)          # Default bitsize of an integer
+BATCH_MEM_SIZE = 2**26                          # Max memory used per sam batch
 
 
 # %% EMULATOR CLASS DEFINITION
@@ -119,6 +125,9 @@ class Emulator(object):
         # Make pointer to prism_dict property
         self._prism_dict = self._pipeline._prism_dict
 
+        # Initialize the worker pool that is used during construction
+        self._pool = None
+
         # Load the emulator and data
         self._load_emulator(modellink_obj)
 
@@ -234,6 +243,30 @@ class Emulator(object):
 
         return(bool(self._use_regr_cov))
 
+    @property
+    def decomp_method(self):
+        """
+        str: The method that is used for decomposing the covariance matrices
+        of all emulator systems. If 'pinv', their Moore-Penrose inverses are
+        used. If 'cholesky', their Cholesky factors are used, falling back to
+        'pinv' for systems whose covariance matrix is not positive-definite.
+
+        """
+
+        return(self._decomp_method)
+
+    @property
+    def n_inducing(self):
+        """
+        int: The maximum number of model evaluation samples that are used as
+        inducing points for approximating the Gaussian covariances of all
+        emulator systems in an emulator iteration. If zero or not smaller than
+        :attr:`~n_sam`, all samples are used and no approximation is made.
+
+        """
+
+        return(self._n_inducing)
+
     @property
     def poly_order(self):
         """
@@ -409,7 +442,10 @@ class Emulator(object):
 
         """
 
-        return(self._poly_coef_cov)
+        # Return the covariance matrices flattened, as stored in the HDF5-file
+        return([[np.ravel(cov) if isinstance(cov, np.ndarray) else cov
+                 for cov in poly_coef_cov]
+                for poly_coef_cov in self._poly_coef_cov])
 
     @property
     def poly_powers(self):
@@ -461,11 +497,25 @@ class Emulator(object):
         """
         list of :obj:`~numpy.ndarray`: The inverses of the covariance matrices
         for every emulator system on this MPI rank.
+        Empty for emulator systems whose covariance matrix was decomposed with
+        a Cholesky decomposition.
 
         """
 
         return(self._cov_mat_inv)
 
+    @property
+    def cov_mat_chol(self):
+        """
+        list of :obj:`~numpy.ndarray`: The lower-triangular Cholesky factors of
+        the covariance matrices for every emulator system on this MPI rank.
+        Empty for emulator systems whose covariance matrix was inverted
+        instead (see :attr:`~decomp_method`).
+
+        """
+
+        return(self._cov_mat_chol)
+
     @property
     def exp_dot_term(self):
         """
@@ -646,6 +696,9 @@ class Emulator(object):
                 file.attrs['l_corr'] = self._l_corr
                 file.attrs['f_infl'] = self._f_infl
                 file.attrs['method'] = self._method.encode('ascii', 'ignore')
+                file.attrs['decomp_method'] =\
+                    self._decomp_method.encode('ascii', 'ignore')
+                file.attrs['n_inducing'] = self._n_inducing
                 file.attrs['use_regr_cov'] = bool(self._use_regr_cov)
                 file.attrs['poly_order'] = self._poly_order
                 file.attrs['n_cross_val'] = self._n_cross_val
@@ -1022,11 +1075,17 @@ class Emulator(object):
     def _assign_emul_s(self, emul_i):
         """
         Determines which emulator systems (files) should be assigned to which
-        MPI rank in order to balance the number of active emulator systems on
-        every rank for every iteration up to the provided emulator iteration
-        `emul_i`. If multiple choices can achieve this, the emulator systems
-        are automatically spread out such that the total number of active
-        emulator systems on a single rank is also balanced as much as possible.
+        MPI rank in order to balance the evaluation cost of the active emulator
+        systems on every rank for every iteration up to the provided emulator
+        iteration `emul_i`.
+
+        The evaluation cost of an emulator system is the time per evaluated
+        sample that was measured during the last analysis of an iteration. If
+        this is not available for all emulator systems in an iteration, an
+        estimate based on the number of active parameters and polynomial terms
+        is used for that iteration instead (see :meth:`~_get_eval_cost`).
+        The costs of every iteration are normalized, such that all iterations
+        are weighted equally.
 
         Parameters
         ----------
@@ -1040,9 +1099,11 @@ class Emulator(object):
 
         Notes
         -----
-        Currently, this function only uses high-level MPI. Additional speed can
-        be obtained by also implementing low-level MPI, which will potentially
-        be done in the future.
+        The emulator systems are assigned greedily in order of decreasing total
+        cost, each to the MPI rank whose highest normalized cost in any of the
+        iterations the system is active in increases the least. If all
+        emulator systems have the same cost, this balances the number of active
+        emulator systems on every rank.
 
         """
 
@@ -1051,108 +1112,173 @@ class Emulator(object):
         logger.info("Determining emulator system assignments up to emulator "
                     "iteration %i for available MPI ranks." % (emul_i))
 
-        # Create empty list of active emulator systems
-        active_emul_s_list = [[]]
+        # Create empty list of evaluation costs of all active emulator systems
+        eval_cost_list = [{}]
 
         # Open hdf5-file
         with self._File('r', None) as file:
-            logger.info("Determining active emulator systems in every "
-                        "emulator iteration.")
+            logger.info("Determining evaluation costs of active emulator "
+                        "systems in every emulator iteration.")
 
-            # Determine the active emulator systems in every iteration
+            # Determine the costs of the active emulator systems
             for i in range(1, emul_i+1):
-                active_emul_s_list.append(
-                    [int(key[5:]) for key in file['%i' % (i)].keys() if
-                     key[:5] == 'emul_'])
+                eval_cost_list.append(self._get_eval_cost(file['%i' % (i)]))
 
-        # Determine number of active emulator systems in each iteration
-        n_active_emul_s = [[i, len(active_emul_s)] for i, active_emul_s in
-                           enumerate(active_emul_s_list[:emul_i+1])]
-        iter_size = sorted(n_active_emul_s, key=lambda x: x[1])
+        # Determine the total normalized cost of every emulator system
+        emul_s_cost = Counter()
+        for eval_cost in eval_cost_list:
+            emul_s_cost.update(eval_cost)
 
         # Create empty emul_s_to_core list
         emul_s_to_core = [[] for _ in range(self._size)]
 
-        # Create empty Counter for total number of assigned systems
-        core_cntr = Counter()
-
-        # Create empty Counter for total number of system occurances
-        emul_s_cntr = Counter()
-
-        # Determine how many times a specific emulator system is active
-        for active_emul_s in active_emul_s_list:
-            emul_s_cntr.update(active_emul_s)
-
-        # Set the number of assigned emulator systems for each core to zero
-        for rank in range(self._size):
-            core_cntr[rank] = 0
-
-        # Create empty list holding all assigned emulator systems
-        emul_s_chosen = []
-
-        # Loop over all iterations, from smallest to largest
-        for i, size in iter_size:
-            # Set the number of assigned systems in this iteration to zero
-            iter_core_cntr = [0 for _ in range(self._size)]
-
-            # Create empty Counter for number of system occurances that are
-            # also in this iteration
-            iter_emul_s_cntr = Counter()
-
-            # Fill that counter with systems that are not assigned yet
-            for emul_s in active_emul_s_list[i]:
-                # If this system is not assigned yet, copy its size
-                if emul_s not in emul_s_chosen:
-                    iter_emul_s_cntr[emul_s] = emul_s_cntr[emul_s]
-
-                # Check if certain systems have already been assigned
-                for j, emul_s_list in enumerate(emul_s_to_core):
-                    iter_core_cntr[j] += emul_s_list.count(emul_s)
-
-            # Set the minimum number of assigned systems for a core to 0
-            min_count = 0
-
-            # While not all emulator systems in this iteration are assigned
-            while(sum(iter_core_cntr) != size):
-                # Determine cores that have minimum number of assignments
-                min_cores = [j for j, num in enumerate(iter_core_cntr) if(
-                    num == min_count)]
-
-                # If no core has this minimum size, increase it by 1
-                if not min_cores:
-                    min_count += 1
-
-                # If one core has this number, assign system with lowest
-                # number of occurances to it and remove it from the list
-                elif(len(min_cores) == 1):
-                    core = min_cores[0]
-                    emul_s, emul_size = iter_emul_s_cntr.most_common()[-1]
-                    core_cntr[core] += emul_size
-                    emul_s_chosen.append(emul_s)
-                    emul_s_to_core[core].append(emul_s)
-                    iter_core_cntr[core] += 1
-                    iter_emul_s_cntr.pop(emul_s)
-                    min_count += 1
-
-                # If more than one core has this number, determine the core
-                # that has the lowest total number of assigned systems and
-                # assign the system with the highest number of occurances
-                # to it
-                else:
-                    emul_s, emul_size = iter_emul_s_cntr.most_common()[0]
-                    core_sizes = [[j, core_cntr[j]] for j in min_cores]
-                    core_lowest = min(core_sizes, key=lambda x: x[1])[0]
-                    core_cntr[core_lowest] += emul_size
-                    emul_s_chosen.append(emul_s)
-                    emul_s_to_core[core_lowest].append(emul_s)
-                    iter_core_cntr[core_lowest] += 1
-                    iter_emul_s_cntr.pop(emul_s)
+        # Create empty array holding the cost per iteration of every core
+        core_cost = np.zeros([emul_i+1, self._size])
+
+        # Loop over all systems, from most to least expensive
+        for emul_s, _ in sorted(emul_s_cost.items(), key=lambda x: -x[1]):
+            # Obtain the costs of this system in every iteration
+            cost = np_array([eval_cost.get(emul_s, 0)
+                             for eval_cost in eval_cost_list])
+
+            # Determine the highest cost of every core if emul_s is added
+            new_cost = np.max((core_cost+cost[:, np.newaxis])[cost > 0],
+                              axis=0)
+
+            # Assign system to the core with the lowest highest cost
+            # If multiple cores qualify, use the lowest total cost
+            core = min(range(self._size),
+                       key=lambda j: (new_cost[j], core_cost[:, j].sum()))
+            emul_s_to_core[core].append(emul_s)
+            core_cost[:, core] += cost
+
+        # Log the achieved imbalance, which is the highest over average cost
+        for i in range(1, emul_i+1):
+            if len(eval_cost_list[i]):
+                imbalance = np.max(core_cost[i])/np.mean(core_cost[i])
+                logger.info("Evaluation cost imbalance of emulator iteration "
+                            "%i: %.3f." % (i, imbalance))
 
         # Log that assignments have been determined
         logger.info("Finished determining emulator system assignments.")
 
-        # Return emul_s_to_core
-        return(emul_s_to_core)
+        # Return emul_s_to_core, with the systems on every core sorted
+        return([sorted(emul_s_seq) for emul_s_seq in emul_s_to_core])
+
+    # This function determines the evaluation costs of emulator systems
+    def _get_eval_cost(self, group):
+        """
+        Determines the normalized evaluation costs of all active emulator
+        systems in the provided emulator iteration `group` of the master
+        HDF5-file.
+
+        If the evaluation cost of every emulator system was measured (and
+        saved) during an analysis, these measured costs are used. Else, the
+        costs are estimated from the number of active parameters and
+        polynomial terms that every emulator system uses.
+
+        Parameters
+        ----------
+        group : :obj:`~h5py.Group` object
+            The emulator iteration group to determine the evaluation costs for.
+
+        Returns
+        -------
+        eval_cost : dict
+            Dict containing the normalized evaluation cost of every active
+            emulator system, which average to unity.
+
+        """
+
+        # Obtain all active emulator system groups
+        emul_s_groups = {int(key[5:]): group[key] for key in group.keys() if
+                         key[:5] == 'emul_'}
+
+        # If there are no active emulator systems, return empty dict
+        if not emul_s_groups:
+            return({})
+
+        # Try to obtain the measured evaluation costs of every system
+        eval_cost = {emul_s: data_set.attrs.get('eval_cost', 0)
+                     for emul_s, data_set in emul_s_groups.items()}
+
+        # If any of them is missing, estimate the costs of all systems
+        if not all(eval_cost.values()):
+            # Obtain the number of model evaluation samples
+            n_sam = group.attrs.get('n_sam', 1)
+
+            # If inducing points are used, only these are evaluated against
+            if(self._n_inducing and self._method in ('gaussian', 'full')):
+                n_sam = min(n_sam, self._n_inducing)
+
+            # Loop over all emulator systems
+            for emul_s, data_set in emul_s_groups.items():
+                # Obtain the number of active parameters and polynomial terms
+                n_active_par = len(data_set.attrs.get(
+                    'active_par_data', self._modellink._par_name))
+                n_poly_terms = (len(data_set['poly_idx']) if 'poly_idx' in
+                                data_set.keys() else 0)
+
+                # Every sample computes a distance and dot product per n_sam
+                cost = n_sam
+
+                # Add the costs of the Gaussian and regression terms
+                if self._method in ('gaussian', 'full'):
+                    cost += n_sam*n_active_par
+                if self._method in ('regression', 'full'):
+                    cost += n_poly_terms*n_active_par
+                    if self._use_regr_cov:
+                        cost += n_sam*n_poly_terms+pow(n_poly_terms, 2)
+
+                # Save the estimated cost
+                eval_cost[emul_s] = cost
+
+        # Normalize the evaluation costs
+        avg_cost = np.mean(list(eval_cost.values()))
+        eval_cost = {emul_s: cost/avg_cost for emul_s, cost in
+                     eval_cost.items()}
+
+        # Return eval_cost
+        return(eval_cost)
+
+    # This function saves the measured evaluation costs of emulator systems
+    def _save_eval_cost(self):
+        """
+        Saves the evaluation costs of all emulator systems on this MPI rank
+        that were measured since the last time this method was called, to the
+        HDF5-file. The evaluation cost of an emulator system is its average
+        evaluation time per sample, and is used by :meth:`~_assign_emul_s` to
+        balance the emulator systems over the MPI ranks.
+
+        """
+
+        # Loop over all emulator systems that were evaluated
+        for (emul_i, emul_s), n_sam in self._eval_n_sam.items():
+            # Save the average evaluation time per sample
+            self._save_data(emul_i, emul_s, {
+                'eval_cost': self._eval_time[emul_i, emul_s]/n_sam})
+
+        # Reset the measured evaluation times
+        self._eval_time.clear()
+        self._eval_n_sam.clear()
+
+    # This function saves the measured rejection powers of emulator systems
+    def _save_reject_power(self):
+        """
+        Saves the rejection powers of all emulator systems on this MPI rank
+        that were measured so far, to the HDF5-file. The rejection power of an
+        emulator system is stored as the sum of all univariate implausibility
+        values it reported to :meth:`~_update_reject_power` and the number of
+        samples these belong to, such that it keeps being updated after the
+        emulator has been reloaded.
+
+        """
+
+        # Loop over all emulator systems that reported implausibility values
+        for (emul_i, emul_s), n_sam in self._impl_n_sam.items():
+            # Save the implausibility sum and number of samples
+            self._save_data(emul_i, emul_s, {
+                'reject_power': (self._impl_sum[emul_i, emul_s], n_sam)})
 
     # Prepares the emulator for a new iteration
     @docstring_substitute(emul_i=std_emul_i_doc)
@@ -1306,6 +1432,7 @@ class Emulator(object):
         return(reload)
 
     # This function constructs the emulator iteration emul_i
+    @pool_hdf5_files
     @docstring_substitute(emul_i=std_emul_i_doc)
     def _construct_iteration(self, emul_i):
         """
@@ -1332,30 +1459,33 @@ class Emulator(object):
         # Get the emul_s_seq
         emul_s_seq = self._active_emul_s[emul_i]
 
-        # Determine active parameters
-        ccheck_active_par = [emul_s for emul_s in emul_s_seq if
-                             'active_par_data' in self._ccheck[emul_i][emul_s]]
-        if ccheck_active_par:
-            self._get_active_par(emul_i, ccheck_active_par)
-
-        # Check if regression is required
-        if(self._method in ('regression', 'full')):
-            # Perform regression
-            ccheck_regression = [emul_s for emul_s in emul_s_seq if
-                                 'regression' in self._ccheck[emul_i][emul_s]]
-            if ccheck_regression:
-                self._do_regression(emul_i, ccheck_regression)
-
-        # Calculate the covariance matrices of sam_set
-        # TODO: Implement system that, if needed, calculates cov_mat in seq
-        # This is to avoid requiring massive amounts of RAM during calculation
-        ccheck_cov_mat = [emul_s for emul_s in emul_s_seq if
-                          'cov_mat' in self._ccheck[emul_i][emul_s]]
-        if ccheck_cov_mat:
-            act_rsdl_var, pas_rsdl_var = self._get_rsdl_vars(emul_i)
-            self._act_rsdl_var[-1] = act_rsdl_var
-            self._pas_rsdl_var[-1] = pas_rsdl_var
-            self._get_cov_matrix(emul_i, ccheck_cov_mat)
+        # Open the worker pool for constructing multiple systems at once
+        with self._worker_pool():
+            # Determine active parameters
+            ccheck_active_par = [
+                emul_s for emul_s in emul_s_seq if
+                'active_par_data' in self._ccheck[emul_i][emul_s]]
+            if ccheck_active_par:
+                self._get_active_par(emul_i, ccheck_active_par)
+
+            # Check if regression is required
+            if(self._method in ('regression', 'full')):
+                # Perform regression
+                ccheck_regression = [
+                    emul_s for emul_s in emul_s_seq if
+                    'regression' in self._ccheck[emul_i][emul_s]]
+                if ccheck_regression:
+                    self._do_regression(emul_i, ccheck_regression)
+
+            # Calculate the covariance matrices of sam_set
+            peak_mem = 0
+            ccheck_cov_mat = [emul_s for emul_s in emul_s_seq if
+                              'cov_mat' in self._ccheck[emul_i][emul_s]]
+            if ccheck_cov_mat:
+                act_rsdl_var, pas_rsdl_var = self._get_rsdl_vars(emul_i)
+                self._act_rsdl_var[-1] = act_rsdl_var
+                self._pas_rsdl_var[-1] = pas_rsdl_var
+                peak_mem = self._get_cov_matrix(emul_i, ccheck_cov_mat)
 
         # Calculate the second dot-term for the adjusted expectation
         ccheck_exp_dot_term = [emul_s for emul_s in emul_s_seq if
@@ -1373,6 +1503,13 @@ class Emulator(object):
         # If everything is done, gather the total set of active parameters
         active_par_data = self._comm.gather(self._active_par_data[emul_i], 0)
 
+        # Determine the total number of Gaussian kernels used on all ranks
+        n_kernel_groups = self._comm.reduce(len(self._get_kernel_groups(
+            emul_i, self._active_emul_s[emul_i])), op=MPI.SUM, root=0)
+
+        # Determine the peak memory usage of cov_mat over all ranks
+        peak_mem = self._comm.reduce(peak_mem, op=MPI.MAX, root=0)
+
         # Allow the controller to save them
         if self._is_controller and 'active_par' in self._ccheck[emul_i]:
             active_par = sset()
@@ -1387,11 +1524,148 @@ class Emulator(object):
             # Save time difference and communicator size
             self._pipeline._save_statistics(emul_i, {
                 'emul_construct_time': ['%.2f' % (time()-start_time), 's'],
-                'MPI_comm_size_cons': ['%i' % (self._size), '']})
+                'MPI_comm_size_cons': ['%i' % (self._size), ''],
+                'n_kernel_groups': ['%i/%i' % (n_kernel_groups,
+                                               self._n_data_tot[emul_i]),
+                                    ''],
+                'cov_mat_peak_mem': ['%.2f' % (peak_mem/2**20), 'MiB']})
+
+        # MPI Barrier
+        self._comm.Barrier()
+
+    # This function updates a constructed emulator iteration with new samples
+    @pool_hdf5_files
+    @docstring_substitute(emul_i=std_emul_i_doc)
+    def _update_iteration(self, emul_i, sam_set, mod_set, update_regr):
+        """
+        Updates the constructed emulator iteration `emul_i` with the additional
+        model evaluation samples `sam_set` and their model outputs `mod_set`,
+        without reconstructing the iteration entirely.
+
+        Parameters
+        ----------
+        %(emul_i)s
+        sam_set : 2D :obj:`~numpy.ndarray` object
+            Array containing the additional model evaluation samples.
+        mod_set : list of 1D :obj:`~numpy.ndarray` object
+            List containing the model outputs of all additional samples for
+            every active emulator system on this MPI rank.
+        update_regr : bool
+            Whether or not to redo the regression process using all samples.
+            If *False*, the existing regression functions are kept and the
+            covariance matrix decompositions are updated with the additional
+            samples. If *True*, the covariance matrices are recalculated.
+
+        Generates
+        ---------
+        All data sets that are required to evaluate the emulator at the
+        updated iteration.
+
+        """
+
+        # Log that the emulator iteration is being updated
+        logger = getRLogger('EMUL_UPDATE')
+        logger.info("Updating emulator iteration %i with %i additional model "
+                    "evaluation samples." % (emul_i, np.shape(sam_set)[0]))
+
+        # Save current time on controller
+        if self._is_controller:
+            start_time = time()
+
+        # Get the emul_s_seq and the number of old samples
+        emul_s_seq = self._active_emul_s[emul_i]
+        n_sam_old = self._n_sam[emul_i]
+
+        # Remove the model realization data that is going to be replaced
+        for emul_s in emul_s_seq:
+            self._remove_data(emul_i, emul_s, ['mod_real_set'])
+
+        # Append the additional samples to the known samples
+        sam_set = np.concatenate([self._sam_set[emul_i], sam_set], axis=0)
+        mod_set = [np.concatenate([self._mod_set[emul_i][emul_s], mod_out])
+                   for emul_s, mod_out in zip(emul_s_seq, mod_set)]
+
+        # Save the updated model realization data
+        # The added samples are externally provided, so mark them as such
+        if self._is_controller:
+            self._remove_data(emul_i, None, ['mod_real_set'])
+            self._save_data(emul_i, None, {
+                'mod_real_set': {
+                    'sam_set': sam_set,
+                    'mod_set': mod_set,
+                    'use_ext_real_set': 1}})
+        else:
+            for emul_s, mod_out in zip(emul_s_seq, mod_set):
+                self._save_data(emul_i, emul_s, {
+                    'mod_real_set': {
+                        'mod_set': mod_out}})
+            self._sam_set[emul_i] = sam_set
+            self._n_sam[emul_i] = np.shape(sam_set)[0]
+
+        # Remove all cached data that depends on the known samples
+        for emul_s in emul_s_seq:
+            self._sam_set_poly[emul_i][emul_s] = []
+        self._replicas.pop(emul_i, None)
+        self._replicas.pop((emul_i, 'force'), None)
+        self._ind_idx.pop(emul_i, None)
+        self._eval_data.pop(emul_i, None)
+
+        # If requested, redo the regression and recalculate cov_mat
+        if(update_regr and self._method in ('regression', 'full')):
+            # Perform regression
+            for emul_s in emul_s_seq:
+                self._remove_data(emul_i, emul_s, ['regression'])
+            self._do_regression(emul_i, emul_s_seq)
+
+            # Obtain the new residual variance portions
+            act_rsdl_var, pas_rsdl_var = self._get_rsdl_vars(emul_i)
+            self._act_rsdl_var[emul_i] = act_rsdl_var
+            self._pas_rsdl_var[emul_i] = pas_rsdl_var
+
+            # Calculate the covariance matrices of sam_set
+            for emul_s in emul_s_seq:
+                self._remove_data(emul_i, emul_s, ['cov_mat'])
+            self._get_cov_matrix(emul_i, emul_s_seq)
+
+            # Gather the total set of active parameters on the controller
+            active_par_data = self._comm.gather(self._active_par_data[emul_i],
+                                                0)
+
+            # Allow the controller to save them, as they may have changed
+            if self._is_controller:
+                active_par = sset()
+                for active_par_rank in active_par_data:
+                    active_par.update(*active_par_rank)
+                self._save_data(emul_i, None, {
+                    'active_par': np_array(active_par)})
+
+        # Else, if inducing points are used, recalculate the reduced cov_mat
+        elif self._use_inducing(emul_i):
+            for emul_s in emul_s_seq:
+                self._remove_data(emul_i, emul_s, ['cov_mat'])
+            self._get_cov_matrix(emul_i, emul_s_seq)
+
+        # Else, update the decompositions of the covariance matrices
+        else:
+            self._update_cov_matrix(emul_i, emul_s_seq, n_sam_old)
+
+        # Calculate the second dot-term for the adjusted expectation
+        for emul_s in emul_s_seq:
+            self._remove_data(emul_i, emul_s, ['exp_dot_term'])
+        self._get_exp_dot_term(emul_i, emul_s_seq)
 
         # MPI Barrier
         self._comm.Barrier()
 
+        # Controller saves the statistics of this update
+        if self._is_controller:
+            self._pipeline._save_statistics(emul_i, {
+                'emul_update_time': ['%.2f' % (time()-start_time), 's'],
+                'n_sam_update': ['%i' % (self._n_sam[emul_i]-n_sam_old), '']})
+
+        # Log that updating has been finished
+        logger.info("Finished updating emulator iteration.")
+
     # This is function 'E_D(f(x'))'
     # This function gives the adjusted emulator expectation value back
     @docstring_append(adj_exp_doc)
@@ -1424,16 +1698,67 @@ class Emulator(object):
         # Calculate the adjusted emulator variance value at given par_set
         for i, emul_s in enumerate(emul_s_seq):
             adj_var_val[i] = prior_var_par_set[i] -\
-                cov_vec[i].T @ self._cov_mat_inv[emul_i][emul_s] @ cov_vec[i]
+                self._get_var_dot_term(emul_i, emul_s, cov_vec[i])
 
         # Return it
         return(adj_var_val)
 
+    # This is function 'Cov(f(x'), D) @ Var(D)^-1 @ Cov(D, f(x'))'
+    # This function gives the variance adjustment term back
+    @docstring_substitute(emul_i=std_emul_i_doc)
+    def _get_var_dot_term(self, emul_i, emul_s, cov):
+        """
+        Calculates the variance adjustment term for the provided covariances
+        `cov` of emulator system `emul_s` at emulator iteration `emul_i`.
+        Uses triangular solves with the Cholesky factor of the covariance
+        matrix if it is available, and its inverse otherwise, both in the
+        precision given by :attr:`~prism.Pipeline.eval_dtype`.
+
+        Parameters
+        ----------
+        %(emul_i)s
+        emul_s : int
+            Number of the local emulator system to use.
+        cov : 1D or 2D :obj:`~numpy.ndarray` object
+            The covariances between one or several parameter sets and sam_set.
+
+        Returns
+        -------
+        var_dot_term : float or 1D :obj:`~numpy.ndarray` object
+            The variance adjustment term for every parameter set in `cov`.
+
+        """
+
+        # Obtain the Cholesky factor of this emulator system
+        eval_data = self._get_eval_data(emul_i)
+        cov_mat_chol = eval_data['cov_mat_chol'][emul_s]
+
+        # If it is available, use triangular solves
+        if len(cov_mat_chol):
+            half_term = solve_triangular(cov_mat_chol, cov.T, lower=True,
+                                         check_finite=False)
+            var_dot_term = np.sum(half_term**2, axis=0)
+
+        # Else, use the inverse of the covariance matrix
+        else:
+            var_dot_term = np.sum(
+                (cov @ eval_data['cov_mat_inv'][emul_s])*cov, axis=-1)
+
+        # Return it
+        return(var_dot_term)
+
     # This function evaluates the emulator at a given emul_i and par_set and
     # returns the adjusted expectation and variance values
     # TODO: Take sam_set instead of par_set?
     @docstring_append(eval_doc)
     def _evaluate(self, emul_i, par_set):
+        # If inducing points or single precision are used, evaluate par_set
+        # as a batch instead
+        if(self._use_inducing(emul_i) or
+           self._pipeline._eval_dtype != 'float64'):
+            adj_exp_val, adj_var_val = self._evaluate_batch(emul_i, par_set)
+            return(adj_exp_val[0], adj_var_val[0])
+
         # Obtain active emulator systems for this iteration
         emul_s_seq = self._active_emul_s[emul_i]
 
@@ -1450,231 +1775,754 @@ class Emulator(object):
         # Return adj_exp_val and adj_var_val
         return(adj_exp_val, adj_var_val)
 
-    # This function extracts the set of active parameters
-    # TODO: Write code cleaner, if possible
-    @docstring_substitute(emul_i=std_emul_i_doc, emul_s_seq=emul_s_seq_doc)
-    def _get_active_par(self, emul_i, emul_s_seq):
+    # This function evaluates the emulator at a given emul_i and sam_set and
+    # returns the adjusted expectation and variance values of all samples
+    @docstring_substitute(emul_i=std_emul_i_doc)
+    def _evaluate_batch(self, emul_i, sam_set, emul_s_seq=None):
         """
-        Determines the active parameters to be used for every emulator system
-        listed in `emul_s_seq` in the provided emulator iteration `emul_i`.
-        Uses backwards stepwise elimination to determine the set of active
-        parameters. The polynomial order that is used in the stepwise
-        elimination depends on :attr:`~poly_order`.
+        Evaluates the emulator at the emulator iteration `emul_i` for all
+        model parameter value sets in the provided `sam_set` simultaneously.
+        Gives the same results as calling :meth:`~_evaluate` for every sample
+        individually, but performs all calculations with matrix-matrix
+        operations, in the precision given by
+        :attr:`~prism.Pipeline.eval_dtype`.
 
         Parameters
         ----------
         %(emul_i)s
-        %(emul_s_seq)s
+        sam_set : 2D :obj:`~numpy.ndarray` object
+            Array containing the model parameter value sets to evaluate the
+            emulator at.
 
-        Generates (for every emulator system)
-        -------------------------------------
-        active_par_data : 1D :obj:`~numpy.ndarray` object
-            Array containing the indices of all the parameters that are active
-            in the emulator iteration `emul_i`.
+        Optional
+        --------
+        emul_s_seq : list of int or None. Default: None
+            List of numbers indicating the requested emulator systems.
+            If *None*, all active emulator systems on this MPI rank are used.
+
+        Returns
+        -------
+        adj_exp_val : 2D :obj:`~numpy.ndarray` object
+            The adjusted expectation values of all samples in `sam_set` for
+            all requested emulator systems.
+        adj_var_val : 2D :obj:`~numpy.ndarray` object
+            The adjusted variance values of all samples in `sam_set` for all
+            requested emulator systems.
 
         """
 
-        # Log that active parameters are being determined
-        logger = getRLogger('ACTIVE_PAR')
-        logger.info("Determining active parameters.")
+        # Obtain active emulator systems for this iteration if not provided
+        if emul_s_seq is None:
+            emul_s_seq = self._active_emul_s[emul_i]
+
+        # Make sure that sam_set is a 2D array
+        sam_set = np_array(sam_set, ndmin=2)
+
+        # Create empty adj_exp_val and adj_var_val
+        adj_exp_val = np.zeros([sam_set.shape[0], len(emul_s_seq)])
+        adj_var_val = np.zeros([sam_set.shape[0], len(emul_s_seq)])
+
+        # Obtain the evaluation data in the requested precision
+        eval_data = self._get_eval_data(emul_i)
+        dtype = eval_data['dtype']
+        known_set = eval_data['known_set']
+
+        # Convert sam_set to this precision, shifting it like known_set
+        eval_set = np.asarray(sam_set-eval_data['center'], dtype)
+        poly_set = np.asarray(sam_set, dtype)
+
+        # Determine which samples are exactly equal to a known sample
+        # Inducing points only approximate the Gaussian covariances, so
+        # equality with an inducing point does not add passive variety
+        eq_mask = np.zeros([sam_set.shape[0], known_set.shape[0]], dtype=bool)
+        if not self._use_inducing(emul_i):
+            # Equality is checked first with a squared distance, which is cheap
+            eval_set_sq = np.sum(eval_set**2, axis=-1)
+            known_sq = np.sum(known_set**2, axis=-1)
+            dist_sq = eval_set_sq[:, np.newaxis]+known_sq -\
+                2*(eval_set @ known_set.T)
+            eq_cand = np.nonzero(
+                dist_sq <= np.sqrt(np.finfo(dtype).eps)*(1+known_sq))
+            eq_mask[eq_cand] = (sam_set[eq_cand[0]] ==
+                                self._sam_set[emul_i][eq_cand[1]]).all(axis=-1)
+
+        # Loop over all groups of active emulator systems sharing active_par
+        for active_par, group in self._get_kernel_groups(emul_i, emul_s_seq):
+            # Save the time at which the evaluation of this group starts
+            start_time = time()
 
-        # Loop over all emulator systems and determine active parameters
-        for emul_s in emul_s_seq:
-            # Initialize active parameters data set
-            active_par_data = sset()
+            # Check if a Gaussian kernel is required
+            if self._method in ('gaussian', 'full'):
+                # Obtain the squared distances over the active parameters
+                act_sam_set = eval_set[:, active_par]
+                act_known = known_set[:, active_par]
+                act_dist_sq = np.sum(act_sam_set**2, axis=-1)[:, np.newaxis] +\
+                    np.sum(act_known**2, axis=-1) -\
+                    2*(act_sam_set @ act_known.T)
+                np.maximum(0, act_dist_sq, out=act_dist_sq)
+                act_dist_sq[eq_mask] = 0
+
+                # Calculate the Gaussian kernel shared by this group
+                kernel = np.exp(-1*act_dist_sq/dtype.type(
+                    np.sum(self._l_corr[active_par]**2)))
+
+            # Divide the time spent on the kernel over the group
+            kernel_time = (time()-start_time)/len(group)
+
+            # Loop over all active emulator systems in this group
+            for i in group:
+                # Save the time at which the evaluation of this system starts
+                start_time = time()-kernel_time
+
+                # Get emul_s and rsdl_var portions
+                emul_s = emul_s_seq[i]
+                act_rsdl_var = dtype.type(self._act_rsdl_var[emul_i][emul_s])
+                pas_rsdl_var = dtype.type(self._pas_rsdl_var[emul_i][emul_s])
+
+                # Initialize covariance matrix and prior values
+                cov = np.zeros([sam_set.shape[0], known_set.shape[0]], dtype)
+                prior_exp = np.zeros(sam_set.shape[0], dtype)
+                prior_var = np.zeros(sam_set.shape[0], dtype)
+
+                # Check what 'method' is given
+                if self._method in ('gaussian', 'full'):
+                    # Gaussian variance
+                    cov += act_rsdl_var*kernel
 
-            # Check if previously active parameters must be active again
-            if(self._pipeline._freeze_active_par and
-               emul_s in self._active_emul_s[emul_i-1] and
-               self._data_idx[emul_i-1][emul_s] ==
-               self._data_idx[emul_i][emul_s]):
-                active_par_data.update(self._active_par_data[emul_i-1][emul_s])
+                    # Passive parameter variety plus inflation term
+                    cov += pas_rsdl_var*eq_mask
 
-            # Check if active parameters analysis has been requested
-            if not self._pipeline._do_active_anal:
-                # If not requested, then save all potentially active parameters
-                active_par_data.update(self._pipeline._pot_active_par)
+                    # Prior variance of every sample with itself
+                    prior_var += act_rsdl_var+pas_rsdl_var
 
-            # If requested, perform a sequential backward stepwise regression
-            else:
-                # Obtain frozen+potentially active parameters list
-                frz_pot_par = sset(active_par_data)
-                frz_pot_par.update(self._pipeline._pot_active_par)
-                frz_pot_par = list(frz_pot_par)
-                frz_pot_idx = list(range(len(frz_pot_par)))
+                if self._method in ('regression', 'full'):
+                    # Obtain the polynomial terms of sam_set
+                    poly_terms = np.product(pow(
+                        poly_set[:, np.newaxis, active_par],
+                        eval_data['poly_powers'][emul_s]), axis=-1)
 
-                # Obtain non-frozen potentially active parameters
-                non_frz_par = [par for par in self._pipeline._pot_active_par
-                               if par not in active_par_data]
-                non_frz_idx = [frz_pot_par.index(par) for par in non_frz_par]
+                    # Regression prior expectation
+                    prior_exp += poly_terms @ eval_data['poly_coef'][emul_s]
 
-                # If non_frz_par has at least 1 element, carry out analysis
-                if non_frz_par:
-                    # Create SequentialFeatureSelector object
-                    sfs_obj = SFS(LR(), k_features='parsimonious',
-                                  forward=False, floating=False, scoring='r2',
-                                  cv=self._n_cross_val)
+                    # If regression covariance is used, add it as well
+                    if self._use_regr_cov:
+                        # Obtain the polynomial terms of the known samples
+                        poly_terms_known = eval_data['sam_set_poly'][emul_s]
 
-                    # Obtain sam_set of frz_pot_par
-                    frz_pot_sam_set = self._sam_set[emul_i][:, frz_pot_par]
+                        # Calculate the regression covariances
+                        poly_cov_terms =\
+                            poly_terms @ eval_data['poly_coef_cov'][emul_s]
+                        cov += poly_cov_terms @ poly_terms_known.T
+                        prior_var += np.einsum('ij,ij->i', poly_cov_terms,
+                                               poly_terms)
 
-                    # Obtain polynomial terms of frz_pot_sam_set
-                    pf_obj = PF(self._poly_order, include_bias=False)
-                    frz_pot_poly_terms = pf_obj.fit_transform(frz_pot_sam_set)
+                # Calculate the adjusted expectation values
+                adj_exp_val[:, i] =\
+                    prior_exp+cov @ eval_data['exp_dot_term'][emul_s]
 
-                    # Perform linear regression with linear terms only
-                    sfs_obj.fit(frz_pot_sam_set, self._mod_set[emul_i][emul_s])
+                # Calculate the adjusted variance values
+                adj_var_val[:, i] =\
+                    prior_var-self._get_var_dot_term(emul_i, emul_s, cov)
 
-                    # Extract active parameters due to linear significance
-                    act_idx_lin = list(sfs_obj.k_feature_idx_)
+                # Add the evaluation time of this system to the total
+                self._eval_time[emul_i, emul_s] += time()-start_time
+                self._eval_n_sam[emul_i, emul_s] += sam_set.shape[0]
 
-                    # Get passive non-frozen parameters in linear significance
-                    pas_idx_lin = [i for i in non_frz_idx if
-                                   i not in act_idx_lin]
+        # Make sure that adj_var_val cannot drop below zero
+        np.maximum(0, adj_var_val, out=adj_var_val)
 
-                    # Make sure frozen parameters are considered active
-                    act_idx_lin = [i for i in frz_pot_idx if
-                                   i not in pas_idx_lin]
-                    act_idx = list(act_idx_lin)
+        # Return adj_exp_val and adj_var_val
+        return(adj_exp_val, adj_var_val)
 
-                    # Do n-order polynomial regression for every passive par
-                    for i in pas_idx_lin:
-                        # Check which polynomial terms involve this passive par
-                        poly_idx = pf_obj.powers_[:, i] != 0
+    # This function returns the data used for evaluating the emulator
+    @docstring_substitute(emul_i=std_emul_i_doc)
+    def _get_eval_data(self, emul_i):
+        """
+        Returns the data of all emulator systems on this MPI rank at emulator
+        iteration `emul_i` that is used by :meth:`~_evaluate_batch`, in the
+        floating point precision given by :attr:`~prism.Pipeline.eval_dtype`.
+        As the emulator is always constructed in double precision, downcast
+        copies of this data are made if single precision is requested, which
+        are cached until the data of this iteration changes.
 
-                        # Add the active linear terms as well
-                        poly_idx[act_idx_lin] = 1
+        Parameters
+        ----------
+        %(emul_i)s
 
-                        # Convert poly_idx to an array of indices
-                        poly_idx = np.arange(len(poly_idx))[poly_idx]
+        Returns
+        -------
+        eval_data : dict
+            Dict containing the known samples that evaluated samples must be
+            compared with ('known_set'), shifted by 'center' to reduce
+            round-off errors, and the lists of 'exp_dot_term', 'cov_mat_inv',
+            'cov_mat_chol', 'poly_coef', 'poly_coef_cov', 'poly_powers' and
+            'sam_set_poly' of all emulator systems.
 
-                        # Obtain polynomial terms for this passive parameter
-                        poly_terms = frz_pot_poly_terms[:, poly_idx]
+        """
 
-                        # Perform linear regression with addition of poly terms
-                        sfs_obj.fit(poly_terms, self._mod_set[emul_i][emul_s])
+        # Obtain the requested data type
+        dtype = np.dtype(self._pipeline._eval_dtype)
 
-                        # Extract indices of active polynomial terms
-                        act_idx_poly = poly_idx[list(sfs_obj.k_feature_idx_)]
+        # Check if the data has been converted to this data type before
+        eval_data = self._eval_data.get(emul_i)
+        if(eval_data is not None and eval_data['dtype'] == dtype):
+            return(eval_data)
 
-                        # Check if any additional polynomial terms survived
-                        # Add i to act_idx if this is the case
-                        if np.any([j not in act_idx_lin for
-                                   j in act_idx_poly]):
-                            act_idx.append(i)
+        # Obtain the known samples that sam_set must be compared with
+        if self._use_inducing(emul_i):
+            known_set = self._sam_set[emul_i][self._get_ind_idx(emul_i)]
+        else:
+            known_set = self._sam_set[emul_i]
+
+        # Shift them to the center of parameter space
+        center = np.average(self._modellink._par_rng, axis=1)
+        eval_data = {
+            'dtype': dtype,
+            'center': center,
+            'known_set': np.asarray(known_set-center, dtype)}
+
+        # Convert the data of all emulator systems
+        for attr in ('exp_dot_term', 'cov_mat_inv', 'cov_mat_chol',
+                     'poly_coef', 'poly_coef_cov', 'poly_powers'):
+            eval_data[attr] = [np.asarray(data, dtype) for data in
+                               getattr(self, '_%s' % (attr))[emul_i]]
+
+        # Convert the polynomial terms of sam_set if regr_cov is used
+        eval_data['sam_set_poly'] = [[] for _ in eval_data['exp_dot_term']]
+        if(self._method in ('regression', 'full') and self._use_regr_cov):
+            for emul_s in self._active_emul_s[emul_i]:
+                eval_data['sam_set_poly'][emul_s] = np.asarray(
+                    self._get_sam_set_poly(emul_i, emul_s), dtype)
+
+        # Save and return the data
+        self._eval_data[emul_i] = eval_data
+        return(eval_data)
+
+    # This function determines how many samples to evaluate at once
+    @docstring_substitute(emul_i=std_emul_i_doc)
+    def _get_batch_size(self, emul_i):
+        """
+        Determines the number of samples that should be evaluated at once by
+        the :meth:`~_evaluate_batch` method at emulator iteration `emul_i`,
+        such that its temporary arrays do not use more than
+        ``BATCH_MEM_SIZE`` bytes of memory.
 
-                    # Update the active parameters for this emulator system
-                    active_par_data.update(np_array(frz_pot_par)[act_idx])
+        Parameters
+        ----------
+        %(emul_i)s
 
-            # Log the resulting active parameters
-            logger.info("Active parameters for emulator system %i: %s"
-                        % (self._emul_s[emul_s],
-                           [self._modellink._par_name[par]
-                            for par in active_par_data]))
+        Returns
+        -------
+        batch_size : int
+            The maximum number of samples in a single batch.
 
-            # Convert active_par_data to a NumPy array and save
-            self._save_data(emul_i, emul_s, {
-                'active_par_data': np_array(active_par_data)})
+        """
 
-        # Log that active parameter determination is finished
-        logger.info("Finished determining active parameters.")
+        # Obtain the number of known samples every sample is compared with
+        if self._use_inducing(emul_i):
+            n_known = len(self._get_ind_idx(emul_i))
+        else:
+            n_known = self._n_sam[emul_i]
 
-    # This function performs a forward stepwise regression on sam_set
-    @docstring_substitute(emul_i=std_emul_i_doc, emul_s_seq=emul_s_seq_doc)
-    def _do_regression(self, emul_i, emul_s_seq):
+        # Every sample requires a few float rows of length n_known
+        item_size = np.dtype(self._pipeline._eval_dtype).itemsize
+        batch_size = BATCH_MEM_SIZE//(4*item_size*max(1, n_known))
+
+        # Return it
+        return(max(1, batch_size))
+
+    # This function returns a replica of all emulator systems in an iteration
+    @docstring_substitute(emul_i=std_emul_i_doc)
+    def _get_replica(self, emul_i, force=False):
         """
-        Performs a forward stepwise linear regression for all requested
-        emulator systems `emul_s_seq` in the provided emulator iteration
-        `emul_i`. Calculates what the expectation values of all polynomial
-        coefficients are. The polynomial order that is used in the regression
-        depends on :attr:`~poly_order`.
+        Returns a replica of this emulator that holds the evaluation data of
+        all active emulator systems in emulator iteration `emul_i` on every MPI
+        rank, such that sample sets can be distributed over all MPI ranks
+        instead of the emulator systems.
+        Unless `force` is *True*, a replica is only made if there are fewer
+        active emulator systems than MPI ranks, as some MPI ranks would remain
+        idle otherwise.
+
+        This method must be called by all MPI ranks simultaneously.
 
         Parameters
         ----------
         %(emul_i)s
-        %(emul_s_seq)s
 
-        Generates (for every emulator system)
-        -------------------------------------
-        rsdl_var : float
-            Residual variance of the regression function.
-        regr_score : float
-            Fit-score of the regression function.
-        poly_coef : 1D :obj:`~numpy.ndarray` object
-            Array containing the expectation values of the non-zero polynomial
-            coefficients.
-        poly_powers : 2D :obj:`~numpy.ndarray` object
-            Array containing the powers of the non-zero polynomial terms in the
-            regression function.
-        poly_idx : 1D :obj:`~numpy.ndarray` object
-            Array containing the indices of the non-zero polynomial terms in
-            the regression function.
-        poly_coef_cov : 1D :obj:`~numpy.ndarray` object (if \
-            :attr:`~use_regr_cov` is *True*)
-            Array containing the covariance values of the non-zero polynomial
-            coefficients.
+        Optional
+        --------
+        force : bool. Default: False
+            Whether or not to make a replica if every MPI rank has an active
+            emulator system.
 
-        """
+        Returns
+        -------
+        replica : :obj:`~Emulator` object or None
+            Read-only copy of this emulator with all active emulator systems in
+            emulator iteration `emul_i`, sorted on MPI rank. If no replica is
+            required, *None* is returned instead.
 
-        # Create logger
-        logger = getRLogger('REGRESSION')
-        logger.info("Performing regression.")
+        """
 
-        # Create SequentialFeatureSelector object
-        sfs_obj = SFS(LR(), k_features='best', forward=True, floating=False,
-                      scoring='neg_mean_squared_error',
-                      cv=self._n_cross_val)
+        # Check if the replica for this iteration has been made before
+        # Forced replicas are stored separately
+        key = (emul_i, 'force') if force else emul_i
+        try:
+            return(self._replicas[key])
+        except KeyError:
+            pass
 
-        # Create Scikit-learn Pipeline object
-        # The bias/intercept/constant-term is not included in the SFS object to
-        # ensure that it is taken into account in the linear regression, since
-        # it is required for getting the residual variance. It also ensures
-        # that the SFS does not focus on the constant-term in its calculations.
-        pipe = Pipeline_sk([('poly', PF(self._poly_order, include_bias=False)),
-                            ('SFS', sfs_obj),
-                            ('linear', LR())])
+        # Determine the total number of active emulator systems
+        n_active_emul_s = self._comm.allreduce(
+            len(self._active_emul_s[emul_i]))
 
-        # Loop over all emulator systems and perform a regression on them
-        for emul_s in emul_s_seq:
-            # Extract active_sam_set
-            active_sam_set = self._sam_set[emul_i][
-                :, self._active_par_data[emul_i][emul_s]]
+        # If every MPI rank has an active emulator system, return None
+        if not(0 < n_active_emul_s < self._size or
+               (n_active_emul_s and force)):
+            self._replicas[key] = None
+            return(None)
 
-            # Wrap in try-statement to add additional info if error is raised
-            # TODO: Sometimes, regression can fail with "SVD did not converge"
-            # Find out why and check if it can be avoided
-            try:
-                # Perform regression for this emulator system
-                pipe.fit(active_sam_set, self._mod_set[emul_i][emul_s])
-            except Exception as error:      # pragma: no cover
-                # If an error is raised, add which emulator system that was
-                raise_error(str(error)+" [emul_%i]" % (self._emul_s[emul_s]),
-                            type(error), logger, error.__traceback__)
+        # Do some logging
+        logger = getCLogger('REPLICA')
+        logger.info("Replicating all %i active emulator systems in emulator "
+                    "iteration %i on every MPI rank."
+                    % (n_active_emul_s, emul_i))
+
+        # Make a shallow copy of this emulator
+        replica = copy(self)
+
+        # Gather the data of all active emulator systems on all MPI ranks
+        for attr in ('_active_par_data', '_rsdl_var', '_act_rsdl_var',
+                     '_pas_rsdl_var', '_poly_coef', '_poly_coef_cov',
+                     '_poly_powers', '_poly_idx', '_cov_mat_inv',
+                     '_cov_mat_chol', '_exp_dot_term', '_data_val',
+                     '_data_err', '_data_spc', '_data_idx'):
+            # Obtain the data of all active emulator systems on this rank
+            data = [getattr(self, attr)[emul_i][emul_s]
+                    for emul_s in self._active_emul_s[emul_i]]
+
+            # Gather the data of all ranks and combine them in order
+            data_list = self._comm.allgather(data)
+            attr_list = list(getattr(self, attr))
+            attr_list[emul_i] = sum(data_list, [])
+            setattr(replica, attr, attr_list)
+
+        # Set the active emulator systems and data points of the replica
+        replica._active_emul_s = list(self._active_emul_s)
+        replica._active_emul_s[emul_i] = list(range(n_active_emul_s))
+        replica._n_data = list(self._n_data)
+        replica._n_data[emul_i] = n_active_emul_s
+
+        # Give the replica its own caches
+        replica._sam_set_poly = list(self._sam_set_poly)
+        replica._sam_set_poly[emul_i] = [[] for _ in range(n_active_emul_s)]
+        replica._impl_data = {}
+        replica._md_var_def = {}
+        replica._replicas = {}
+        replica._eval_data = {}
+        replica._eval_time = Counter()
+        replica._eval_n_sam = Counter()
+
+        # Seed the rejection powers of the replica with those of all systems
+        # This allows the replica to order its systems for early rejection
+        reject_power = self._comm.allgather(
+            [(self._impl_sum[emul_i, emul_s], self._impl_n_sam[emul_i, emul_s])
+             for emul_s in self._active_emul_s[emul_i]])
+        replica._impl_seed = np_array(sum(reject_power, []))
+        replica._impl_sum = Counter()
+        replica._impl_n_sam = Counter()
+        for emul_s, (impl_sum, n_sam) in enumerate(replica._impl_seed):
+            if n_sam:
+                replica._impl_sum[emul_i, emul_s] = impl_sum
+                replica._impl_n_sam[emul_i, emul_s] = int(n_sam)
+
+        # Save and return the replica
+        self._replicas[key] = replica
+        return(replica)
+
+    # This function combines the statistics measured by emulator replicas
+    def _merge_replicas(self):
+        """
+        Combines the evaluation times and rejection powers that were measured
+        by the replicas made by :meth:`~_get_replica` on all MPI ranks since
+        the last time this method was called, and adds them to the emulator
+        systems on this MPI rank they belong to.
 
-            # Obtain the corresponding polynomial indices
-            poly_idx = np_array(pipe.named_steps['SFS'].k_feature_idx_)
+        This method must be called by all MPI ranks simultaneously.
 
-            # Extract sam_set_poly
-            sam_set_poly = pipe.named_steps['poly'].transform(
-                active_sam_set)[:, poly_idx]
+        """
 
-            # Extract the residual variance
-            rsdl_var = mse(self._mod_set[emul_i][emul_s],
-                           pipe.named_steps['linear'].predict(sam_set_poly))
+        # Loop over all replicas that were made
+        for key, replica in self._replicas.items():
+            # If no replica was required, continue
+            if replica is None:
+                continue
+
+            # Obtain the emulator iteration of this replica
+            emul_i = key[0] if isinstance(key, tuple) else key
+
+            # Determine which systems in the replica belong to this MPI rank
+            n_emul_s = self._comm.allgather(len(self._active_emul_s[emul_i]))
+            start = sum(n_emul_s[:self._rank])
+            end = start+n_emul_s[self._rank]
+
+            # Sum the evaluation times measured by all MPI ranks
+            eval_cost = self._comm.allreduce(np_array([
+                (replica._eval_time[emul_i, emul_s],
+                 replica._eval_n_sam[emul_i, emul_s])
+                for emul_s in range(sum(n_emul_s))]))
+            replica._eval_time.clear()
+            replica._eval_n_sam.clear()
+
+            # Add the evaluation times of the systems on this MPI rank
+            for emul_s, (eval_time, n_sam) in zip(
+                    self._active_emul_s[emul_i], eval_cost[start:end]):
+                if n_sam:
+                    self._eval_time[emul_i, emul_s] += eval_time
+                    self._eval_n_sam[emul_i, emul_s] += int(n_sam)
+
+            # Combine the rejection powers measured by all MPI ranks
+            seed = replica._impl_seed
+            reject_power = np_array([
+                (replica._impl_sum[emul_i, emul_s],
+                 replica._impl_n_sam[emul_i, emul_s])
+                for emul_s in range(sum(n_emul_s))])
+            reject_power = seed+self._comm.allreduce(reject_power-seed)
+
+            # Add the rejection powers of the systems on this MPI rank
+            for emul_s, (impl_sum, n_sam) in zip(
+                    self._active_emul_s[emul_i],
+                    (reject_power-seed)[start:end]):
+                if n_sam:
+                    self._impl_sum[emul_i, emul_s] += impl_sum
+                    self._impl_n_sam[emul_i, emul_s] += int(n_sam)
+
+            # Update the rejection powers of the replica to the combined ones
+            replica._impl_seed = reject_power
+            for emul_s, (impl_sum, n_sam) in enumerate(reject_power):
+                if n_sam:
+                    replica._impl_sum[emul_i, emul_s] = impl_sum
+                    replica._impl_n_sam[emul_i, emul_s] = int(n_sam)
+
+    # This function returns groups of emulator systems for early rejection
+    @docstring_substitute(emul_i=std_emul_i_doc)
+    def _get_eval_groups(self, emul_i, n_groups):
+        """
+        Divides the active emulator systems on this MPI rank in emulator
+        iteration `emul_i` into `n_groups` groups, ordered on their rejection
+        power. The rejection power of an emulator system is its average
+        univariate implausibility value in all evaluations so far, as reported
+        to :meth:`~_update_reject_power`.
+
+        Parameters
+        ----------
+        %(emul_i)s
+        n_groups : int
+            The number of groups to divide the active emulator systems into.
+
+        Returns
+        -------
+        eval_groups : list of 1D :obj:`~numpy.ndarray` objects
+            List containing the indices of the active emulator systems in every
+            group, with the highest rejection powers in the first group.
+
+        """
+
+        # Determine the rejection power of all active emulator systems
+        reject_power = np_array([
+            self._impl_sum[emul_i, emul_s]/max(1, self._impl_n_sam[emul_i,
+                                                                   emul_s])
+            for emul_s in self._active_emul_s[emul_i]])
+
+        # Sort the systems on decreasing rejection power and divide them
+        act_idx = np.argsort(-reject_power, kind='stable')
+        return(np.array_split(act_idx, n_groups))
+
+    # This function updates the rejection power of emulator systems
+    @docstring_substitute(emul_i=std_emul_i_doc, emul_s_seq=emul_s_seq_doc)
+    def _update_reject_power(self, emul_i, emul_s_seq, uni_impl_vals):
+        """
+        Updates the rejection power of all emulator systems in `emul_s_seq` in
+        emulator iteration `emul_i` with the provided univariate
+        implausibility values `uni_impl_vals`.
+
+        Parameters
+        ----------
+        %(emul_i)s
+        %(emul_s_seq)s
+        uni_impl_vals : 2D :obj:`~numpy.ndarray` object
+            Univariate implausibility values of a set of samples for all
+            emulator systems in `emul_s_seq`.
+
+        """
+
+        # Add the implausibility values of every system to the totals
+        for emul_s, impl_sum in zip(emul_s_seq, uni_impl_vals.sum(axis=0)):
+            self._impl_sum[emul_i, emul_s] += impl_sum
+            self._impl_n_sam[emul_i, emul_s] += uni_impl_vals.shape[0]
+
+    # This function extracts the set of active parameters
+    # TODO: Write code cleaner, if possible
+    @docstring_substitute(emul_i=std_emul_i_doc, emul_s_seq=emul_s_seq_doc)
+    def _get_active_par(self, emul_i, emul_s_seq):
+        """
+        Determines the active parameters to be used for every emulator system
+        listed in `emul_s_seq` in the provided emulator iteration `emul_i`.
+        Uses backwards stepwise elimination to determine the set of active
+        parameters. The polynomial order that is used in the stepwise
+        elimination depends on :attr:`~poly_order`, and the elimination is
+        performed with :func:`~prism.emulator._selection.select_backward` for
+        all emulator systems that share the same parameters at once.
+
+        Parameters
+        ----------
+        %(emul_i)s
+        %(emul_s_seq)s
+
+        Generates (for every emulator system)
+        -------------------------------------
+        active_par_data : 1D :obj:`~numpy.ndarray` object
+            Array containing the indices of all the parameters that are active
+            in the emulator iteration `emul_i`.
+
+        """
+
+        # Log that active parameters are being determined
+        logger = getRLogger('ACTIVE_PAR')
+        logger.info("Determining active parameters.")
+
+        # Initialize active parameters data sets and the analysis groups
+        active_par_data = {}
+        anal_groups = {}
+
+        # Loop over all emulator systems and determine which need an analysis
+        for emul_s in emul_s_seq:
+            # Initialize active parameters data set
+            active_par_data[emul_s] = sset()
+
+            # Check if previously active parameters must be active again
+            if(self._pipeline._freeze_active_par and
+               emul_s in self._active_emul_s[emul_i-1] and
+               self._data_idx[emul_i-1][emul_s] ==
+               self._data_idx[emul_i][emul_s]):
+                active_par_data[emul_s].update(
+                    self._active_par_data[emul_i-1][emul_s])
+
+            # Check if active parameters analysis has been requested
+            if not self._pipeline._do_active_anal:
+                # If not requested, then save all potentially active parameters
+                active_par_data[emul_s].update(self._pipeline._pot_active_par)
+
+            # If requested, group the system on its frozen+pot_active params
+            # Only carry out analysis if a non-frozen parameter is left
+            elif(sset(self._pipeline._pot_active_par) -
+                 active_par_data[emul_s]):
+                frz_pot_par = sset(active_par_data[emul_s])
+                frz_pot_par.update(self._pipeline._pot_active_par)
+                anal_groups.setdefault(tuple(frz_pot_par), []).append(emul_s)
+
+        # Obtain the sam_set of frz_pot_par and mod_sets of every group
+        anal_groups = [(list(frz_pot_par), emul_s_group) for
+                       frz_pot_par, emul_s_group in anal_groups.items()]
+        frz_pot_sam_sets = [self._sam_set[emul_i][:, frz_pot_par] for
+                            frz_pot_par, _ in anal_groups]
+        mod_sets = [np.array([self._mod_set[emul_i][emul_s] for emul_s in
+                              emul_s_group]).T for _, emul_s_group in
+                    anal_groups]
+
+        # Perform linear regression with linear terms only for every group
+        act_idx_lin_groups = self._pool_map(
+            select_backward, frz_pot_sam_sets, mod_sets,
+            [self._n_cross_val]*len(anal_groups))
+
+        # Create PolynomialFeatures object
+        pf_obj = PF(self._poly_order, include_bias=False)
+
+        # Initialize the active parameters and polynomial regressions
+        act_idx = {}
+        frz_pot_poly_terms = []
+        poly_groups = {}
+
+        # Loop over all groups and determine which poly terms to consider
+        for g, ((frz_pot_par, emul_s_group), act_idx_lin_group) in enumerate(
+                zip(anal_groups, act_idx_lin_groups)):
+            # Obtain polynomial terms of frz_pot_sam_set
+            frz_pot_idx = list(range(len(frz_pot_par)))
+            frz_pot_poly_terms.append(
+                pf_obj.fit_transform(frz_pot_sam_sets[g]))
+
+            # Loop over all emulator systems in this group
+            for j, emul_s in enumerate(emul_s_group):
+                # Obtain non-frozen potentially active parameters
+                non_frz_idx = [frz_pot_par.index(par) for par in
+                               self._pipeline._pot_active_par
+                               if par not in active_par_data[emul_s]]
+
+                # Get passive non-frozen parameters in linear significance
+                pas_idx_lin = [i for i in non_frz_idx if
+                               i not in act_idx_lin_group[j]]
+
+                # Make sure frozen parameters are considered active
+                act_idx_lin = [i for i in frz_pot_idx if
+                               i not in pas_idx_lin]
+                act_idx[emul_s] = list(act_idx_lin)
+
+                # Do n-order polynomial regression for every passive par
+                for i in pas_idx_lin:
+                    # Check which polynomial terms involve this passive par
+                    poly_idx = pf_obj.powers_[:, i] != 0
+
+                    # Add the active linear terms as well
+                    poly_idx[act_idx_lin] = 1
+
+                    # Convert poly_idx to an array of indices
+                    poly_idx = np.arange(len(poly_idx))[poly_idx]
+
+                    # Group the regression with all that use the same terms
+                    poly_groups.setdefault((g, tuple(poly_idx)), []).append(
+                        (emul_s, j, i, act_idx_lin))
+
+        # Obtain polynomial terms and mod_sets of all polynomial regressions
+        poly_terms = [frz_pot_poly_terms[g][:, list(poly_idx)] for
+                      g, poly_idx in poly_groups]
+        poly_mod_sets = [mod_sets[g][:, [j for _, j, _, _ in regrs]] for
+                         (g, _), regrs in poly_groups.items()]
+
+        # Perform linear regression with addition of poly terms
+        act_idx_poly_groups = self._pool_map(
+            select_backward, poly_terms, poly_mod_sets,
+            [self._n_cross_val]*len(poly_groups))
+
+        # Loop over all polynomial regressions
+        for ((_, poly_idx), regrs), act_idx_poly_group in zip(
+                poly_groups.items(), act_idx_poly_groups):
+            # Extract indices of active polynomial terms of every regression
+            poly_idx = np_array(poly_idx)
+            for (emul_s, _, i, act_idx_lin), act_idx_poly in zip(
+                    regrs, act_idx_poly_group):
+                # Check if any additional polynomial terms survived
+                # Add i to act_idx if this is the case
+                if np.any([j not in act_idx_lin for
+                           j in poly_idx[act_idx_poly]]):
+                    act_idx[emul_s].append(i)
+
+        # Update the active parameters for all analyzed emulator systems
+        for frz_pot_par, emul_s_group in anal_groups:
+            for emul_s in emul_s_group:
+                active_par_data[emul_s].update(
+                    np_array(frz_pot_par)[act_idx[emul_s]])
+
+        # Loop over all emulator systems and save their active parameters
+        for emul_s in emul_s_seq:
+            # Log the resulting active parameters
+            logger.info("Active parameters for emulator system %i: %s"
+                        % (self._emul_s[emul_s],
+                           [self._modellink._par_name[par]
+                            for par in active_par_data[emul_s]]))
+
+            # Convert active_par_data to a NumPy array and save
+            self._save_data(emul_i, emul_s, {
+                'active_par_data': np_array(active_par_data[emul_s])})
+
+        # Log that active parameter determination is finished
+        logger.info("Finished determining active parameters.")
+
+    # This function performs a forward stepwise regression on sam_set
+    @docstring_substitute(emul_i=std_emul_i_doc, emul_s_seq=emul_s_seq_doc)
+    def _do_regression(self, emul_i, emul_s_seq):
+        """
+        Performs a forward stepwise linear regression for all requested
+        emulator systems `emul_s_seq` in the provided emulator iteration
+        `emul_i`. Calculates what the expectation values of all polynomial
+        coefficients are. The polynomial order that is used in the regression
+        depends on :attr:`~poly_order`, and the polynomial terms are selected
+        with :func:`~prism.emulator._selection.select_forward`.
+
+        Parameters
+        ----------
+        %(emul_i)s
+        %(emul_s_seq)s
+
+        Generates (for every emulator system)
+        -------------------------------------
+        rsdl_var : float
+            Residual variance of the regression function.
+        regr_score : float
+            Fit-score of the regression function.
+        poly_coef : 1D :obj:`~numpy.ndarray` object
+            Array containing the expectation values of the non-zero polynomial
+            coefficients.
+        poly_powers : 2D :obj:`~numpy.ndarray` object
+            Array containing the powers of the non-zero polynomial terms in the
+            regression function.
+        poly_idx : 1D :obj:`~numpy.ndarray` object
+            Array containing the indices of the non-zero polynomial terms in
+            the regression function.
+        poly_coef_cov : 2D :obj:`~numpy.ndarray` object (if \
+            :attr:`~use_regr_cov` is *True*)
+            Matrix containing the covariance values of the non-zero polynomial
+            coefficients. It is stored flattened in the HDF5-file.
+
+        """
+
+        # Create logger
+        logger = getRLogger('REGRESSION')
+        logger.info("Performing regression.")
+
+        # Create PolynomialFeatures object
+        # The bias/intercept/constant-term is not included in the polynomial
+        # terms, as the forward selection always takes it into account in the
+        # linear regression, since it is required for getting the residual
+        # variance. It also ensures that the selection does not focus on the
+        # constant-term in its calculations.
+        pf_obj = PF(self._poly_order, include_bias=False)
+
+        # Select the polynomial terms for all emulator systems
+        # A separate PolynomialFeatures object is used for the selection
+        sel_pf_obj = PF(self._poly_order, include_bias=False)
+        poly_idx_seq = self._pool_map(
+            select_forward,
+            (sel_pf_obj.fit_transform(self._sam_set[emul_i][
+                :, self._active_par_data[emul_i][emul_s]])
+             for emul_s in emul_s_seq),
+            (self._mod_set[emul_i][emul_s] for emul_s in emul_s_seq),
+            [self._n_cross_val]*len(emul_s_seq))
+
+        # Loop over all emulator systems and perform a regression on them
+        for emul_s in emul_s_seq:
+            # Extract active_sam_set and its polynomial terms
+            active_sam_set = self._sam_set[emul_i][
+                :, self._active_par_data[emul_i][emul_s]]
+            sam_set_poly = pf_obj.fit_transform(active_sam_set)
+
+            # Wrap in try-statement to add additional info if error is raised
+            try:
+                # Obtain the selected polynomial terms for this emulator system
+                poly_idx = np_array(next(poly_idx_seq))
+
+                # Perform regression with the selected polynomial terms
+                sam_set_poly = sam_set_poly[:, poly_idx]
+                lr_obj = LR().fit(sam_set_poly, self._mod_set[emul_i][emul_s])
+            except Exception as error:      # pragma: no cover
+                # If an error is raised, add which emulator system that was
+                raise_error(str(error)+" [emul_%i]" % (self._emul_s[emul_s]),
+                            type(error), logger, error.__traceback__)
+
+            # Extract the residual variance
+            rsdl_var = mse(self._mod_set[emul_i][emul_s],
+                           lr_obj.predict(sam_set_poly))
 
             # Log the score of the regression process
-            regr_score = pipe.named_steps['linear'].score(
-                sam_set_poly, self._mod_set[emul_i][emul_s])
+            regr_score = lr_obj.score(sam_set_poly,
+                                      self._mod_set[emul_i][emul_s])
             logger.info("Regression score for emulator system %i: %f."
                         % (self._emul_s[emul_s], regr_score))
 
             # Obtain polynomial powers and include intercept term
-            poly_powers = np.insert(pipe.named_steps['poly'].powers_[poly_idx],
-                                    0, 0, 0)
+            poly_powers = np.insert(pf_obj.powers_[poly_idx], 0, 0, 0)
 
             # Obtain polynomial coefficients and include intercept term
-            poly_coef = np.insert(pipe.named_steps['linear'].coef_, 0,
-                                  pipe.named_steps['linear'].intercept_, 0)
+            poly_coef = np.insert(lr_obj.coef_, 0, lr_obj.intercept_, 0)
 
             # Check every polynomial coefficient if it is significant enough
             poly_sign = ~np.isclose(poly_coef, 0)
@@ -1690,23 +2538,22 @@ class Emulator(object):
             poly_powers = poly_powers[:, new_active_par_idx]
             new_active_par =\
                 self._active_par_data[emul_i][emul_s][new_active_par_idx]
-            new_pf_obj = PF(self._poly_order).fit([[0]*poly_powers.shape[1]])
-            new_powers = new_pf_obj.powers_
-            new_powers_list = new_powers.tolist()
+            new_powers_list =\
+                self._get_poly_powers_table(poly_powers.shape[1]).tolist()
             poly_powers_list = poly_powers.tolist()
             poly_idx = np_array([i for i, powers in enumerate(new_powers_list)
                                  if powers in poly_powers_list])
 
+            # Redetermine the active sam_set_poly
+            active_sam_set = self._sam_set[emul_i][:, new_active_par]
+            sam_set_poly =\
+                PF(self._poly_order).fit_transform(active_sam_set)[:, poly_idx]
+
             # If regression covariances are requested, calculate them
             if self._use_regr_cov:
-                # Redetermine the active sam_set_poly
-                active_sam_set = self._sam_set[emul_i][:, new_active_par]
-                sam_set_poly =\
-                    new_pf_obj.fit_transform(active_sam_set)[:, poly_idx]
-
                 # Calculate the poly_coef covariances
                 poly_coef_cov = rsdl_var*self._get_inv_matrix(
-                    sam_set_poly.T @ sam_set_poly).flatten()
+                    sam_set_poly.T @ sam_set_poly)
 
             # Create regression data dict
             regr_data_dict = {
@@ -1725,6 +2572,9 @@ class Emulator(object):
             self._save_data(emul_i, emul_s, {
                 'regression': regr_data_dict})
 
+            # Cache the polynomial terms of sam_set for this emulator system
+            self._sam_set_poly[emul_i][emul_s] = sam_set_poly
+
         # Log that this is finished
         logger.info("Finished performing regression.")
 
@@ -1765,14 +2615,8 @@ class Emulator(object):
                 prior_exp += 0
             if self._method in ('regression', 'full'):
                 for i, emul_s in enumerate(emul_s_seq):
-                    # Initialize PF object
-                    pf_obj = PF(self._poly_order)
-
                     # Obtain the polynomial terms
-                    poly_terms = pf_obj.fit_transform(
-                        self._sam_set[emul_i][
-                            :, self._active_par_data[emul_i][emul_s]])[
-                                :, self._poly_idx[emul_i][emul_s]]
+                    poly_terms = self._get_sam_set_poly(emul_i, emul_s)
                     prior_exp[i] += np.sum(
                         self._poly_coef[emul_i][emul_s]*poly_terms, axis=-1)
 
@@ -1829,8 +2673,36 @@ class Emulator(object):
 
         # Calculate the exp_dot_term values and save it to hdf5
         for i, emul_s in enumerate(emul_s_seq):
-            exp_dot_term = self._cov_mat_inv[emul_i][emul_s] @\
-                (self._mod_set[emul_i][emul_s]-prior_exp_sam_set[i])
+            # Obtain the Cholesky factor of this emulator system
+            cov_mat_chol = self._cov_mat_chol[emul_i][emul_s]
+
+            # If inducing points are used, project onto the inducing points
+            if self._use_inducing(emul_i):
+                # Obtain the reduced covariance matrix
+                with self._File('r', self._emul_s[emul_s]) as file:
+                    cov_mat = file['%i/cov_mat' % (emul_i)][()]
+
+                # Calculate the Gaussian covariances with the inducing points
+                kernel_nm = self._get_ind_kernel(
+                    emul_i, self._active_par_data[emul_i][emul_s])
+                cov_nm = self._act_rsdl_var[emul_i][emul_s]*kernel_nm
+
+                # Solve the reduced linear system
+                exp_dot_term = self._get_inv_matrix(cov_mat) @ (
+                    cov_nm.T @ (self._mod_set[emul_i][emul_s] -
+                                prior_exp_sam_set[i]))
+
+            # If it is available, solve the linear system with it
+            elif len(cov_mat_chol):
+                exp_dot_term = cho_solve(
+                    (cov_mat_chol, True),
+                    self._mod_set[emul_i][emul_s]-prior_exp_sam_set[i],
+                    check_finite=False)
+
+            # Else, use the inverse of the covariance matrix
+            else:
+                exp_dot_term = self._cov_mat_inv[emul_i][emul_s] @\
+                    (self._mod_set[emul_i][emul_s]-prior_exp_sam_set[i])
             self._save_data(emul_i, emul_s, {
                 'exp_dot_term': {
                     'prior_exp_sam_set': prior_exp_sam_set[i],
@@ -1863,24 +2735,24 @@ class Emulator(object):
 
             # Check what 'method' is given
             if self._method in ('gaussian', 'full'):
-                # Obtain the difference between sam_set and sam_set
-                diff_sam_set = diff(self._sam_set[emul_i], flatten=False)
-
                 # If Gaussian needs to be taken into account
-                for i, emul_s in enumerate(emul_s_seq):
-                    # Get active_par and rsdl_var portions
-                    active_par = self._active_par_data[emul_i][emul_s]
-                    act_rsdl_var = self._act_rsdl_var[emul_i][emul_s]
-                    pas_rsdl_var = self._pas_rsdl_var[emul_i][emul_s]
+                for active_par, group in self._get_kernel_groups(emul_i,
+                                                                 emul_s_seq):
+                    # Calculate the Gaussian kernel shared by this group
+                    kernel = self._get_sam_set_kernel(emul_i, active_par)
 
-                    # Gaussian variance
-                    cov[i] += act_rsdl_var *\
-                        np.exp(-1*np.sum(diff_sam_set[:, :, active_par]**2,
-                                         axis=-1) /
-                               np.sum(self._l_corr[active_par]**2))
+                    # Loop over all emulator systems in this group
+                    for i in group:
+                        # Get rsdl_var portions
+                        emul_s = emul_s_seq[i]
+                        act_rsdl_var = self._act_rsdl_var[emul_i][emul_s]
+                        pas_rsdl_var = self._pas_rsdl_var[emul_i][emul_s]
 
-                    # Passive parameter variety plus inflation term
-                    cov[i] += pas_rsdl_var*np.eye(self._n_sam[emul_i])
+                        # Gaussian variance
+                        cov[i] += act_rsdl_var*kernel
+
+                        # Passive parameter variety plus inflation term
+                        cov[i] += pas_rsdl_var*np.eye(self._n_sam[emul_i])
 
             if(self._method in ('regression', 'full') and self._use_regr_cov):
                 # If regression needs to be taken into account
@@ -1896,22 +2768,29 @@ class Emulator(object):
                 # Obtain the difference between par_set1 and sam_set
                 diff_sam_set = par_set1-self._sam_set[emul_i]
 
-                # If Gaussian needs to be taken into account
-                for i, emul_s in enumerate(emul_s_seq):
-                    # Get active_par and rsdl_var portions
-                    active_par = self._active_par_data[emul_i][emul_s]
-                    act_rsdl_var = self._act_rsdl_var[emul_i][emul_s]
-                    pas_rsdl_var = self._pas_rsdl_var[emul_i][emul_s]
-
-                    # Gaussian variance
-                    cov[i] += act_rsdl_var *\
-                        np.exp(-1*np.sum(diff_sam_set[:, active_par]**2,
-                                         axis=-1) /
-                               np.sum(self._l_corr[active_par]**2))
+                # Determine which known samples are equal to par_set1
+                eq_mask = (par_set1 == self._sam_set[emul_i]).all(axis=-1)
 
-                    # Passive parameter variety plus inflation term
-                    cov[i] += pas_rsdl_var*(par_set1 ==
-                                            self._sam_set[emul_i]).all(axis=-1)
+                # If Gaussian needs to be taken into account
+                for active_par, group in self._get_kernel_groups(emul_i,
+                                                                 emul_s_seq):
+                    # Calculate the Gaussian kernel shared by this group
+                    kernel = np.exp(
+                        -1*np.sum(diff_sam_set[:, active_par]**2, axis=-1) /
+                        np.sum(self._l_corr[active_par]**2))
+
+                    # Loop over all emulator systems in this group
+                    for i in group:
+                        # Get rsdl_var portions
+                        emul_s = emul_s_seq[i]
+                        act_rsdl_var = self._act_rsdl_var[emul_i][emul_s]
+                        pas_rsdl_var = self._pas_rsdl_var[emul_i][emul_s]
+
+                        # Gaussian variance
+                        cov[i] += act_rsdl_var*kernel
+
+                        # Passive parameter variety plus inflation term
+                        cov[i] += pas_rsdl_var*eq_mask
 
             if(self._method in ('regression', 'full') and self._use_regr_cov):
                 # If regression needs to be taken into account
@@ -1928,20 +2807,26 @@ class Emulator(object):
                 diff_sam_set = par_set1-par_set2
 
                 # If Gaussian needs to be taken into account
-                for i, emul_s in enumerate(emul_s_seq):
-                    # Get active_par and rsdl_var portions
-                    active_par = self._active_par_data[emul_i][emul_s]
-                    act_rsdl_var = self._act_rsdl_var[emul_i][emul_s]
-                    pas_rsdl_var = self._pas_rsdl_var[emul_i][emul_s]
+                for active_par, group in self._get_kernel_groups(emul_i,
+                                                                 emul_s_seq):
+                    # Calculate the Gaussian kernel shared by this group
+                    kernel = np.exp(
+                        -1*np.sum(diff_sam_set[active_par]**2, axis=-1) /
+                        np.sum(self._l_corr[active_par]**2))
+
+                    # Loop over all emulator systems in this group
+                    for i in group:
+                        # Get rsdl_var portions
+                        emul_s = emul_s_seq[i]
+                        act_rsdl_var = self._act_rsdl_var[emul_i][emul_s]
+                        pas_rsdl_var = self._pas_rsdl_var[emul_i][emul_s]
+
+                        # Gaussian variance
+                        cov[i] += act_rsdl_var*kernel
+
+                        # Passive parameter variety plus inflation term
+                        cov[i] += pas_rsdl_var*(par_set1 == par_set2).all()
 
-                    # Gaussian variance
-                    cov[i] += act_rsdl_var *\
-                        np.exp(-1*np.sum(diff_sam_set[active_par]**2,
-                                         axis=-1) /
-                               np.sum(self._l_corr[active_par]**2))
-
-                    # Passive parameter variety plus inflation term
-                    cov[i] += pas_rsdl_var*(par_set1 == par_set2).all()
             if(self._method in ('regression', 'full') and self._use_regr_cov):
                 # If regression needs to be taken into account
                 cov += self._get_regr_cov(emul_i, emul_s_seq, par_set1,
@@ -1950,9 +2835,204 @@ class Emulator(object):
         # Return it
         return(cov)
 
+    # This function calculates the Gaussian kernel of sam_set in blocks
+    @docstring_substitute(emul_i=std_emul_i_doc)
+    def _get_sam_set_kernel(self, emul_i, active_par, start=0):
+        """
+        Calculates the Gaussian kernel between all known model evaluation
+        samples at emulator iteration `emul_i`, using the provided active
+        parameters `active_par`.
+        The kernel is calculated in blocks of rows, such that the temporary
+        arrays required for a block do not use more than
+        :attr:`~prism.Pipeline.cov_mem_size` MiB of memory.
+
+        Parameters
+        ----------
+        %(emul_i)s
+        active_par : list of int
+            List containing the indices of the active parameters.
+
+        Optional
+        --------
+        start : int. Default: 0
+            The index of the first known sample for which the row of the
+            kernel must be calculated. Used for only calculating the kernel
+            between samples that were added to the iteration and all samples.
+
+        Returns
+        -------
+        kernel : 2D :obj:`~numpy.ndarray` object
+            The Gaussian kernel between all known model evaluation samples
+            starting at `start` and all known model evaluation samples.
+
+        """
+
+        # Obtain the active part of sam_set
+        act_sam_set = self._sam_set[emul_i][:, active_par]
+        n_sam = act_sam_set.shape[0]
+
+        # Determine how many rows fit in a single block
+        row_size = 8*n_sam*(len(active_par)+1)
+        n_rows = max(1, int(self._pipeline._cov_mem_size*2**20//row_size))
+
+        # Calculate the squared distances of all samples block by block
+        kernel = np.empty([n_sam-start, n_sam])
+        for i in range(start, n_sam, n_rows):
+            diff_sam_set = act_sam_set[i:i+n_rows, np.newaxis]-act_sam_set
+            diff_sam_set **= 2
+            np.sum(diff_sam_set, axis=-1,
+                   out=kernel[i-start:i-start+n_rows])
+
+        # Convert them to the Gaussian kernel
+        kernel /= -1*np.sum(self._l_corr[active_par]**2)
+        np.exp(kernel, out=kernel)
+
+        # Return it
+        return(kernel)
+
+    # This function groups emulator systems on their active parameters
+    @docstring_substitute(emul_i=std_emul_i_doc, emul_s_seq=emul_s_seq_doc)
+    def _get_kernel_groups(self, emul_i, emul_s_seq):
+        """
+        Groups the requested emulator systems `emul_s_seq` at emulator
+        iteration `emul_i` on their active parameters, such that the Gaussian
+        kernel only has to be calculated once for all systems in a group.
+
+        Parameters
+        ----------
+        %(emul_i)s
+        %(emul_s_seq)s
+
+        Returns
+        -------
+        kernel_groups : list of tuple
+            List containing for every group the active parameters shared by
+            all emulator systems in it and the indices in `emul_s_seq` of
+            these systems.
+
+        """
+
+        # Create empty dict of kernel groups
+        kernel_groups = odict()
+
+        # Loop over all requested emulator systems and group them
+        for i, emul_s in enumerate(emul_s_seq):
+            active_par = tuple(self._active_par_data[emul_i][emul_s])
+            kernel_groups.setdefault(active_par, []).append(i)
+
+        # Return kernel_groups
+        return([(list(active_par), group)
+                for active_par, group in kernel_groups.items()])
+
+    # This function checks if inducing points are used in an iteration
+    @docstring_substitute(emul_i=std_emul_i_doc)
+    def _use_inducing(self, emul_i):
+        """
+        Checks whether or not the Gaussian covariances at emulator iteration
+        `emul_i` are approximated using a reduced set of inducing points (see
+        :attr:`~n_inducing`).
+
+        Parameters
+        ----------
+        %(emul_i)s
+
+        Returns
+        -------
+        use_inducing : bool
+            Whether or not inducing points are used at `emul_i`.
+
+        """
+
+        # Inducing points are used if they are fewer than the known samples
+        return(bool(self._n_inducing and
+                    self._method in ('gaussian', 'full') and
+                    self._n_inducing < self._n_sam[emul_i]))
+
+    # This function returns the indices of the inducing points
+    @docstring_substitute(emul_i=std_emul_i_doc)
+    def _get_ind_idx(self, emul_i):
+        """
+        Returns the indices of the model evaluation samples at emulator
+        iteration `emul_i` that are used as inducing points. These are chosen
+        by greedily adding the sample that is the farthest away from all
+        previously chosen samples, after normalizing the parameter space, and
+        are cached afterward.
+
+        Parameters
+        ----------
+        %(emul_i)s
+
+        Returns
+        -------
+        ind_idx : 1D :obj:`~numpy.ndarray` object
+            The sorted indices of all inducing points in the model evaluation
+            samples at `emul_i`.
+
+        """
+
+        # Check if the inducing points have been determined before
+        if emul_i not in self._ind_idx:
+            # Normalize the model evaluation samples
+            par_rng = self._modellink._par_rng
+            sam_set = (self._sam_set[emul_i]-par_rng[:, 0]) /\
+                (par_rng[:, 1]-par_rng[:, 0])
+
+            # Start with the sample that is closest to the center
+            ind_idx = [np.argmin(np.sum((sam_set-0.5)**2, axis=-1))]
+            min_dist_sq = np.sum((sam_set-sam_set[ind_idx[0]])**2, axis=-1)
+
+            # Add the sample that is the farthest away from all others
+            for _ in range(1, min(self._n_inducing, self._n_sam[emul_i])):
+                ind_idx.append(np.argmax(min_dist_sq))
+                np.minimum(min_dist_sq,
+                           np.sum((sam_set-sam_set[ind_idx[-1]])**2, axis=-1),
+                           out=min_dist_sq)
+
+            # Save the sorted indices
+            self._ind_idx[emul_i] = np.sort(ind_idx)
+
+        # Return them
+        return(self._ind_idx[emul_i])
+
+    # This function returns the Gaussian kernel of sam_set with inducing points
+    @docstring_substitute(emul_i=std_emul_i_doc)
+    def _get_ind_kernel(self, emul_i, active_par):
+        """
+        Returns the Gaussian kernel between all model evaluation samples and
+        the inducing points at emulator iteration `emul_i`, using the provided
+        active parameters `active_par`.
+
+        Parameters
+        ----------
+        %(emul_i)s
+        active_par : list of int
+            List containing the indices of the active parameters.
+
+        Returns
+        -------
+        kernel : 2D :obj:`~numpy.ndarray` object
+            The Gaussian kernel between all model evaluation samples and all
+            inducing points.
+
+        """
+
+        # Obtain the active parts of sam_set and the inducing points
+        ind_idx = self._get_ind_idx(emul_i)
+        act_sam_set = self._sam_set[emul_i][:, active_par]
+        act_ind_set = act_sam_set[ind_idx]
+
+        # Obtain the squared distances over the active parameters
+        act_dist_sq = np.sum(act_sam_set**2, axis=-1)[:, np.newaxis] +\
+            np.sum(act_ind_set**2, axis=-1) -\
+            2*(act_sam_set @ act_ind_set.T)
+        np.maximum(0, act_dist_sq, out=act_dist_sq)
+        act_dist_sq[ind_idx, np.arange(len(ind_idx))] = 0
+
+        # Calculate the Gaussian kernel and return it
+        return(np.exp(-1*act_dist_sq/np.sum(self._l_corr[active_par]**2)))
+
     # This function calculates the regression covariance between parameter sets
     # This is function 'Cov(r(x), r(x'))'
-    # OPTIMIZE: Takes roughly 45-50% of total evaluation time
     @docstring_substitute(regr_cov=regr_cov_doc)
     def _get_regr_cov(self, emul_i, emul_s_seq, par_set1, par_set2):
         """
@@ -1971,24 +3051,12 @@ class Emulator(object):
                                  self._n_sam[emul_i]])
 
             for i, emul_s in enumerate(emul_s_seq):
-                # Initialize PF object
-                pf_obj = PF(self._poly_order)
-
-                # Obtain the polynomial terms for both parameter sets
-                poly_terms1 = pf_obj.fit_transform(
-                    self._sam_set[emul_i][
-                        :, self._active_par_data[emul_i][emul_s]])[
-                            :, self._poly_idx[emul_i][emul_s]]
-                poly_terms2 = poly_terms1
-
-                # Obtain the combined product polynomial terms
-                prod_terms = np.kron(poly_terms1, poly_terms2)
+                # Obtain the polynomial terms of sam_set
+                poly_terms = self._get_sam_set_poly(emul_i, emul_s)
 
                 # Calculate the regression covariance
-                regr_cov[i] =\
-                    np.sum(self._poly_coef_cov[emul_i][emul_s]*prod_terms,
-                           axis=-1).reshape([self._n_sam[emul_i],
-                                             self._n_sam[emul_i]])
+                regr_cov[i] = poly_terms @\
+                    self._poly_coef_cov[emul_i][emul_s] @ poly_terms.T
 
         # If regr_cov of par_set with sam_set is requested (cov_vec)
         elif par_set2 is None:
@@ -1996,26 +3064,17 @@ class Emulator(object):
             regr_cov = np.zeros([len(emul_s_seq), self._n_sam[emul_i]])
 
             for i, emul_s in enumerate(emul_s_seq):
-                # Initialize PF object
-                pf_obj = PF(self._poly_order)
-
                 # Obtain the polynomial terms for both parameter sets
                 poly_terms1 =\
                     np.product(pow(
                         par_set1[self._active_par_data[emul_i][emul_s]],
                         self._poly_powers[emul_i][emul_s]), axis=-1)
-                poly_terms2 = pf_obj.fit_transform(
-                    self._sam_set[emul_i][
-                        :, self._active_par_data[emul_i][emul_s]])[
-                            :, self._poly_idx[emul_i][emul_s]]
-
-                # Obtain the combined product polynomial terms
-                prod_terms = np.kron(poly_terms1, poly_terms2)
+                poly_terms2 = self._get_sam_set_poly(emul_i, emul_s)
 
                 # Calculate the regression covariance
-                regr_cov[i] =\
-                    np.sum(self._poly_coef_cov[emul_i][emul_s]*prod_terms,
-                           axis=-1)
+                regr_cov[i] = (poly_terms1 @
+                               self._poly_coef_cov[emul_i][emul_s]) @\
+                    poly_terms2.T
 
         # If regr_cov of par_set1 with par_set2 is requested (cov)
         else:
@@ -2033,17 +3092,99 @@ class Emulator(object):
                         par_set2[self._active_par_data[emul_i][emul_s]],
                         self._poly_powers[emul_i][emul_s]), axis=-1)
 
-                # Obtain the combined product polynomial terms
-                prod_terms = np.kron(poly_terms1, poly_terms2)
-
                 # Calculate the regression covariance
-                regr_cov[i] =\
-                    np.sum(self._poly_coef_cov[emul_i][emul_s]*prod_terms,
-                           axis=-1)
+                regr_cov[i] = poly_terms1 @\
+                    self._poly_coef_cov[emul_i][emul_s] @ poly_terms2
 
         # Return it
         return(regr_cov)
 
+    # This function returns the polynomial terms of sam_set
+    @docstring_substitute(emul_i=std_emul_i_doc)
+    def _get_sam_set_poly(self, emul_i, emul_s):
+        """
+        Returns the polynomial terms with non-zero coefficients of all model
+        evaluation samples of emulator system `emul_s` at emulator iteration
+        `emul_i`. These terms are calculated once and cached afterward.
+
+        Parameters
+        ----------
+        %(emul_i)s
+        emul_s : int
+            Number of the local emulator system to use.
+
+        Returns
+        -------
+        sam_set_poly : 2D :obj:`~numpy.ndarray` object
+            The polynomial terms of sam_set for emulator system `emul_s`.
+
+        """
+
+        # Obtain the cached polynomial terms
+        sam_set_poly = self._sam_set_poly[emul_i][emul_s]
+
+        # If they are not cached yet, calculate them
+        if not len(sam_set_poly):
+            pf_obj = PF(self._poly_order)
+            sam_set_poly = pf_obj.fit_transform(
+                self._sam_set[emul_i][
+                    :, self._active_par_data[emul_i][emul_s]])[
+                        :, self._poly_idx[emul_i][emul_s]]
+            self._sam_set_poly[emul_i][emul_s] = sam_set_poly
+
+        # Return them
+        return(sam_set_poly)
+
+    # This function returns the powers of all possible polynomial terms
+    def _get_poly_powers_table(self, n_par):
+        """
+        Returns the powers of all polynomial terms up to :attr:`~poly_order`
+        (including the intercept term) for `n_par` model parameters, in the
+        same order as used by
+        :class:`~sklearn.preprocessing.PolynomialFeatures`. These tables are
+        calculated once and cached afterward.
+
+        Parameters
+        ----------
+        n_par : int
+            The number of model parameters to obtain the polynomial powers
+            table for.
+
+        Returns
+        -------
+        poly_powers_table : 2D :obj:`~numpy.ndarray` object
+            The powers of all polynomial terms for `n_par` model parameters.
+
+        """
+
+        # Check if this table has been calculated before for this poly_order
+        key = (self._poly_order, n_par)
+        if key not in self._poly_powers_table:
+            # If not, calculate it
+            pf_obj = PF(self._poly_order).fit([[0]*n_par])
+            self._poly_powers_table[key] = pf_obj.powers_
+
+        # Return it
+        return(self._poly_powers_table[key])
+
+    # This function returns the memory used by the cached polynomial terms
+    def _get_sam_set_poly_size(self):
+        """
+        Returns the total number of bytes that are used by all cached
+        polynomial terms of sam_set on this MPI rank.
+
+        Returns
+        -------
+        n_bytes : int
+            The number of bytes used by the cached polynomial terms.
+
+        """
+
+        # Sum the sizes of all cached polynomial terms
+        return(sum([sam_set_poly.nbytes for sam_set_poly_i in
+                    self._sam_set_poly for sam_set_poly in sam_set_poly_i
+                    if isinstance(sam_set_poly, np.ndarray)]))
+
     # This function calculates the covariance matrix
     # This is function 'Var(D)' or 'A'
     @docstring_substitute(emul_i=std_emul_i_doc, emul_s_seq=emul_s_seq_doc)
@@ -2065,6 +3206,23 @@ class Emulator(object):
             evaluation samples for requested emulator systems.
         cov_mat_inv : 3D :obj:`~numpy.ndarray` object
             Inverse of covariance matrix for requested emulator systems.
+            If :attr:`~decomp_method` is 'cholesky', this is replaced by the
+            lower-triangular Cholesky factor `cov_mat_chol` of the covariance
+            matrix, unless it is not positive-definite.
+
+        Returns
+        -------
+        peak_mem : int
+            The peak number of bytes that were allocated on this MPI rank
+            during the calculation.
+
+        Notes
+        -----
+        The covariance matrices are calculated, decomposed and saved one
+        emulator system at a time by :meth:`~_get_full_cov_matrix`.
+        If inducing points are used (see :attr:`~n_inducing`), the reduced
+        covariance matrices of :meth:`~_get_ind_cov_matrix` are calculated
+        instead.
 
         """
 
@@ -2073,49 +3231,402 @@ class Emulator(object):
         logger.info("Calculating covariance matrix for emulator iteration %i."
                     % (emul_i))
 
-        # Calculate covariance matrix
-        # Since this calculation can cause memory issues, catch error and try
-        # slower but less memory-intensive method
-        try:
-            cov_mat = self._get_cov(emul_i, emul_s_seq, None, None)
-        except MemoryError:  # pragma: no cover
-            # For some odd reason, overwriting cov_mat does not clear memory,
-            # and the only way to remove cov_mat from it is by attempting to
-            # delete it. It always raises a NameError, but does actually clear
-            # memory successfully. I have no idea why this happens this way.
-            # TODO: Find out why and improve the memory clearance
-            try:
-                del cov_mat
-            except NameError:
-                pass
-            cov_mat = np.zeros([len(emul_s_seq), self._n_sam[emul_i],
-                                self._n_sam[emul_i]])
-            for i in range(self._n_sam[emul_i]):
-                cov_mat[:, i] = self._get_cov(emul_i, emul_s_seq,
-                                              self._sam_set[emul_i][i], None)
+        # Start tracing memory allocations to determine the peak memory usage
+        is_tracing = tracemalloc.is_tracing()
+        if not is_tracing:
+            tracemalloc.start()
+
+        # If memory was traced already, only count allocations made from now
+        # Resetting the peak is only possible in Python 3.9+
+        elif hasattr(tracemalloc, 'reset_peak'):
+            tracemalloc.reset_peak()
+        start_mem = tracemalloc.get_traced_memory()[0]
+
+        # If inducing points are used, calculate reduced covariance matrices
+        if self._use_inducing(emul_i):
+            self._get_ind_cov_matrix(emul_i, emul_s_seq)
+
+        # Else, calculate and decompose every covariance matrix separately
+        else:
+            self._get_full_cov_matrix(emul_i, emul_s_seq)
+
+        # Obtain the peak memory usage and stop tracing if required
+        peak_mem = max(0, tracemalloc.get_traced_memory()[1]-start_mem)
+        if not is_tracing:
+            tracemalloc.stop()
+
+        # Log that calculation has been finished
+        logger.info("Finished calculating covariance matrix (peak memory "
+                    "usage: %.2f MiB)." % (peak_mem/2**20))
+
+        # Return the peak memory usage
+        return(peak_mem)
+
+    # This function calculates the full covariance matrices one at a time
+    @docstring_substitute(emul_i=std_emul_i_doc, emul_s_seq=emul_s_seq_doc)
+    def _get_full_cov_matrix(self, emul_i, emul_s_seq):
+        """
+        Calculates and decomposes the covariance matrices of requested
+        emulator systems `emul_s_seq` at emulator iteration `emul_i` one at a
+        time, saving every matrix before the next one is calculated. The
+        Gaussian kernel shared by systems with the same active parameters is
+        calculated in blocks using :meth:`~_get_sam_set_kernel`, such that at
+        most a few matrices of size ``n_sam*n_sam`` are kept in memory.
+
+        Parameters
+        ----------
+        %(emul_i)s
+        %(emul_s_seq)s
+
+        Generates
+        ---------
+        The (decomposed) covariance matrices of requested emulator systems, as
+        described in :meth:`~_get_cov_matrix`.
+
+        """
+
+        # Obtain logger
+        logger = getRLogger('COV_MAT')
+
+        # Obtain the groups of emulator systems sharing active_par
+        kernel_groups = self._get_kernel_groups(emul_i, emul_s_seq)
+        n_sam = self._n_sam[emul_i]
+
+        # Log the statistics of the Gaussian kernels shared between systems
+        if self._method in ('gaussian', 'full'):
+            group_sizes = [len(group) for _, group in kernel_groups]
+            logger.info("Calculating %i Gaussian kernel(s) for %i emulator "
+                        "systems (group sizes: %s, kernels saved: %i)."
+                        % (len(group_sizes), len(emul_s_seq), group_sizes,
+                           len(emul_s_seq)-len(group_sizes)))
+
+        # Loop over all groups of emulator systems
+        for active_par, group in kernel_groups:
+            # Calculate the Gaussian kernel shared by this group if required
+            if self._method in ('gaussian', 'full'):
+                kernel = self._get_sam_set_kernel(emul_i, active_par)
+            else:
+                kernel = None
+
+            # Decompose the covariance matrices of all systems in this group
+            # Every matrix is calculated only once and returned if required
+            decomps = self._pool_map(
+                Emulator._decompose_cov_matrix,
+                (self._get_emul_s_cov_matrix(emul_i, emul_s_seq[i], kernel)
+                 for i in group), repeat(self._decomp_method))
+
+            # Loop over all emulator systems in this group
+            for i, (cov_mat, decomp) in zip(group, decomps):
+                # Check if the Cholesky factor was requested
+                emul_s = emul_s_seq[i]
+                if(self._decomp_method == 'cholesky'):
+                    # If the decomposition succeeded, save the factor to hdf5
+                    if cov_mat is None:
+                        cov_mat_chol, jitter = decomp
+                        self._save_data(emul_i, emul_s, {
+                            'cov_mat': {
+                                'cov_mat_chol': cov_mat_chol,
+                                'jitter': jitter}})
+                        continue
+
+                    # Else, log that the inverse is used instead
+                    logger.warning("Covariance matrix %i is not "
+                                   "positive-definite. Falling back to using "
+                                   "its inverse." % (self._emul_s[emul_s]))
+
+                # Save the covariance matrix and inverse to hdf5
+                self._save_data(emul_i, emul_s, {
+                    'cov_mat': {
+                        'cov_mat': cov_mat,
+                        'cov_mat_inv': decomp}})
+
+    # This function calculates the covariance matrix of one emulator system
+    @docstring_substitute(emul_i=std_emul_i_doc)
+    def _get_emul_s_cov_matrix(self, emul_i, emul_s, kernel):
+        """
+        Calculates the covariance matrix of the known model evaluation samples
+        of emulator system `emul_s` at emulator iteration `emul_i`, which is
+        used by :meth:`~_get_full_cov_matrix`.
+
+        Parameters
+        ----------
+        %(emul_i)s
+        emul_s : int
+            Number of the local emulator system.
+        kernel : 2D :obj:`~numpy.ndarray` object or None
+            The Gaussian kernel of the active parameters of this emulator
+            system, as calculated by :meth:`~_get_sam_set_kernel`. If *None*,
+            no Gaussian variance is included.
+
+        Returns
+        -------
+        cov_mat : 2D :obj:`~numpy.ndarray` object
+            The covariance matrix of the requested emulator system.
+
+        """
+
+        # Log the calculation of the covariance matrix
+        n_sam = self._n_sam[emul_i]
+        logger = getRLogger('COV_MAT')
+        logger.info("Calculating covariance matrix %i."
+                    % (self._emul_s[emul_s]))
+
+        # Create empty covariance matrix
+        cov_mat = np.zeros([n_sam, n_sam])
+
+        # Check what 'method' is given
+        if kernel is not None:
+            # Gaussian variance
+            cov_mat += self._act_rsdl_var[emul_i][emul_s]*kernel
+
+            # Passive parameter variety plus inflation term
+            cov_mat[np.diag_indices(n_sam)] +=\
+                self._pas_rsdl_var[emul_i][emul_s]
+
+        if(self._method in ('regression', 'full') and self._use_regr_cov):
+            # If regression needs to be taken into account
+            cov_mat += self._get_regr_cov(emul_i, [emul_s], None, None)[0]
+
+        # Return cov_mat
+        return(cov_mat)
+
+    # This function calculates the covariance matrix using inducing points
+    @docstring_substitute(emul_i=std_emul_i_doc, emul_s_seq=emul_s_seq_doc)
+    def _get_ind_cov_matrix(self, emul_i, emul_s_seq):
+        """
+        Calculates the reduced covariance matrices of the inducing points for
+        requested emulator systems `emul_s_seq` at emulator iteration
+        `emul_i`, by approximating the Gaussian covariances between all known
+        model evaluation samples with a Nyström approximation of rank
+        :attr:`~n_inducing` (deterministic training conditional).
+
+        Parameters
+        ----------
+        %(emul_i)s
+        %(emul_s_seq)s
+
+        Generates
+        ---------
+        cov_mat : 3D :obj:`~numpy.ndarray` object
+            Matrix ``pas_rsdl_var*K_mm+K_mn @ K_nm`` for requested emulator
+            systems, with ``K_mn`` the Gaussian covariances between the
+            inducing points and all known samples and ``K_mm`` those between
+            the inducing points themselves.
+        cov_mat_inv : 3D :obj:`~numpy.ndarray` object
+            Matrix ``inv(K_mm)-pas_rsdl_var*inv(cov_mat)`` for requested
+            emulator systems, which is used for calculating the variance
+            adjustment term.
+
+        """
+
+        # Log the creation of the covariance matrix
+        logger = getRLogger('COV_MAT')
+        logger.info("Using %i inducing points for %i model evaluation "
+                    "samples." % (len(self._get_ind_idx(emul_i)),
+                                  self._n_sam[emul_i]))
+
+        # Loop over all groups of emulator systems sharing active_par
+        for active_par, group in self._get_kernel_groups(emul_i, emul_s_seq):
+            # Calculate the Gaussian kernels of the inducing points
+            kernel_nm = self._get_ind_kernel(emul_i, active_par)
+            kernel_mm = kernel_nm[self._get_ind_idx(emul_i)]
+            kernel_mm_inv = self._get_inv_matrix(kernel_mm)
+            kernel_sq = kernel_nm.T @ kernel_nm
+
+            # Loop over all emulator systems in this group
+            for i in group:
+                # Get rsdl_var portions
+                emul_s = emul_s_seq[i]
+                act_rsdl_var = self._act_rsdl_var[emul_i][emul_s]
+                pas_rsdl_var = self._pas_rsdl_var[emul_i][emul_s]
+
+                # Calculate the reduced covariance matrix
+                logger.info("Calculating reduced covariance matrix %i."
+                            % (self._emul_s[emul_s]))
+                cov_mat = act_rsdl_var*(pas_rsdl_var*kernel_mm +
+                                        act_rsdl_var*kernel_sq)
+
+                # Calculate the matrix used for the variance adjustment term
+                cov_mat_inv = kernel_mm_inv/act_rsdl_var -\
+                    pas_rsdl_var*self._get_inv_matrix(cov_mat)
+
+                # Save the covariance matrix and inverse to hdf5
+                self._save_data(emul_i, emul_s, {
+                    'cov_mat': {
+                        'cov_mat': cov_mat,
+                        'cov_mat_inv': cov_mat_inv}})
+
+        # Log that calculation has been finished
+        logger.info("Finished calculating covariance matrix.")
+
+    # This function updates the decompositions of the covariance matrix
+    @docstring_substitute(emul_i=std_emul_i_doc, emul_s_seq=emul_s_seq_doc)
+    def _update_cov_matrix(self, emul_i, emul_s_seq, n_sam_old):
+        """
+        Updates the (inverse) matrix of covariances between known model
+        evaluation samples for requested emulator systems `emul_s_seq` at
+        emulator iteration `emul_i` after samples were added to it.
+
+        Only the covariances of the added samples are calculated, after which
+        the existing Cholesky factor or inverse of the covariance matrix is
+        extended using the Schur complement of the added samples. If this
+        complement is not positive-definite, the covariance matrix is
+        recalculated entirely with :meth:`~_get_cov_matrix`.
+
+        Parameters
+        ----------
+        %(emul_i)s
+        %(emul_s_seq)s
+        n_sam_old : int
+            The number of known samples before samples were added.
+
+        Generates
+        ---------
+        cov_mat : 3D :obj:`~numpy.ndarray` object
+            Matrix containing the covariances between all known model
+            evaluation samples for requested emulator systems.
+        cov_mat_inv : 3D :obj:`~numpy.ndarray` object
+            Inverse of covariance matrix for requested emulator systems, or
+            its lower-triangular Cholesky factor `cov_mat_chol` if that was
+            used before.
+
+        """
+
+        # Log the update of the covariance matrix
+        logger = getRLogger('COV_MAT')
+        logger.info("Updating covariance matrix for emulator iteration %i."
+                    % (emul_i))
+
+        # Obtain the number of added samples
+        n_sam_new = self._n_sam[emul_i]-n_sam_old
+
+        # Calculate the covariances of the added samples with all samples
+        cov_new = np.zeros([len(emul_s_seq), n_sam_new, self._n_sam[emul_i]])
+
+        # Check what 'method' is given
+        if self._method in ('gaussian', 'full'):
+            # Determine which known samples are equal to the added samples
+            sam_set = self._sam_set[emul_i]
+            eq_mask = (sam_set[n_sam_old:, np.newaxis] == sam_set).all(axis=-1)
+
+            # If Gaussian needs to be taken into account
+            for active_par, group in self._get_kernel_groups(emul_i,
+                                                             emul_s_seq):
+                # Calculate the Gaussian kernel rows of the added samples
+                kernel = self._get_sam_set_kernel(emul_i, active_par,
+                                                  n_sam_old)
+
+                # Loop over all emulator systems in this group
+                for i in group:
+                    # Get rsdl_var portions
+                    emul_s = emul_s_seq[i]
+                    act_rsdl_var = self._act_rsdl_var[emul_i][emul_s]
+                    pas_rsdl_var = self._pas_rsdl_var[emul_i][emul_s]
+
+                    # Gaussian variance
+                    cov_new[i] += act_rsdl_var*kernel
+
+                    # Passive parameter variety plus inflation term
+                    cov_new[i] += pas_rsdl_var*eq_mask
+
+        if(self._method in ('regression', 'full') and self._use_regr_cov):
+            # If regression needs to be taken into account
+            for i, emul_s in enumerate(emul_s_seq):
+                poly_terms = self._get_sam_set_poly(emul_i, emul_s)
+                cov_new[i] += (poly_terms[n_sam_old:] @
+                               self._poly_coef_cov[emul_i][emul_s]) @\
+                    poly_terms.T
+
+        # Create empty list of emulator systems that require recalculation
+        recalc_emul_s = []
 
         # Loop over all emulator systems
         for i, emul_s in enumerate(emul_s_seq):
-            # Calculate the inverse of the covariance matrix
-            logger.info("Calculating inverse of covariance matrix %i."
-                        % (self._emul_s[emul_s]))
+            # Obtain the covariance blocks of the added samples
+            cov_cross = cov_new[i, :, :n_sam_old].T
+            cov_self = cov_new[i, :, n_sam_old:]
+
+            # Obtain the Cholesky factor of this emulator system
+            cov_mat_chol = self._cov_mat_chol[emul_i][emul_s]
 
-            # TODO: Maybe I should put an error catch for memory overflow here?
-            cov_mat_inv = self._get_inv_matrix(cov_mat[i])
+            # If it is available, extend the Cholesky factor
+            if len(cov_mat_chol):
+                logger.info("Updating Cholesky decomposition of covariance "
+                            "matrix %i." % (self._emul_s[emul_s]))
 
-            # Save the covariance matrix and inverse to hdf5
+                # Obtain the jitter that was added to the diagonal
+                with self._File('r', self._emul_s[emul_s]) as file:
+                    jitter = file['%i' % (emul_i)].attrs['cov_mat_jitter']
+
+                # Calculate the Cholesky factor of the Schur complement
+                half_term = solve_triangular(cov_mat_chol, cov_cross,
+                                             lower=True, check_finite=False)
+                try:
+                    schur_chol = cholesky(
+                        cov_self+jitter*np.eye(n_sam_new) -
+                        half_term.T @ half_term, lower=True,
+                        check_finite=False)
+
+                # If this fails, recalculate the covariance matrix instead
+                except LinAlgError:
+                    logger.warning("Updated covariance matrix %i is not "
+                                   "positive-definite. Recalculating it."
+                                   % (self._emul_s[emul_s]))
+                    recalc_emul_s.append(emul_s)
+                    continue
+
+                # Combine all blocks into the extended Cholesky factor
+                cov_mat_data = {
+                    'cov_mat_chol': np.block([
+                        [cov_mat_chol, np.zeros([n_sam_old, n_sam_new])],
+                        [half_term.T, schur_chol]]),
+                    'jitter': jitter}
+
+            # Else, extend the inverse of the covariance matrix
+            else:
+                logger.info("Updating inverse of covariance matrix %i."
+                            % (self._emul_s[emul_s]))
+
+                # Obtain the old covariance matrix
+                with self._File('r', self._emul_s[emul_s]) as file:
+                    cov_mat = file['%i/cov_mat' % (emul_i)][()]
+
+                # Calculate the inverse of the Schur complement
+                cov_mat_inv = self._cov_mat_inv[emul_i][emul_s]
+                inv_cross = cov_mat_inv @ cov_cross
+                schur_inv = self._get_inv_matrix(cov_self -
+                                                 cov_cross.T @ inv_cross)
+                inv_cross_schur = inv_cross @ schur_inv
+
+                # Combine all blocks into the extended matrix and inverse
+                cov_mat_data = {
+                    'cov_mat': np.block([
+                        [cov_mat, cov_cross],
+                        [cov_cross.T, cov_self]]),
+                    'cov_mat_inv': np.block([
+                        [cov_mat_inv+inv_cross_schur @ inv_cross.T,
+                         -inv_cross_schur],
+                        [-inv_cross_schur.T, schur_inv]])}
+
+            # Save the updated covariance matrix to hdf5
+            self._remove_data(emul_i, emul_s, ['cov_mat'])
             self._save_data(emul_i, emul_s, {
-                'cov_mat': {
-                    'cov_mat': cov_mat[i],
-                    'cov_mat_inv': cov_mat_inv}})
+                'cov_mat': cov_mat_data})
 
-        # Log that calculation has been finished
-        logger.info("Finished calculating covariance matrix.")
+        # Recalculate the covariance matrices that could not be updated
+        if recalc_emul_s:
+            for emul_s in recalc_emul_s:
+                self._remove_data(emul_i, emul_s, ['cov_mat'])
+            self._get_cov_matrix(emul_i, recalc_emul_s)
+
+        # Log that updating has been finished
+        logger.info("Finished updating covariance matrix.")
 
     # This function calculates the inverse of a given matrix
     # TODO: Improve the inverse calculation
     # OPTIMIZE: Use pre-conditioners and linear systems?
-    def _get_inv_matrix(self, matrix):
+    @staticmethod
+    def _get_inv_matrix(matrix):
         """
         Calculates the inverse of a given `matrix`.
         Right now only uses the :func:`~numpy.linalg.pinv` function.
@@ -2138,6 +3649,174 @@ class Emulator(object):
         # Return it
         return(matrix_inv)
 
+    # This function calculates the Cholesky decomposition of a given matrix
+    @staticmethod
+    def _get_chol_matrix(matrix):
+        """
+        Calculates the lower-triangular Cholesky factor of a given symmetric
+        `matrix`. If `matrix` is not numerically positive-definite, an
+        increasing jitter is added to its diagonal until the decomposition
+        succeeds or the jitter becomes too large.
+
+        Parameters
+        ----------
+        matrix : 2D array_like
+            Matrix to be decomposed.
+
+        Returns
+        -------
+        matrix_chol : 2D :obj:`~numpy.ndarray` object or None
+            Lower-triangular Cholesky factor of the given `matrix`, or *None*
+            if the decomposition failed.
+        jitter : float
+            The value that was added to the diagonal of `matrix` before it was
+            decomposed.
+
+        """
+
+        # Determine the scale of the diagonal of the given matrix
+        diag_scale = np.mean(np.abs(np.diag(matrix)))
+
+        # Try to decompose the matrix with increasing jitter values
+        for jitter in [0]+[diag_scale*10**exp for exp in range(-12, -5)]:
+            try:
+                matrix_chol = cholesky(
+                    matrix+jitter*np.eye(matrix.shape[0]), lower=True,
+                    check_finite=False)
+            except LinAlgError:
+                continue
+            else:
+                return(matrix_chol, jitter)
+
+        # If no jitter value worked, return None
+        return(None, jitter)
+
+    # This function decomposes a given covariance matrix
+    @staticmethod
+    def _decompose_cov_matrix(cov_mat, decomp_method):
+        """
+        Decomposes a given covariance matrix `cov_mat` using the given
+        `decomp_method`, as used by :meth:`~_get_full_cov_matrix`.
+        If `decomp_method` is 'cholesky' and `cov_mat` is not
+        positive-definite, its inverse is calculated instead.
+
+        Parameters
+        ----------
+        cov_mat : 2D :obj:`~numpy.ndarray` object
+            Covariance matrix to be decomposed.
+        decomp_method : {'cholesky', 'pinv'}
+            The method that must be used for decomposing `cov_mat`.
+
+        Returns
+        -------
+        cov_mat : 2D :obj:`~numpy.ndarray` object or None
+            The given `cov_mat` if its inverse was calculated, or *None* if
+            its Cholesky factor was calculated.
+        decomp : 2D :obj:`~numpy.ndarray` object or tuple
+            The inverse of `cov_mat` or a tuple containing its Cholesky factor
+            and the used jitter, as returned by :meth:`~_get_chol_matrix`.
+
+        """
+
+        # Try to calculate the Cholesky factor if requested
+        if(decomp_method == 'cholesky'):
+            cov_mat_chol, jitter = Emulator._get_chol_matrix(cov_mat)
+
+            # If this succeeded, the covariance matrix is not required
+            if cov_mat_chol is not None:
+                return(None, (cov_mat_chol, jitter))
+
+        # Else, calculate the inverse of the covariance matrix
+        return(cov_mat, Emulator._get_inv_matrix(cov_mat))
+
+    # This function opens the worker pool used for constructing systems
+    @contextmanager
+    def _worker_pool(self):
+        """
+        Opens the pool of :attr:`~prism.Pipeline.n_pool_workers` workers on
+        this MPI rank that is used by :meth:`~_pool_map` for handling multiple
+        emulator systems concurrently. The number of BLAS threads that this
+        MPI rank uses is divided over the workers while the pool is open.
+
+        Only the calculations themselves are distributed over the workers.
+        All emulator data is still saved to the HDF5-files by the MPI rank
+        itself, one emulator system at a time.
+
+        """
+
+        # Obtain the number of pool workers
+        n_workers = self._pipeline._n_pool_workers
+
+        # If no more than a single worker is requested, do not use a pool
+        if(n_workers == 1):
+            yield
+            return
+
+        # Determine the number of BLAS threads every worker can use
+        n_threads = [info['num_threads'] for info in tpc.threadpool_info()
+                     if info['user_api'] == 'blas']
+        n_threads = max(1, max(n_threads, default=1)//n_workers)
+
+        # Determine which type of pool must be used
+        if(self._pipeline._pool_type == 'thread'):
+            pool_obj = ThreadPoolExecutor(n_workers)
+        else:
+            pool_obj = ProcessPoolExecutor(
+                n_workers, mp_context=multiprocessing.get_context('spawn'),
+                initializer=tpc.threadpool_limits,
+                initargs=(n_threads, 'blas'))
+
+        # Open the pool with the reduced number of BLAS threads
+        with tpc.threadpool_limits(n_threads, 'blas'), pool_obj as pool:
+            self._pool = pool
+            try:
+                yield
+            finally:
+                self._pool = None
+
+    # This function maps a function over multiple emulator systems
+    def _pool_map(self, func, *iterables):
+        """
+        Returns an iterator that applies `func` to every item of the provided
+        `iterables`, like the built-in :func:`~map` function. If the worker
+        pool opened by :meth:`~_worker_pool` is available, the items are
+        calculated concurrently, with at most two items per worker being
+        processed or waiting at once.
+
+        If a process pool is used, `func` and all items must be picklable.
+
+        Parameters
+        ----------
+        func : function
+            The function that must be applied to every item.
+        iterables : iterables
+            The iterables containing the arguments for `func`.
+
+        Returns
+        -------
+        results : iterator
+            Iterator that yields the result of `func` for every item, in the
+            same order as the items.
+
+        """
+
+        # If no worker pool is available, simply map func
+        if self._pool is None:
+            yield from map(func, *iterables)
+            return
+
+        # Submit all items to the pool, limiting the number of pending items
+        futures = deque()
+        n_pending = 2*self._pipeline._n_pool_workers
+        for args in zip(*iterables):
+            futures.append(self._pool.submit(func, *args))
+            if(len(futures) >= n_pending):
+                yield futures.popleft().result()
+
+        # Yield the results of all remaining items
+        while futures:
+            yield futures.popleft().result()
+
     # Load the emulator
     def _load_emulator(self, modellink_obj):
         """
@@ -2313,8 +3992,11 @@ class Emulator(object):
         self._poly_coef = [[]]
         self._poly_coef_cov = [[]]
         self._poly_powers = [[]]
+        self._sam_set_poly = [[]]
+        self._poly_powers_table = {}
         self._poly_idx = [[]]
         self._cov_mat_inv = [[]]
+        self._cov_mat_chol = [[]]
         self._exp_dot_term = [[]]
         self._n_data = [[]]
         self._data_val = [[]]
@@ -2322,6 +4004,26 @@ class Emulator(object):
         self._data_spc = [[]]
         self._data_idx = [[]]
 
+        # Initialize the inducing points of all emulator iterations
+        self._ind_idx = {}
+
+        # Initialize the converted evaluation data of all emulator iterations
+        self._eval_data = {}
+
+        # Initialize the implausibility data caches and emulator replicas
+        self._impl_data = {}
+        self._md_var_def = {}
+        self._replicas = {}
+
+        # Initialize the measured evaluation times of all emulator systems
+        self._eval_time = Counter()
+        self._eval_n_sam = Counter()
+
+        # Initialize the measured rejection powers of all emulator systems
+        # These are read in from the HDF5-file below if they were saved
+        self._impl_sum = Counter()
+        self._impl_n_sam = Counter()
+
         # Initialize emulator system status lists
         self._ccheck = [[]]
         self._active_emul_s = [[]]
@@ -2435,6 +4137,7 @@ class Emulator(object):
                 poly_powers = []
                 poly_idx = []
                 cov_mat_inv = []
+                cov_mat_chol = []
                 exp_dot_term = []
                 data_val = []
                 data_err = []
@@ -2461,6 +4164,7 @@ class Emulator(object):
                         poly_powers.append([])
                         poly_idx.append([])
                         cov_mat_inv.append([])
+                        cov_mat_chol.append([])
                         exp_dot_term.append([])
                         data_val.append([])
                         data_err.append([])
@@ -2494,7 +4198,8 @@ class Emulator(object):
                         poly_coef.append(data_set['poly_coef'][()])
                         if self._use_regr_cov:
                             poly_coef_cov.append(
-                                data_set['poly_coef_cov'][()])
+                                data_set['poly_coef_cov'][()].reshape(
+                                    len(poly_coef[-1]), -1))
                         else:
                             poly_coef_cov.append([])
                         poly_powers.append(data_set['poly_powers'][()])
@@ -2510,10 +4215,15 @@ class Emulator(object):
                             ccheck_s.append('regression')
 
                     # Check if cov_mat is available
-                    try:
+                    if 'cov_mat_chol' in data_set:
+                        cov_mat_inv.append([])
+                        cov_mat_chol.append(data_set['cov_mat_chol'][()])
+                    elif 'cov_mat_inv' in data_set:
                         cov_mat_inv.append(data_set['cov_mat_inv'][()])
-                    except KeyError:
+                        cov_mat_chol.append([])
+                    else:
                         cov_mat_inv.append([])
+                        cov_mat_chol.append([])
                         ccheck_s.append('cov_mat')
 
                     # Check if exp_dot_term is available
@@ -2533,6 +4243,11 @@ class Emulator(object):
                     # Read in all data_idx parts and combine them
                     data_idx.append(self._read_data_idx(data_set))
 
+                    # Read in the measured rejection power if it is available
+                    if 'impl_n_sam' in data_set.attrs:
+                        self._impl_sum[i, j] = data_set.attrs['impl_sum']
+                        self._impl_n_sam[i, j] = data_set.attrs['impl_n_sam']
+
                     # Add ccheck_s to ccheck
                     ccheck.insert(j, ccheck_s)
 
@@ -2545,9 +4260,11 @@ class Emulator(object):
                 self._rsdl_var.append(rsdl_var)
                 self._poly_coef.append(poly_coef)
                 self._poly_coef_cov.append(poly_coef_cov)
+                self._sam_set_poly.append([[] for _ in self._emul_s])
                 self._poly_powers.append(poly_powers)
                 self._poly_idx.append(poly_idx)
                 self._cov_mat_inv.append(cov_mat_inv)
+                self._cov_mat_chol.append(cov_mat_chol)
                 self._exp_dot_term.append(exp_dot_term)
                 self._data_val.append(data_val)
                 self._data_err.append(data_err)
@@ -2591,6 +4308,9 @@ class Emulator(object):
         # Do some logging
         logger = getRLogger('SAVE_DATA')
 
+        # Remove the evaluation data of this iteration, as it will change
+        self._eval_data.pop(emul_i, None)
+
         # If controller keyword contains 'mod_real_set', emul_s must be None
         if((self._is_controller and 'mod_real_set' in data_dict.keys()) or
            lemul_s is None):
@@ -2621,8 +4341,9 @@ class Emulator(object):
                     data_set.attrs['active_par'] = par_names
                     self._active_par[emul_i] = data
 
-                    # Remove active_par from ccheck
-                    self._ccheck[emul_i].remove('active_par')
+                    # Remove active_par from ccheck if it was still required
+                    if 'active_par' in self._ccheck[emul_i]:
+                        self._ccheck[emul_i].remove('active_par')
 
                 # ACTIVE PARAMETERS DATA
                 elif(keyword == 'active_par_data'):
@@ -2639,15 +4360,37 @@ class Emulator(object):
 
                 # COV_MAT
                 elif(keyword == 'cov_mat'):
-                    # Save cov_mat data to file and memory
-                    data_set.create_dataset('cov_mat', data=data['cov_mat'])
-                    data_set.create_dataset('cov_mat_inv',
-                                            data=data['cov_mat_inv'])
-                    self._cov_mat_inv[emul_i][lemul_s] = data['cov_mat_inv']
+                    # If a Cholesky factor is given, save it to file and memory
+                    if 'cov_mat_chol' in data.keys():
+                        data_set.create_dataset('cov_mat_chol',
+                                                data=data['cov_mat_chol'])
+                        data_set.attrs['cov_mat_jitter'] = data['jitter']
+                        self._cov_mat_chol[emul_i][lemul_s] =\
+                            data['cov_mat_chol']
+
+                    # Else, save cov_mat data to file and memory
+                    else:
+                        data_set.create_dataset('cov_mat',
+                                                data=data['cov_mat'])
+                        data_set.create_dataset('cov_mat_inv',
+                                                data=data['cov_mat_inv'])
+                        self._cov_mat_inv[emul_i][lemul_s] =\
+                            data['cov_mat_inv']
 
                     # Remove cov_mat from respective ccheck
                     self._ccheck[emul_i][lemul_s].remove('cov_mat')
 
+                # EVAL_COST
+                elif(keyword == 'eval_cost'):
+                    # Save eval_cost data to file
+                    data_set.attrs['eval_cost'] = data
+
+                # REJECT_POWER
+                elif(keyword == 'reject_power'):
+                    # Save reject_power data to file
+                    data_set.attrs['impl_sum'] = data[0]
+                    data_set.attrs['impl_n_sam'] = data[1]
+
                 # EXP_DOT_TERM
                 elif(keyword == 'exp_dot_term'):
                     # Save exp_dot_term data to file and memory
@@ -2730,11 +4473,15 @@ class Emulator(object):
                     self._poly_powers[emul_i][lemul_s] = data['poly_powers']
                     self._poly_idx[emul_i][lemul_s] = data['poly_idx']
                     if self._use_regr_cov:
-                        data_set.create_dataset('poly_coef_cov',
-                                                data=data['poly_coef_cov'])
+                        data_set.create_dataset(
+                            'poly_coef_cov',
+                            data=data['poly_coef_cov'].flatten())
                         self._poly_coef_cov[emul_i][lemul_s] =\
                             data['poly_coef_cov']
 
+                    # Remove the cached polynomial terms of sam_set
+                    self._sam_set_poly[emul_i][lemul_s] = []
+
                     # Remove regression from respective ccheck
                     self._ccheck[emul_i][lemul_s].remove('regression')
 
@@ -2746,6 +4493,66 @@ class Emulator(object):
         # More logging
         logger.info("Finished saving data to HDF5.")
 
+    # This function removes emulator data that is going to be replaced
+    @docstring_substitute(emul_i=std_emul_i_doc)
+    def _remove_data(self, emul_i, lemul_s, keywords):
+        """
+        Removes the data belonging to the given `keywords` at the given
+        emulator iteration `emul_i` and local emulator system `lemul_s` from
+        the HDF5-file and memory, such that it can be saved again with
+        :meth:`~_save_data`.
+
+        Parameters
+        ----------
+        %(emul_i)s
+        lemul_s : int or None
+            Number of the local emulator system to remove the data of. If
+            *None*, the data is removed from the master HDF5-file instead.
+        keywords : list of str
+            List of :meth:`~_save_data` keywords that must be removed.
+            Currently, only 'cov_mat', 'exp_dot_term', 'mod_real_set' and
+            'regression' are supported.
+
+        """
+
+        # Determine what the global emul_s is
+        emul_s = None if lemul_s is None else self._emul_s[lemul_s]
+
+        # Remove the evaluation data of this iteration, as it will change
+        self._eval_data.pop(emul_i, None)
+
+        # Determine which data sets belong to which keyword
+        data_names = {
+            'cov_mat': ['cov_mat', 'cov_mat_inv', 'cov_mat_chol'],
+            'exp_dot_term': ['prior_exp_sam_set', 'exp_dot_term'],
+            'mod_real_set': ['mod_set'] if emul_s is not None else ['sam_set'],
+            'regression': ['poly_coef', 'poly_coef_cov', 'poly_idx',
+                           'poly_powers']}
+
+        # Open hdf5-file
+        with self._File('r+', emul_s) as file:
+            # Obtain the dataset this data needs to be removed from
+            data_set = file['%i' % (emul_i)]
+
+            # Loop over all provided keywords
+            for keyword in keywords:
+                # Remove all data sets belonging to this keyword
+                for name in data_names[keyword]:
+                    if name in data_set:
+                        del data_set[name]
+
+                # Remove the covariance matrix decompositions from memory
+                if(keyword == 'cov_mat'):
+                    self._cov_mat_inv[emul_i][lemul_s] = []
+                    self._cov_mat_chol[emul_i][lemul_s] = []
+
+                # Add keyword to the ccheck it is removed from when saving
+                if(keyword == 'mod_real_set'):
+                    if emul_s is None:
+                        self._ccheck[emul_i].append(keyword)
+                else:
+                    self._ccheck[emul_i][lemul_s].append(keyword)
+
     # Read in the emulator attributes
     def _retrieve_parameters(self):
         """
@@ -2786,6 +4593,9 @@ class Emulator(object):
                 raise_warning(warn_msg, FutureWarning, logger, 3)
                 self._f_infl = 0.0
             self._method = file.attrs['method'].decode('utf-8')
+            self._decomp_method = file.attrs.get(
+                'decomp_method', b'pinv').decode('utf-8')
+            self._n_inducing = file.attrs.get('n_inducing', 0)
             self._use_regr_cov = int(file.attrs['use_regr_cov'])
             self._poly_order = file.attrs['poly_order']
             self._n_cross_val = file.attrs['n_cross_val']
@@ -2807,6 +4617,8 @@ class Emulator(object):
                     'l_corr': '0.3',
                     'f_infl': '0.2',
                     'method': "'full'",
+                    'decomp_method': "'pinv'",
+                    'n_inducing': '0',
                     'use_regr_cov': 'False',
                     'poly_order': '3',
                     'n_cross_val': '5',
@@ -2859,6 +4671,15 @@ class Emulator(object):
                        % (self._method))
             raise_error(err_msg, ValueError, logger)
 
+        # Method used to decompose the covariance matrices
+        self._decomp_method = check_vals(
+            split_seq(par_dict['decomp_method'])[0], 'decomp_method',
+            'str').lower()
+        if self._decomp_method not in ('pinv', 'cholesky'):
+            err_msg = ("Input argument 'decomp_method' is invalid (%r)!"
+                       % (self._decomp_method))
+            raise_error(err_msg, ValueError, logger)
+
         # Obtain the bool determining whether or not to use regr_cov
         self._use_regr_cov = check_vals(par_dict['use_regr_cov'],
                                         'use_regr_cov', 'bool')
@@ -2867,6 +4688,17 @@ class Emulator(object):
         if(self._method == 'regression'):
             self._use_regr_cov = 1
 
+        # Obtain the maximum number of inducing points
+        self._n_inducing = check_vals(split_seq(par_dict['n_inducing'])[0],
+                                      'n_inducing', 'int', 'nneg')
+
+        # Check that inducing points are not combined with regr_cov
+        if(self._n_inducing and self._method == 'full' and
+           self._use_regr_cov):
+            err_msg = ("Input argument 'n_inducing' cannot be used in "
+                       "combination with regression covariances!")
+            raise_error(err_msg, ValueError, logger)
+
         # Obtain the polynomial order for the regression selection process
         self._poly_order =\
             check_vals(split_seq(par_dict['poly_order'])[0],
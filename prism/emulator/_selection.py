@@ -0,0 +1,361 @@
+# -*- coding: utf-8 -*-
+
+"""
+Selection
+=========
+Contains the sequential feature selection routines that are used by the
+:class:`~prism.emulator.Emulator` class for determining which model parameters
+are active and which polynomial terms should be used in its regression
+processes.
+
+"""
+
+
+# %% IMPORTS
+# Package imports
+import numpy as np
+from numpy.linalg import LinAlgError, pinv
+
+# All declaration
+__all__ = ['get_cv_folds', 'select_backward', 'select_forward']
+
+
+# %% FUNCTION DEFINITIONS
+# This function returns the cross-validation folds of a sample set
+def get_cv_folds(n_sam, n_cross_val):
+    """
+    Returns the (unshuffled) k-fold cross-validation folds that are used for a
+    sample set of `n_sam` samples, which are identical to those used by
+    :class:`~sklearn.model_selection.KFold`.
+
+    Parameters
+    ----------
+    n_sam : int
+        The number of samples that must be divided into folds.
+    n_cross_val : int
+        The number of folds. If zero, no cross-validation is used and a single
+        fold containing all samples is returned.
+
+    Returns
+    -------
+    folds : list of slice
+        List containing the slice of every fold.
+
+    """
+
+    # If no cross-validation is used, return a single fold
+    if not n_cross_val:
+        return([slice(0, n_sam)])
+
+    # Determine the sizes of all folds
+    fold_sizes = np.full(n_cross_val, n_sam//n_cross_val, dtype=int)
+    fold_sizes[:n_sam % n_cross_val] += 1
+
+    # Convert them to slices and return them
+    fold_ends = np.cumsum(fold_sizes)
+    return([slice(end-size, end) for size, end in zip(fold_sizes, fold_ends)])
+
+
+# This function calculates the cross-validation MSE of many candidate fits
+def _get_cv_mse(Q, Qc, rsdl, folds):
+    """
+    Calculates the mean squared errors of the cross-validated least-squares
+    fits that use the orthonormal basis `Q` extended with every candidate
+    column in `Qc`, given the residuals `rsdl` of all these fits.
+
+    Uses the block-deletion formula ``e_F = (I-H_FF)^-1 @ r_F``, with ``H``
+    the hat matrix of the fit to all samples, to obtain the residuals of every
+    fold `F` without refitting. As all candidate bases share `Q`, the
+    required inverse is only calculated once per fold and bordered with every
+    candidate column. If `folds` contains a single fold, the training mean
+    squared errors are returned instead.
+
+    """
+
+    # If no cross-validation is used, return the training MSE
+    if(len(folds) == 1):
+        return(np.mean(rsdl**2, axis=0))
+
+    # Create empty array of fold MSEs
+    fold_mse = np.zeros([len(folds), Qc.shape[1]])
+
+    # Loop over all folds
+    for i, fold in enumerate(folds):
+        # Obtain the parts of the basis and residuals that belong to this fold
+        Q_F = Q[fold]
+        Qc_F = Qc[fold]
+        rsdl_F = rsdl[fold]
+
+        # Calculate the inverse of I-Q_F.T @ Q_F, shared by all candidates
+        try:
+            W = np.linalg.inv(np.eye(Q.shape[1])-Q_F.T @ Q_F)
+        except LinAlgError:  # pragma: no cover
+            W = pinv(np.eye(Q.shape[1])-Q_F.T @ Q_F)
+
+        # Calculate the cross terms of every candidate with the basis
+        B = Q_F.T @ Qc_F
+        WB = W @ B
+        WU = W @ (Q_F.T @ rsdl_F)
+
+        # Solve the bordered system of every candidate using its Schur
+        # complement
+        schur = 1-np.sum(Qc_F**2, axis=0)-np.sum(B*WB, axis=0)
+        z_c = (np.sum(Qc_F*rsdl_F, axis=0)+np.sum(B*WU, axis=0))/schur
+        z_Q = WU+WB*z_c
+
+        # Calculate the deleted residuals and their MSE
+        rsdl_F = rsdl_F+Q_F @ z_Q+Qc_F*z_c
+        fold_mse[i] = np.mean(rsdl_F**2, axis=0)
+
+    # Return the average MSE over all folds
+    return(np.mean(fold_mse, axis=0))
+
+
+# This function calculates the cross-validation R^2 of all backward candidates
+def _get_cv_r2(X, Y, folds, sst):
+    """
+    Calculates the cross-validated :math:`R^2` scores of the least-squares fits
+    of all columns in `Y` on all features in `X` (including an intercept
+    term), and of the fits that exclude every single feature in `X`.
+
+    The basis of every fit without a feature is obtained by downdating the QR
+    decomposition of the fit with all features, after which the deleted
+    residuals of every fold are calculated with the rank-1 updated
+    block-deletion formula. `sst` contains the total sum of squares of every
+    fold for every column in `Y`.
+
+    """
+
+    # Calculate the QR decomposition of the design matrix
+    n_sam, n_feat = X.shape
+    Q, R = np.linalg.qr(np.concatenate([np.ones([n_sam, 1]), X], axis=1))
+    rsdl = Y-Q @ (Q.T @ Y)
+
+    # Determine the basis vectors that are removed when excluding a feature
+    try:
+        V = np.linalg.inv(R).T[:, 1:]
+    except LinAlgError:  # pragma: no cover
+        V = pinv(R).T[:, 1:]
+    U = Q @ (V/np.linalg.norm(V, axis=0))
+    C = U.T @ Y
+
+    # If no cross-validation is used, return the training scores
+    if(len(folds) == 1):
+        sse = np.sum(rsdl**2, axis=0)
+        return(1-sse/sst, 1-(sse+C**2)[:, np.newaxis]/sst)
+
+    # Create empty arrays of fold sums of squared errors
+    sse = np.zeros([len(folds), Y.shape[1]])
+    sse_c = np.zeros([n_feat, len(folds), Y.shape[1]])
+
+    # Loop over all folds
+    for i, fold in enumerate(folds):
+        # Obtain the parts of the basis and residuals that belong to this fold
+        Q_F = Q[fold]
+        U_F = U[fold]
+
+        # Calculate the inverse of I-Q_F.T @ Q_F
+        try:
+            W = np.linalg.inv(np.eye(Q.shape[1])-Q_F.T @ Q_F)
+        except LinAlgError:  # pragma: no cover
+            W = pinv(np.eye(Q.shape[1])-Q_F.T @ Q_F)
+
+        # Calculate the deleted residuals of the fit with all features
+        A_rsdl = rsdl[fold]+Q_F @ (W @ (Q_F.T @ rsdl[fold]))
+        A_U = U_F+Q_F @ (W @ (Q_F.T @ U_F))
+        sse[i] = np.sum(A_rsdl**2, axis=0)
+
+        # Update them for excluding every feature (Sherman-Morrison)
+        S = np.sum(U_F*A_U, axis=0)[:, np.newaxis]
+        D = C-(U_F.T @ A_rsdl+S*C)/(1+S)
+        sse_c[:, i] = (sse[i]+2*D*(A_U.T @ A_rsdl) +
+                       D**2*np.sum(A_U**2, axis=0)[:, np.newaxis])
+
+    # Return the R^2 scores
+    return(1-sse/sst, 1-sse_c/sst)
+
+
+# This function performs a backward sequential feature selection
+def select_backward(X, Y, n_cross_val):
+    """
+    Performs a backward sequential feature selection of the linear regression
+    of every column in `Y` on the columns of `X` (including an intercept
+    term), scored on the :math:`R^2` of `n_cross_val`-fold cross-validation.
+
+    Starting with all features, the feature whose exclusion improves the
+    score the most is removed at every step, until a single feature remains.
+    Afterward, the smallest feature subset that scores within the
+    cross-validation spread of the best score is returned. This is equivalent
+    to the backward sequential feature selector of `mlxtend`_ using
+    ``k_features='parsimonious'`` and ``scoring='r2'``, but the scores of all
+    exclusion candidates are obtained in closed form by downdating the fit
+    with all remaining features. All columns in `Y` that share the same
+    remaining features are handled simultaneously.
+
+    .. _mlxtend: https://rasbt.github.io/mlxtend
+
+    Parameters
+    ----------
+    X : 2D :obj:`~numpy.ndarray` object
+        Array containing the values of all features for every sample.
+    Y : 1D or 2D :obj:`~numpy.ndarray` object
+        Array containing the target value(s) of every sample.
+    n_cross_val : int
+        The number of cross-validation folds. If zero, the training
+        :math:`R^2` is used as the score instead.
+
+    Returns
+    -------
+    feature_idx : list of int or list of list of int
+        Sorted list containing the indices of the selected features. If `Y`
+        is 2D, a list of these lists for every column in `Y`.
+
+    """
+
+    # Make sure that Y is two-dimensional
+    Y = np.asarray(Y)
+    Y_2D = Y.reshape(Y.shape[0], -1)
+    n_sam, n_feat = X.shape
+    n_y = Y_2D.shape[1]
+
+    # Obtain the folds and their total sums of squares
+    folds = get_cv_folds(n_sam, n_cross_val)
+    sst = np.array([np.sum((Y_2D[fold]-np.mean(Y_2D[fold], axis=0))**2,
+                           axis=0) for fold in folds])
+
+    # Calculate the scores of the fit with all features
+    all_idx = tuple(range(n_feat))
+    scores, _ = _get_cv_r2(X, Y_2D, folds, sst)
+    subsets = [{n_feat: (all_idx, scores[:, j])} for j in range(n_y)]
+
+    # Remove the best feature at every step until a single feature remains
+    groups = {all_idx: list(range(n_y))} if n_feat > 1 else {}
+    while groups:
+        # Initialize the groups of the next step
+        next_groups = {}
+
+        # Loop over all groups of columns that share the same features
+        for feat_idx, y_idx in groups.items():
+            # Calculate the scores of excluding every feature
+            _, scores_c = _get_cv_r2(X[:, feat_idx], Y_2D[:, y_idx], folds,
+                                     sst[:, y_idx])
+
+            # Determine which feature to exclude for every column
+            # Ties are broken in favor of the feature with the highest index
+            avg_c = np.nanmean(scores_c, axis=1)[::-1]
+            worst = len(feat_idx)-1-np.argmax(avg_c, axis=0)
+
+            # Save the resulting subsets and group them for the next step
+            for j, (y, i) in enumerate(zip(y_idx, worst)):
+                subset = feat_idx[:i]+feat_idx[i+1:]
+                subsets[y][len(subset)] = (subset, scores_c[i, :, j])
+                if(len(subset) > 1):
+                    next_groups.setdefault(subset, []).append(y)
+
+        # Continue with the next step
+        groups = next_groups
+
+    # Initialize the list of selected features
+    feature_idx = []
+
+    # Determine the parsimonious subset for every column
+    for y_subsets in subsets:
+        # Determine the subset with the best average score
+        sizes = sorted(y_subsets, reverse=True)
+        avg = {k: np.nanmean(y_subsets[k][1]) for k in sizes}
+        best = sizes[int(np.argmax([avg[k] for k in sizes]))]
+        max_score = avg[best]
+
+        # Select smaller subsets that lie within the score spread
+        for k in sizes:
+            cv_scores = y_subsets[k][1]
+            if(k < best and
+               avg[k] >= max_score-np.std(cv_scores)/len(cv_scores)):
+                max_score = avg[k]
+                best = k
+
+        # Add the selected features
+        feature_idx.append(list(y_subsets[best][0]))
+
+    # Return feature_idx
+    return(feature_idx if Y.ndim == 2 else feature_idx[0])
+
+
+# This function performs a forward sequential feature selection
+def select_forward(X, y, n_cross_val):
+    """
+    Performs a forward sequential feature selection of the linear regression
+    of `y` on the columns of `X` (including an intercept term), scored on the
+    mean squared error of `n_cross_val`-fold cross-validation.
+
+    Starting without any features, the feature that improves the score the
+    most is added at every step, until all features have been added. The
+    smallest feature subset with the best score is returned. This is
+    equivalent to the forward sequential feature selector of `mlxtend`_ using
+    ``k_features='best'`` and ``scoring='neg_mean_squared_error'``, but the
+    fits are updated incrementally by extending an orthonormal basis of the
+    selected features, and the cross-validation residuals of all candidate
+    features are obtained in closed form.
+
+    .. _mlxtend: https://rasbt.github.io/mlxtend
+
+    Parameters
+    ----------
+    X : 2D :obj:`~numpy.ndarray` object
+        Array containing the values of all features for every sample.
+    y : 1D :obj:`~numpy.ndarray` object
+        Array containing the target value of every sample.
+    n_cross_val : int
+        The number of cross-validation folds. If zero, the training mean
+        squared error is used as the score instead.
+
+    Returns
+    -------
+    feature_idx : list of int
+        Sorted list containing the indices of the selected features.
+
+    """
+
+    # Obtain the number of samples and features
+    n_sam, n_feat = X.shape
+    folds = get_cv_folds(n_sam, n_cross_val)
+
+    # Start with the orthonormal basis of the intercept term
+    Q = np.full([n_sam, 1], 1/np.sqrt(n_sam))
+    rsdl = y-Q @ (Q.T @ y)
+
+    # Initialize the lists of selected features and their scores
+    remaining = list(range(n_feat))
+    selected = []
+    scores = []
+
+    # Add the best feature at every step until all features are added
+    while remaining:
+        # Orthogonalize all remaining features against the current basis
+        # This is done twice to avoid losing orthogonality
+        Qc = X[:, remaining]-Q @ (Q.T @ X[:, remaining])
+        Qc -= Q @ (Q.T @ Qc)
+
+        # Normalize them, ignoring features that are linearly dependent
+        norms = np.linalg.norm(Qc, axis=0)
+        indep = norms > 1e-10*np.linalg.norm(X[:, remaining], axis=0)
+        Qc[:, indep] /= norms[indep]
+        Qc[:, ~indep] = 0
+
+        # Calculate the residuals of all candidate fits
+        rsdl_c = rsdl[:, np.newaxis]-Qc*(Qc.T @ rsdl)
+
+        # Determine the cross-validation MSE of all candidate fits
+        cv_mse = _get_cv_mse(Q, Qc, rsdl_c, folds)
+
+        # Add the feature with the lowest MSE to the selected features
+        best = int(np.argmin(cv_mse))
+        selected.append(remaining.pop(best))
+        scores.append(cv_mse[best])
+
+        # Extend the basis and update the residuals
+        Q = np.concatenate([Q, Qc[:, [best]]], axis=1)
+        rsdl = rsdl_c[:, best]
+
+    # Return the smallest feature subset with the best score
+    return(sorted(selected[:int(np.argmin(scores))+1]))
@@ -198,6 +198,10 @@ class ModelLink(object, metaclass=abc.ABCMeta):
         if not hasattr(self, '_MPI_call'):
             self.MPI_call = False
 
+        # Set parallel_call to default (False) if not modified before
+        if not hasattr(self, '_parallel_call'):
+            self.parallel_call = False
+
         # Generate model parameter properties
         self.__set_model_parameters(model_parameters)
 
@@ -383,6 +387,43 @@ class ModelLink(object, metaclass=abc.ABCMeta):
                         % (self.__class__.__name__, self._init_MPI_call))
             warnings.warn(warn_msg, RequestWarning, stacklevel=2)
 
+    @property
+    def parallel_call(self):
+        """
+        bool: Whether :meth:`~call_model` can be called in multiple independent
+        instances simultaneously if :attr:`~MPI_call` is *False*. If so, the
+        evaluation samples are distributed dynamically over all MPI ranks, or
+        over a pool of :attr:`~prism.Pipeline.n_pool_workers` workers if only
+        a single MPI rank is used, instead of being evaluated by the
+        controller only. This requires the model to, for example, not write to
+        files that are shared between instances.
+        By default, the model is only called in a single instance (False).
+
+        """
+
+        return(bool(self._parallel_call))
+
+    @parallel_call.setter
+    def parallel_call(self, parallel_call):
+        # If parallel_call is set outside of __init__, save current value
+        outer_frame = get_outer_frame(self.__init__)
+        if outer_frame is None and not hasattr(self, '_init_parallel_call'):
+            self._init_parallel_call = bool(self._parallel_call)
+
+        # Save new parallel_call
+        self._parallel_call = check_vals(parallel_call, 'parallel_call',
+                                         'bool')
+
+        # If parallel_call is set outside of __init__, raise warning
+        if(outer_frame is None and
+           (self._parallel_call != self._init_parallel_call)):
+            warn_msg = ("The 'parallel_call' property of this %s instance is "
+                        "being set outside its constructor. This may have "
+                        "unexpected effects. It is advised to set it back to "
+                        "its original value (%r)!"
+                        % (self.__class__.__name__, self._init_parallel_call))
+            warnings.warn(warn_msg, RequestWarning, stacklevel=2)
+
     # Model Parameters
     @property
     def n_par(self):
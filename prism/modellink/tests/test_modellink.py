@@ -285,6 +285,13 @@ class Test_ModelLink_Versatility(object):
             modellink_obj.MPI_call = (modellink_obj.MPI_call+1) % 2
         modellink_obj.MPI_call = modellink_obj._init_MPI_call
 
+    # Create a GaussianLink2D object and try to change its parallel_call
+    def test_change_parallel_call(self):
+        modellink_obj = GaussianLink2D()
+        with pytest.warns(RequestWarning):
+            modellink_obj.parallel_call = not modellink_obj.parallel_call
+        modellink_obj.parallel_call = modellink_obj._init_parallel_call
+
 
 # Pytest for testing the backup system for call_model
 @pytest.mark.filterwarnings("ignore::prism._internal.FeatureWarning")
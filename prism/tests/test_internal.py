@@ -51,6 +51,39 @@ class Test_PRISM_File(object):
             assert path.basename(file.filename) == 'test_0.hdf5'
         assert path.exists(filename)
 
+    def test_pool(self, tmpdir):
+        # Set _hdf5_file property to something default
+        File = get_PRISM_File(path.join(tmpdir.strpath, 'test.hdf5'))
+        with File('w') as file:
+            file.attrs['test'] = 0
+
+        # Check if files are reused while pooling
+        with File.pool():
+            with File('r+') as file_1:
+                file_1.attrs['test'] = 1
+            assert file_1.id.valid
+            with File('r') as file_2:
+                assert file_2 is file_1
+                assert file_2.attrs['test'] == 1
+
+            # Check if nested pools keep the files open
+            with File.pool():
+                with File('r') as file_3:
+                    assert file_3 is file_1
+            assert file_1.id.valid
+
+            # Check if an incompatible mode reopens the file
+            with File('a') as file_4:
+                assert file_4 is not file_1
+            assert not file_1.id.valid and not file_4.id.valid
+
+        # Check if all files are closed after pooling
+        with File.pool():
+            file_5 = File('r')
+        assert not file_5.id.valid
+        with File('r') as file:
+            assert file.attrs['test'] == 1
+
 
 # Pytest for the check_compatibility function
 def test_check_compatibility():
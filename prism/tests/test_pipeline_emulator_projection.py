@@ -5,6 +5,7 @@
 import os
 from os import path
 import shutil
+import tracemalloc
 
 # Package imports
 from e13tools import InputError, ShapeError
@@ -116,6 +117,14 @@ class CustomModelLink(ModelLink):
         return([[1, 1]]*len(data_idx))
 
 
+# Custom ModelLink class that can be called in multiple instances
+class ParallelModelLink(GaussianLink2D):
+    def __init__(self, call_type, *args, **kwargs):
+        self.call_type = call_type
+        self.parallel_call = True
+        super().__init__(*args, **kwargs)
+
+
 # Custom List class that reports wrong length
 class InvalidLen2List(list):
     def __len__(self):
@@ -229,6 +238,145 @@ class Test_Pipeline_Gaussian2D(object):
                                             pipe._emulator._cov_mat_inv[2]):
                 assert np.allclose(cov_vec @ cov_mat_inv, exp_out)
 
+    # Check if batched evaluations are equal to single evaluations
+    def test_evaluate_batch(self, pipe):
+        sam_set = np.concatenate([pipe._emulator._sam_set[2][:5],
+                                  pipe._emulator._sam_set[2][:5]+0.01])
+        adj_exp_val, adj_var_val = pipe._emulator._evaluate_batch(2, sam_set)
+        for par_set, adj_exp, adj_var in zip(sam_set, adj_exp_val,
+                                             adj_var_val):
+            adj_val = pipe._emulator._evaluate(2, par_set)
+            assert np.allclose(adj_exp, adj_val[0])
+            assert np.allclose(adj_var, adj_val[1])
+
+    # Check if the implausibility check is correct for multiple samples
+    def test_do_impl_check(self, pipe):
+        uni_impl_vals = np.random.rand(20, pipe._emulator._n_data_tot[2])*5
+        impl_check_vals, impl_cut_vals = pipe._do_impl_check(2, uni_impl_vals)
+        impl_cut = pipe._impl_cut[2]
+        cut_idx = pipe._cut_idx[2]
+        for uni_impl_val, check, cut_val in zip(uni_impl_vals,
+                                                impl_check_vals,
+                                                impl_cut_vals):
+            sorted_impl_val = np.flip(np.sort(uni_impl_val), 0)[cut_idx:]
+            assert cut_val == sorted_impl_val[0]
+            assert check == all(val <= cut for val, cut in
+                                zip(sorted_impl_val, impl_cut))
+
+    # Check if the univariate implausibility values are correct
+    def test_get_uni_impl(self, pipe):
+        emul = pipe._emulator
+        sam_set = emul._sam_set[2][:5]+0.01
+        adj_exp_val, adj_var_val = emul._evaluate_batch(2, sam_set)
+        uni_impl_vals = pipe._get_uni_impl(2, sam_set, adj_exp_val,
+                                           adj_var_val)
+        md_var = pipe._get_md_var(2, sam_set[0])
+        for adj_exp, adj_var, uni_impl in zip(adj_exp_val, adj_var_val,
+                                              uni_impl_vals):
+            for i, emul_s in enumerate(emul._active_emul_s[2]):
+                data_val = emul._data_val[2][emul_s]
+                err_idx = int(adj_exp[i] < data_val)
+                err_var = (md_var[i][err_idx] +
+                           emul._data_err[2][emul_s][err_idx]**2)
+                assert np.isclose(uni_impl[i], np.sqrt(
+                    (adj_exp[i]-data_val)**2/(adj_var[i]+err_var)))
+
+    # Check if early rejection gives the same plausible samples
+    def test_early_reject(self, pipe):
+        par_rng = pipe._modellink._par_rng
+        sam_set = par_rng[:, 0]+np.random.rand(500, 2)*(par_rng[:, 1] -
+                                                        par_rng[:, 0])
+        impl_sam = pipe._evaluate_sam_set(2, sam_set, 'analyze')
+        pipe._n_eval_groups = 3
+        try:
+            for _ in range(2):
+                impl_sam_er = pipe._evaluate_sam_set(2, sam_set, 'analyze')
+                assert np.array_equal(impl_sam, impl_sam_er)
+        finally:
+            pipe._n_eval_groups = 1
+        assert pipe._eval_stats[2] > 0
+        emul = pipe._emulator
+        impl_sum, impl_n_sam = dict(emul._impl_sum), dict(emul._impl_n_sam)
+        assert impl_n_sam
+        emul._save_reject_power()
+        emul._load_data(emul._emul_i)
+        assert emul._impl_sum == impl_sum
+        assert emul._impl_n_sam == impl_n_sam
+
+    # Check if the evaluation costs of all emulator systems can be determined
+    def test_get_eval_cost(self, pipe):
+        emul = pipe._emulator
+        with emul._File('r', None) as file:
+            eval_cost = emul._get_eval_cost(file['2'])
+        assert len(eval_cost) == emul._n_emul_s_tot
+        assert np.isclose(np.mean(list(eval_cost.values())), 1)
+        assert sorted(emul._assign_emul_s(2)[0]) == sorted(eval_cost)
+
+    # Check if an emulator replica gives the same results
+    def test_get_replica(self, pipe):
+        emul = pipe._emulator
+        assert emul._get_replica(2) is None
+        del emul._replicas[2]
+        size = emul._size
+        emul._size = len(emul._active_emul_s[2])+1
+        try:
+            replica = emul._get_replica(2)
+        finally:
+            emul._size = size
+            del emul._replicas[2]
+        assert replica is not None and replica is not emul
+        sam_set = emul._sam_set[2][:5]+0.01
+        adj_val = emul._evaluate_batch(2, sam_set)
+        adj_val_rep = replica._evaluate_batch(2, sam_set)
+        assert np.allclose(adj_val[0], adj_val_rep[0])
+        assert np.allclose(adj_val[1], adj_val_rep[1])
+        assert np.allclose(pipe._get_uni_impl(2, sam_set, *adj_val),
+                           pipe._get_uni_impl(2, sam_set, *adj_val_rep,
+                                              replica))
+
+    # Check if the rejection powers measured by a replica are combined
+    def test_merge_replicas(self, pipe):
+        emul = pipe._emulator
+        size = emul._size
+        emul._size = len(emul._active_emul_s[2])+1
+        try:
+            replica = emul._get_replica(2)
+        finally:
+            emul._size = size
+        try:
+            assert all(np.array_equal(*groups) for groups in zip(
+                emul._get_eval_groups(2, 3), replica._get_eval_groups(2, 3)))
+            impl_sum, impl_n_sam = dict(emul._impl_sum), dict(emul._impl_n_sam)
+            uni_impl_vals = np.ones([10, replica._n_data[2]])
+            replica._update_reject_power(2, replica._active_emul_s[2],
+                                         uni_impl_vals)
+            for _ in range(2):
+                emul._merge_replicas()
+                for emul_s in emul._active_emul_s[2]:
+                    assert emul._impl_sum[2, emul_s] ==\
+                        impl_sum.get((2, emul_s), 0)+10*size
+                    assert emul._impl_n_sam[2, emul_s] ==\
+                        impl_n_sam.get((2, emul_s), 0)+10*size
+        finally:
+            del emul._replicas[2]
+
+    # Check if emulator systems sharing active parameters share a kernel
+    def test_get_kernel_groups(self, pipe):
+        emul = pipe._emulator
+        emul_s_seq = emul._active_emul_s[2]
+        kernel_groups = emul._get_kernel_groups(2, emul_s_seq)
+        assert sorted(sum([group for _, group in kernel_groups], [])) ==\
+            list(range(len(emul_s_seq)))
+        for active_par, group in kernel_groups:
+            for i in group:
+                assert (emul._active_par_data[2][emul_s_seq[i]] ==
+                        active_par).all()
+        par_set = emul._sam_set[2][0]+0.01
+        cov_vec = emul._get_cov(2, emul_s_seq, par_set, None)
+        for i, emul_s in enumerate(emul_s_seq):
+            assert np.allclose(cov_vec[i],
+                               emul._get_cov(2, [emul_s], par_set, None)[0])
+
     # Try to access all Pipeline properties
     def test_access_pipe_props(self, pipe):
         check_instance(pipe, Pipeline)
@@ -264,6 +412,26 @@ class Test_Pipeline_Gaussian2D(object):
     def test_evaluate_dict_nD(self, pipe):
         pipe.evaluate({'A': [2.5], 'B': [2]}, 1)
 
+    # Check if evaluations are ordered on the systems after costs are saved
+    def test_evaluate_order(self, pipe):
+        emul = pipe._emulator
+        sam_set = emul._sam_set[2][:5]
+        with emul._File('r', None) as file:
+            assert emul._get_eval_cost(file['1'])
+        results = pipe.evaluate(sam_set, 1)
+        adj_exp_val = emul._evaluate_batch(1, sam_set)[0]
+        adj_exp_list = pipe._comm.gather(
+            [(emul._data_idx[1][j], adj_exp_val[:, k])
+             for k, j in enumerate(emul._active_emul_s[1])], 0)
+        if pipe._is_controller:
+            adj_exp_dict = dict(sum(adj_exp_list, []))
+            data_idx = dict(zip(sum(emul._emul_s_to_core, []),
+                                sum(emul._data_idx_to_core[1], [])))
+            adj_exp_val = [adj_exp_dict[data_idx[emul_s]]
+                           for emul_s in sorted(data_idx)]
+            assert np.allclose(results['adj_exp_val'],
+                               np.array(adj_exp_val).T)
+
     # Check if representation can be called
     def test_repr2(self, pipe):
         pipe2 = eval(repr(pipe))
@@ -757,6 +925,14 @@ class Test_Pipeline_Init_Exceptions(object):
         with pytest.raises(ValueError):
             pipe._emulator._create_new_emulator()
 
+    # Try to use an invalid covariance decomposition method
+    def test_invalid_decomp_method(self, root_working_dir, modellink_obj):
+        prism_dict = get_prism_dict({'decomp_method': 'test'})
+        pipe = Pipeline(modellink_obj, **root_working_dir,
+                        prism_par=prism_dict)
+        with pytest.raises(ValueError):
+            pipe._emulator._create_new_emulator()
+
 
 # Pytest for Pipeline class user exception handling
 @pytest.mark.skipif(MPI.COMM_WORLD.Get_size() > 1,
@@ -1283,6 +1459,66 @@ class Test_Pipeline_ModelLink_Versatility(object):
         pipe2D.construct(1, analyze=0, ext_real_set={
             'sam_set': sam_dict, 'mod_set': mod_dict})
 
+    # Test if the model can be called in multiple instances
+    @pytest.mark.parametrize('pool_type, call_type',
+                             [('thread', 'single'), ('process', 'multi')])
+    def test_parallel_call(self, tmpdir, pool_type, call_type):
+        root_dir = path.dirname(tmpdir.strpath)
+        working_dir = path.basename(tmpdir.strpath)
+        modellink_obj = ParallelModelLink(call_type)
+        prism_dict = get_prism_dict({'n_pool_workers': 3,
+                                     'pool_type': pool_type})
+        pipe = Pipeline(modellink_obj, root_dir=root_dir,
+                        working_dir=working_dir, prism_par=prism_dict)
+        assert modellink_obj.parallel_call
+        sam_set = modellink_obj._to_par_space(np.random.rand(10, 2))
+        sam_set, mod_set = pipe._evaluate_model(1, sam_set,
+                                                modellink_obj._data_idx)
+        if pipe._is_controller:
+            assert np.allclose(mod_set, pipe._multi_call_model(
+                1, sam_set, modellink_obj._data_idx))
+        pipe.construct(1, analyze=0)
+
+    # Test if the tasks are distributed and gathered over all MPI ranks
+    @pytest.mark.skipif(MPI.COMM_WORLD.Get_size() == 1,
+                        reason="Cannot be pytested using a single MPI rank")
+    @pytest.mark.parametrize('call_type', ['single', 'multi'])
+    def test_parallel_call_mpi(self, tmpdir, call_type):
+        root_dir = path.dirname(tmpdir.strpath)
+        working_dir = path.basename(tmpdir.strpath)
+        modellink_obj = ParallelModelLink(call_type)
+        pipe = Pipeline(modellink_obj, root_dir=root_dir,
+                        working_dir=working_dir)
+        data_idx = modellink_obj._data_idx
+        sam_set = modellink_obj._to_par_space(np.random.rand(10, 2))
+        mod_set = pipe._parallel_call_model(1, sam_set, data_idx)
+        if pipe._is_controller:
+            assert np.allclose(mod_set, pipe._multi_call_model(
+                1, sam_set, data_idx))
+        else:
+            assert mod_set == []
+
+    # Test if model evaluations can be read from the model cache
+    def test_model_cache(self, pipe2D):
+        pipe2D.use_model_cache = True
+        data_idx = pipe2D._modellink._data_idx
+        sam_set = pipe2D._modellink._to_par_space(np.random.rand(10, 2))
+        sam_set, mod_set = pipe2D._evaluate_model(1, sam_set, data_idx)
+        if pipe2D._is_controller:
+            assert pipe2D._model_cache_stats == (0, 10)
+        new_set = pipe2D._modellink._to_par_space(np.random.rand(5, 2))
+        sam_set2 = np.concatenate([sam_set[:5], new_set])
+        sam_set2, mod_set2 = pipe2D._evaluate_model(1, sam_set2, data_idx)
+        if pipe2D._is_controller:
+            assert pipe2D._model_cache_stats == (5, 5)
+            assert np.allclose(mod_set2, pipe2D._multi_call_model(
+                1, sam_set2, data_idx))
+        pipe2D.construct(1, analyze=0)
+        pipe2D.construct(2, analyze=0)
+        pipe2D.construct(2, analyze=0, force=True)
+        if pipe2D._is_controller:
+            assert pipe2D._model_cache_stats[1] == 0
+
     # Test if double md_var values can be returned
     def test_double_md_var(self, tmpdir):
         root_dir = path.dirname(tmpdir.strpath)
@@ -1309,6 +1545,407 @@ class Test_Pipeline_Emulator_Versatility(object):
         pipe.construct(1)
         pipe._emulator._load_data(1)
 
+    # Test if emulator can be constructed with regression covariances
+    def test_regr_cov(self, tmpdir):
+        prism_dict = get_prism_dict({'use_regr_cov': True})
+        root_dir = path.dirname(tmpdir.strpath)
+        working_dir = path.basename(tmpdir.strpath)
+        modellink_obj = GaussianLink2D()
+        pipe = Pipeline(modellink_obj, root_dir=root_dir,
+                        working_dir=working_dir, prism_par=prism_dict)
+        pipe.construct(1)
+        assert pipe._emulator._get_sam_set_poly_size()
+        sam_set = pipe._emulator._sam_set[1][:5]+0.01
+        adj_exp_val, adj_var_val = pipe._emulator._evaluate_batch(1, sam_set)
+        for par_set, adj_exp, adj_var in zip(sam_set, adj_exp_val,
+                                             adj_var_val):
+            adj_val = pipe._emulator._evaluate(1, par_set)
+            assert np.allclose(adj_exp, adj_val[0])
+            assert np.allclose(adj_var, adj_val[1])
+        pipe2 = Pipeline(modellink_obj, root_dir=root_dir,
+                         working_dir=working_dir)
+        for cov, cov2 in zip(pipe._emulator._poly_coef_cov[1],
+                             pipe2._emulator._poly_coef_cov[1]):
+            assert (cov.ndim == 2) and np.array_equal(cov, cov2)
+        emul = pipe._emulator
+        emul_s = emul._active_emul_s[1][0]
+        with pipe._File('r', None) as file:
+            assert np.array_equal(emul.poly_coef_cov[1][emul_s], file[
+                '1/emul_%i/poly_coef_cov' % (emul._emul_s[emul_s])][()])
+
+    # Test if emulator can be constructed using Cholesky decompositions
+    def test_cholesky_decomp(self, tmpdir):
+        prism_dict = get_prism_dict({'decomp_method': 'cholesky'})
+        root_dir = path.dirname(tmpdir.strpath)
+        working_dir = path.basename(tmpdir.strpath)
+        modellink_obj = GaussianLink2D()
+        pipe = Pipeline(modellink_obj, root_dir=root_dir,
+                        working_dir=working_dir, prism_par=prism_dict)
+        pipe.construct(1)
+        emul = pipe._emulator
+        sam_set = emul._sam_set[1]
+        adj_exp_val, adj_var_val = emul._evaluate_batch(1, sam_set)
+        assert np.allclose(adj_exp_val, np.array(emul._mod_set[1]).T)
+        assert np.allclose(adj_var_val, 0)
+        for par_set in sam_set[:5]+0.01:
+            adj_val = emul._evaluate(1, par_set)
+            adj_val_batch = emul._evaluate_batch(1, par_set)
+            assert np.allclose(adj_val_batch[0][0], adj_val[0])
+            assert np.allclose(adj_val_batch[1][0], adj_val[1])
+        pipe = Pipeline(modellink_obj, root_dir=root_dir,
+                        working_dir=working_dir)
+        assert pipe._emulator._decomp_method == 'cholesky'
+        assert all([len(chol) for chol in pipe._emulator._cov_mat_chol[1]])
+
+    # Test if an emulator iteration can be updated with new realizations
+    @pytest.mark.parametrize('decomp_method, update_regr',
+                             [('pinv', False), ('cholesky', False),
+                              ('cholesky', True)])
+    def test_update(self, tmpdir, decomp_method, update_regr):
+        prism_dict = get_prism_dict({'decomp_method': decomp_method})
+        root_dir = path.dirname(tmpdir.strpath)
+        working_dir = path.basename(tmpdir.strpath)
+        modellink_obj = GaussianLink2D()
+        pipe = Pipeline(modellink_obj, root_dir=root_dir,
+                        working_dir=working_dir, prism_par=prism_dict)
+        with pytest.raises(RequestError):
+            pipe.update(None)
+        pipe.construct(1)
+        pipe.project(1, (0,), figure=False)
+        with pipe._File('r', None) as file:
+            assert 'proj_hcube' in file['1']
+        with pytest.raises(ValueError):
+            pipe.update(None)
+        emul = pipe._emulator
+        n_sam = emul._n_sam[1]
+        sam_set = lhd(5, modellink_obj._n_par, modellink_obj._par_rng)
+        sam_dict = dict(zip(modellink_obj._par_name, sam_set.T))
+        mod_dict = modellink_obj.call_model(1, sam_dict,
+                                            modellink_obj._data_idx)
+        with pytest.raises(ValueError, match='duplicate'):
+            pipe.update([dict(zip(modellink_obj._par_name,
+                                  sam_set[[0, 0]].T)),
+                         {idx: val[[0, 0]] for idx, val in mod_dict.items()}])
+        with pytest.raises(ValueError, match='already used'):
+            pipe.update([dict(zip(modellink_obj._par_name,
+                                  emul._sam_set[1][:1].T)),
+                         {idx: val[:1] for idx, val in mod_dict.items()}])
+        assert emul._n_sam[1] == n_sam
+        pipe.update([sam_dict, mod_dict], update_regr=update_regr)
+        assert emul._n_sam[1] == n_sam+5
+        with pipe._File('r', None) as file:
+            assert 'proj_hcube' not in file['1']
+        assert pipe._n_eval_sam[1]
+        adj_exp_val, adj_var_val = emul._evaluate_batch(1, sam_set)
+        mod_set = [mod_dict[emul._data_idx[1][emul_s]]
+                   for emul_s in emul._active_emul_s[1]]
+        assert np.allclose(adj_exp_val, np.array(mod_set).T)
+        assert np.allclose(adj_var_val, 0)
+        cov_mat = emul._get_cov(1, emul._active_emul_s[1], None, None)
+        for i, emul_s in enumerate(emul._active_emul_s[1]):
+            if(decomp_method == 'cholesky'):
+                cov_mat_chol = emul._cov_mat_chol[1][emul_s]
+                assert np.allclose(cov_mat_chol @ cov_mat_chol.T, cov_mat[i])
+            else:
+                assert np.allclose(emul._cov_mat_inv[1][emul_s] @ cov_mat[i],
+                                   np.eye(n_sam+5))
+        pipe2 = Pipeline(modellink_obj, root_dir=root_dir,
+                         working_dir=working_dir)
+        adj_val = emul._evaluate_batch(1, sam_set+0.01)
+        adj_val2 = pipe2._emulator._evaluate_batch(1, sam_set+0.01)
+        assert np.allclose(adj_val[0], adj_val2[0])
+        assert np.allclose(adj_val[1], adj_val2[1])
+
+    # Test if covariance matrices can be calculated in small blocks
+    def test_cov_mem_size(self, tmpdir):
+        prism_dict = get_prism_dict({'cov_mem_size': 0.001})
+        root_dir = path.dirname(tmpdir.strpath)
+        working_dir = path.basename(tmpdir.strpath)
+        modellink_obj = GaussianLink2D()
+        pipe = Pipeline(modellink_obj, root_dir=root_dir,
+                        working_dir=working_dir, prism_par=prism_dict)
+        assert pipe.cov_mem_size == 0.001
+        pipe.construct(1, analyze=False)
+        emul = pipe._emulator
+        active_par = emul._active_par_data[1][emul._active_emul_s[1][0]]
+        kernel = emul._get_sam_set_kernel(1, active_par)
+        pipe.cov_mem_size = 256
+        assert np.allclose(kernel, emul._get_sam_set_kernel(1, active_par))
+        cov_mat = emul._get_cov(1, emul._active_emul_s[1], None, None)
+        for i, emul_s in enumerate(emul._active_emul_s[1]):
+            assert np.allclose(emul._cov_mat_inv[1][emul_s] @ cov_mat[i],
+                               np.eye(emul._n_sam[1]))
+        with pipe._File('r', None) as file:
+            stats = file['1/statistics'].attrs
+            assert float(stats['cov_mat_peak_mem'][0]) > 0
+        tracemalloc.start()
+        try:
+            np.ones(2**22).sum()
+            for emul_s in emul._active_emul_s[1]:
+                emul._remove_data(1, emul_s, ['cov_mat'])
+            peak_mem = emul._get_cov_matrix(1, emul._active_emul_s[1])
+            assert tracemalloc.is_tracing()
+        finally:
+            tracemalloc.stop()
+        assert 0 < peak_mem
+        if hasattr(tracemalloc, 'reset_peak'):
+            assert peak_mem < 2**25
+        with pytest.raises(ValueError):
+            pipe.cov_mem_size = 0
+
+    # Test if emulator systems can be constructed using a worker pool
+    @pytest.mark.parametrize('pool_type', ['thread', 'process'])
+    def test_pool(self, tmpdir, pool_type):
+        emuls = []
+        for n_pool_workers in (1, 2):
+            prism_dict = get_prism_dict({'n_pool_workers': n_pool_workers,
+                                         'pool_type': pool_type,
+                                         'decomp_method': 'cholesky'})
+            root_dir = tmpdir.strpath
+            working_dir = 'prism_%i' % (n_pool_workers)
+            modellink_obj = GaussianLink2D()
+            np.random.seed(0)
+            pipe = Pipeline(modellink_obj, root_dir=root_dir,
+                            working_dir=working_dir, prism_par=prism_dict)
+            assert pipe.n_pool_workers == n_pool_workers
+            pipe.construct(1, analyze=False)
+            emuls.append(pipe._emulator)
+        assert emuls[1]._pool is None
+        for emul_s in emuls[0]._active_emul_s[1]:
+            assert np.allclose(emuls[0]._active_par_data[1][emul_s],
+                               emuls[1]._active_par_data[1][emul_s])
+            assert np.allclose(emuls[0]._poly_coef[1][emul_s],
+                               emuls[1]._poly_coef[1][emul_s])
+            assert np.allclose(emuls[0]._cov_mat_chol[1][emul_s],
+                               emuls[1]._cov_mat_chol[1][emul_s])
+        with pytest.raises(ValueError):
+            pipe.pool_type = 'invalid'
+        with pytest.raises(ValueError):
+            pipe.n_pool_workers = 0
+
+    # Test if the emulator can be analyzed in chunks
+    def test_analyze_chunks(self, tmpdir):
+        prism_dict = get_prism_dict({'analyze_chunk_size': 300})
+        root_dir = path.dirname(tmpdir.strpath)
+        working_dir = path.basename(tmpdir.strpath)
+        modellink_obj = GaussianLink2D()
+        pipe = Pipeline(modellink_obj, root_dir=root_dir,
+                        working_dir=working_dir, prism_par=prism_dict)
+        assert pipe.analyze_chunk_size == 300
+        pipe.construct(1)
+        if pipe._is_controller:
+            assert pipe._n_eval_sam[1] == pipe._get_n_eval_sam(1)
+            assert pipe._n_impl_sam[1] == pipe._impl_sam.shape[0]
+            with pipe._File('r', None) as file:
+                impl_sam = file['1/impl_sam'][()]
+            impl_sam.dtype = float
+            assert np.allclose(impl_sam, pipe._impl_sam)
+
+        # Check that an interrupted analysis keeps the previous impl_sam
+        n_impl_sam = pipe._n_impl_sam[1]
+        evaluate_sam_set = pipe._evaluate_sam_set
+        n_calls = []
+
+        def interrupt(*args, **kwargs):
+            n_calls.append(None)
+            if(len(n_calls) == 2):
+                raise KeyboardInterrupt
+            return(evaluate_sam_set(*args, **kwargs))
+
+        pipe._evaluate_sam_set = interrupt
+        with pytest.raises(KeyboardInterrupt):
+            pipe.analyze()
+        del pipe._evaluate_sam_set
+        assert pipe._n_impl_sam[1] == n_impl_sam
+        if pipe._is_controller:
+            with pipe._File('r', None) as file:
+                assert file['1/impl_sam'].shape[0] == n_impl_sam
+                assert '1/impl_sam_stream' in file
+        pipe.analyze()
+        if pipe._is_controller:
+            with pipe._File('r', None) as file:
+                assert '1/impl_sam_stream' not in file
+        pipe.construct(2)
+        with pytest.raises(ValueError):
+            pipe.analyze_chunk_size = -1
+
+    # Test if the emulator evaluation sample set can be distributed
+    def test_distribute_eval_sam(self, tmpdir):
+        prism_dict = get_prism_dict({'distribute_eval_sam': True,
+                                     'analyze_chunk_size': 300,
+                                     'n_saved_impl_vals': 3})
+        root_dir = path.dirname(tmpdir.strpath)
+        working_dir = path.basename(tmpdir.strpath)
+        modellink_obj = GaussianLink2D()
+        pipe = Pipeline(modellink_obj, root_dir=root_dir,
+                        working_dir=working_dir, prism_par=prism_dict)
+        assert pipe.distribute_eval_sam
+        pipe.construct(1)
+        if pipe._is_controller:
+            assert pipe._n_impl_sam[1] == pipe._impl_sam.shape[0]
+        pipe.construct(2)
+        if pipe._is_controller:
+            assert pipe._n_impl_sam[2] == pipe._impl_sam.shape[0]
+            with pipe._File('r', None) as file:
+                for emul_s in range(pipe._emulator._n_emul_s_tot):
+                    assert 'eval_cost' in file['2/emul_%i' % (emul_s)].attrs
+        sam_set = pipe._get_eval_sam_set(2, 100, 0)
+        impl_sam, impl_vals = pipe._analyze_sam_slice(2, sam_set)
+        results = pipe._evaluate_sam_set(2, sam_set, 'analyze_impl')
+        assert np.allclose(impl_sam, results[0])
+        if pipe._is_controller:
+            assert np.allclose(impl_vals[0], results[1][0])
+            assert np.allclose(impl_vals[1], results[1][1])
+
+    # Test if the emulator can be reanalyzed using saved impl_vals
+    def test_reuse_impl_vals(self, tmpdir):
+        prism_dict = get_prism_dict({'n_saved_impl_vals': 1,
+                                     'analyze_chunk_size': 300})
+        root_dir = path.dirname(tmpdir.strpath)
+        working_dir = path.basename(tmpdir.strpath)
+        modellink_obj = GaussianLink2D()
+        pipe = Pipeline(modellink_obj, root_dir=root_dir,
+                        working_dir=working_dir, prism_par=prism_dict)
+        assert pipe.n_saved_impl_vals == 1
+        pipe.construct(1, analyze=False)
+        with pytest.raises(RequestError):
+            pipe.analyze(reuse_impl_vals=True)
+        pipe.analyze(impl_cut=[4.0])
+        if pipe._is_controller:
+            with pipe._File('r', None) as file:
+                sam_set = file['1/impl_vals_sam'][()]
+                assert file['1/impl_vals'].shape == (sam_set.shape[0], 1)
+            sam_set.dtype = float
+        else:
+            sam_set = None
+        sam_set = pipe._comm.bcast(sam_set, 0)
+        pipe.analyze(impl_cut=[3.0], reuse_impl_vals=True)
+        impl_sam = pipe._evaluate_sam_set(1, sam_set, 'analyze')
+        if pipe._is_controller:
+            assert np.allclose(pipe._impl_sam, impl_sam)
+            impl_par = (list(pipe._impl_cut[1]), pipe._cut_idx[1])
+        with pytest.raises(RequestError):
+            pipe.analyze(impl_cut=[3.0, 2.0], reuse_impl_vals=True)
+        if pipe._is_controller:
+            assert (list(pipe._impl_cut[1]), pipe._cut_idx[1]) == impl_par
+            with pipe._File('r', None) as file:
+                assert list(file['1'].attrs['impl_cut']) == impl_par[0]
+                assert file['1'].attrs['cut_idx'] == impl_par[1]
+        sam_set = lhd(5, modellink_obj._n_par, modellink_obj._par_rng)
+        sam_dict = dict(zip(modellink_obj._par_name, sam_set.T))
+        mod_dict = modellink_obj.call_model(1, sam_dict,
+                                            modellink_obj._data_idx)
+        pipe.update([sam_dict, mod_dict], analyze=False)
+        if pipe._is_controller:
+            with pipe._File('r', None) as file:
+                assert 'impl_vals' not in file['1']
+        with pytest.raises(RequestError):
+            pipe.analyze(reuse_impl_vals=True)
+        pipe.n_saved_impl_vals = 0
+        pipe.analyze()
+        if pipe._is_controller:
+            with pipe._File('r', None) as file:
+                assert 'impl_vals' not in file['1']
+        with pytest.raises(ValueError):
+            pipe.n_saved_impl_vals = -1
+
+    # Test if evaluation sample sets can be created in proposal regions
+    @pytest.mark.parametrize('eval_proposal', ['box', 'ellipsoid', 'kdtree'])
+    def test_eval_proposal(self, tmpdir, eval_proposal):
+        prism_dict = get_prism_dict({'eval_proposal': eval_proposal,
+                                     'n_saved_impl_vals': 3})
+        root_dir = path.dirname(tmpdir.strpath)
+        working_dir = path.basename(tmpdir.strpath)
+        modellink_obj = GaussianLink2D()
+        pipe = Pipeline(modellink_obj, root_dir=root_dir,
+                        working_dir=working_dir, prism_par=prism_dict)
+        assert pipe.eval_proposal == eval_proposal
+        pipe.construct(1)
+        if pipe._is_controller:
+            assert pipe._get_eval_proposal(1) is None
+            assert (pipe._par_space_rem[1] ==
+                    pipe._n_impl_sam[1]/pipe._n_eval_sam[1])
+        pipe.construct(2, analyze=False)
+        if pipe._is_controller:
+            proposal = pipe._get_eval_proposal(2)
+            sam_set = pipe._get_eval_sam_set(2, 100, proposal=proposal)
+            assert sam_set.shape == (100, 2)
+        pipe.analyze()
+        if pipe._is_controller:
+            weights = proposal.get_weights(pipe._impl_sam)
+            assert np.isclose(pipe._par_space_rem[2],
+                              weights.sum()/pipe._n_eval_sam[2])
+        pipe.analyze(reuse_impl_vals=True)
+        if pipe._is_controller:
+            assert np.isclose(pipe._par_space_rem[2],
+                              weights.sum()/pipe._n_eval_sam[2])
+        pipe.details()
+        with pytest.raises(ValueError):
+            pipe.eval_proposal = 'invalid'
+
+    # Test if different samplers can be used for creating sample sets
+    def test_samplers(self, tmpdir):
+        prism_dict = get_prism_dict({'init_sampler': 'sobol',
+                                     'eval_sampler': 'lhd_kdtree',
+                                     'proj_sampler': 'halton'})
+        root_dir = path.dirname(tmpdir.strpath)
+        working_dir = path.basename(tmpdir.strpath)
+        modellink_obj = GaussianLink3D(model_parameters=model_parameters_3D,
+                                       model_data=model_data_single)
+        pipe = Pipeline(modellink_obj, root_dir=root_dir,
+                        working_dir=working_dir, prism_par=prism_dict)
+        assert pipe.init_sampler == 'sobol'
+        assert pipe.eval_sampler == 'lhd_kdtree'
+        assert pipe.proj_sampler == 'halton'
+        pipe.construct(1)
+        pipe.project(figure=False)
+        pipe.eval_sampler = lambda n_sam, val_rng, **kwargs: np.random.rand(
+            n_sam, val_rng.shape[0])*np.diff(val_rng).T+val_rng[:, 0]
+        pipe.analyze()
+        with pytest.raises(ValueError):
+            pipe.init_sampler = 'invalid'
+
+    # Test if emulator can be constructed using inducing points
+    def test_inducing(self, tmpdir):
+        prism_dict = get_prism_dict({'n_inducing': 50})
+        root_dir = path.dirname(tmpdir.strpath)
+        working_dir = path.basename(tmpdir.strpath)
+        modellink_obj = GaussianLink2D()
+        pipe = Pipeline(modellink_obj, root_dir=root_dir,
+                        working_dir=working_dir, prism_par=prism_dict)
+        pipe.construct(1, analyze=False)
+        emul = pipe._emulator
+        assert emul._n_inducing == 50
+        assert emul._use_inducing(1)
+        ind_idx = emul._get_ind_idx(1)
+        assert len(ind_idx) == len(np.unique(ind_idx)) == 50
+        for emul_s in emul._active_emul_s[1]:
+            assert emul._cov_mat_inv[1][emul_s].shape == (50, 50)
+            assert emul._exp_dot_term[1][emul_s].shape == (50,)
+        sam_set = emul._sam_set[1][:10]+0.01
+        adj_val = emul._evaluate_batch(1, sam_set)
+        for i, par_set in enumerate(sam_set):
+            adj_val2 = emul._evaluate(1, par_set)
+            assert np.allclose(adj_val[0][i], adj_val2[0])
+            assert np.allclose(adj_val[1][i], adj_val2[1])
+        mod_set = [emul._mod_set[1][emul_s][ind_idx]
+                   for emul_s in emul._active_emul_s[1]]
+        adj_exp_val, _ = emul._evaluate_batch(1, emul._sam_set[1][ind_idx])
+        assert np.allclose(adj_exp_val, np.array(mod_set).T, rtol=0.05,
+                           atol=0.05*np.abs(mod_set).max())
+        pipe.analyze()
+        pipe2 = Pipeline(modellink_obj, root_dir=root_dir,
+                         working_dir=working_dir)
+        assert pipe2._emulator._n_inducing == 50
+        adj_val2 = pipe2._emulator._evaluate_batch(1, sam_set)
+        assert np.allclose(adj_val[0], adj_val2[0])
+        assert np.allclose(adj_val[1], adj_val2[1])
+        prism_dict['use_regr_cov'] = True
+        pipe = Pipeline(modellink_obj, root_dir=root_dir,
+                        working_dir=working_dir+'_2', prism_par=prism_dict)
+        with pytest.raises(ValueError):
+            pipe.construct(1)
+
     # Test if emulator can be constructed using chosen mock estimates
     def test_chosen_mock(self, tmpdir):
         prism_dict = get_prism_dict({'use_mock': [2, 2]})
@@ -0,0 +1,152 @@
+# -*- coding: utf-8 -*-
+
+# %% IMPORTS
+# Package imports
+import numpy as np
+import pytest
+from scipy.spatial.distance import pdist
+
+# PRISM imports
+from prism._sampling import (PROPOSALS, SAMPLERS, _Proposal, check_proposal,
+                             check_sampler, get_proposal, get_sam_set,
+                             get_sam_set_slice)
+
+
+# %% GLOBALS
+VAL_RNG = np.array([[1, 5], [-1, 1], [0, 10]])   # Value ranges of samples
+
+
+# %% PYTEST CLASSES AND FUNCTIONS
+# Pytest for the get_sam_set function
+class Test_get_sam_set(object):
+    # Check if all built-in samplers create valid sample sets
+    @pytest.mark.parametrize('sampler', list(SAMPLERS))
+    def test_samplers(self, sampler):
+        np.random.seed(0)
+        sam_set = get_sam_set(sampler, 100, VAL_RNG)
+        assert sam_set.shape == (100, 3)
+        assert (sam_set >= VAL_RNG[:, 0]).all()
+        assert (sam_set <= VAL_RNG[:, 1]).all()
+        np.random.seed(0)
+        assert np.allclose(get_sam_set(sampler, 100, VAL_RNG), sam_set)
+
+    # Check if the KD-tree LHD is a Latin Hypercube that is optimized
+    @pytest.mark.parametrize('method', ['center', 'fixed', 'random'])
+    def test_lhd_kdtree(self, method):
+        np.random.seed(0)
+        sam_set = get_sam_set('lhd_kdtree', 200, VAL_RNG, method=method,
+                              iterations=0)
+        np.random.seed(0)
+        opt_set = get_sam_set('lhd_kdtree', 200, VAL_RNG, method=method)
+        strata = (opt_set-VAL_RNG[:, 0])/(VAL_RNG[:, 1]-VAL_RNG[:, 0])
+        strata = np.minimum(np.floor(strata*200), 199)
+        for i in range(3):
+            assert len(np.unique(strata[:, i])) == 200
+        assert pdist(opt_set).min() > pdist(sam_set).min()
+
+    # Check if the KD-tree LHD takes constraints into account
+    def test_lhd_kdtree_constraints(self):
+        np.random.seed(0)
+        constraints = get_sam_set('random', 50, VAL_RNG)
+        sam_set = get_sam_set('lhd_kdtree', 100, VAL_RNG,
+                              constraints=constraints)
+        assert sam_set.shape == (100, 3)
+
+    # Check if a custom sampler can be used
+    def test_custom(self):
+        def sampler(n_sam, val_rng, **kwargs):
+            return(np.full([n_sam, val_rng.shape[0]], 1.0))
+        assert (get_sam_set(sampler, 10, VAL_RNG) == 1).all()
+
+
+# Pytest for the get_sam_set_slice function
+class Test_get_sam_set_slice(object):
+    # Check if the slices of quasi-Monte Carlo sequences are consecutive
+    @pytest.mark.parametrize('sampler', ['sobol', 'halton'])
+    def test_qmc(self, sampler):
+        sam_set = get_sam_set_slice(sampler, 100, VAL_RNG, 0, 1, 5)
+        slices = [get_sam_set_slice(sampler, 100, VAL_RNG, rank, 3, 5)
+                  for rank in range(3)]
+        assert np.allclose(np.concatenate(slices), sam_set)
+
+    # Check if all other slices are created within their own strata
+    def test_strata(self):
+        state = np.random.get_state()
+        slices = [get_sam_set_slice('lhd_kdtree', 100, VAL_RNG, rank, 4, 5)
+                  for rank in range(4)]
+        assert np.all(state[1] == np.random.get_state()[1])
+        for rank, sam_set in enumerate(slices):
+            assert sam_set.shape == (25, 3)
+            assert (sam_set[:, 0] >= 1+rank).all()
+            assert (sam_set[:, 0] <= 2+rank).all()
+        assert np.allclose(
+            get_sam_set_slice('lhd_kdtree', 100, VAL_RNG, 1, 4, 5), slices[1])
+
+    # Check if an empty slice can be created
+    def test_empty(self):
+        assert get_sam_set_slice('random', 2, VAL_RNG, 0, 4, 5).shape == (0, 3)
+
+
+# Pytest for the get_proposal function
+class Test_get_proposal(object):
+    # Obtain plausible samples within a ball in the unit hypercube
+    @classmethod
+    def setup_class(cls):
+        np.random.seed(0)
+        sam_set = get_sam_set('random', 10000, VAL_RNG)
+        cls.impl_sam = sam_set[cls.is_plausible(sam_set)]
+        cls.par_space_rem = len(cls.impl_sam)/10000
+
+    @staticmethod
+    def is_plausible(sam_set):
+        sam_set = (sam_set-VAL_RNG[:, 0])/(VAL_RNG[:, 1]-VAL_RNG[:, 0])
+        return(np.linalg.norm(sam_set-0.4, axis=1) < 0.3)
+
+    # Check if the proposal regions estimate the plausible volume correctly
+    @pytest.mark.parametrize('proposal', list(PROPOSALS))
+    def test_proposals(self, proposal):
+        np.random.seed(0)
+        proposal_obj = get_proposal(proposal, self.impl_sam, VAL_RNG)
+        sam_set = proposal_obj.sample('random', 10000)
+        assert sam_set.shape == (10000, 3)
+        assert (sam_set >= VAL_RNG[:, 0]).all()
+        assert (sam_set <= VAL_RNG[:, 1]).all()
+        impl_sam = sam_set[self.is_plausible(sam_set)]
+        assert len(impl_sam) > 2*self.par_space_rem*10000
+        par_space_rem = proposal_obj.get_weights(impl_sam).sum()/10000
+        assert np.isclose(par_space_rem, self.par_space_rem, rtol=0.1)
+
+    # Check if slices of proposal regions are created reproducibly
+    @pytest.mark.parametrize('proposal', list(PROPOSALS))
+    def test_slices(self, proposal):
+        proposal_obj = get_proposal(proposal, self.impl_sam, VAL_RNG)
+        slices = [proposal_obj.sample_slice('random', 100, rank, 3, 5)
+                  for rank in range(3)]
+        assert np.concatenate(slices).shape == (100, 3)
+        assert np.allclose(proposal_obj.sample_slice('random', 100, 1, 3, 5),
+                           slices[1])
+
+    # Check if the base class of the proposal regions is abstract
+    def test_abstract(self):
+        with pytest.raises(TypeError):
+            _Proposal(self.impl_sam, VAL_RNG)
+
+
+# Pytest for the check_proposal function
+def test_check_proposal():
+    assert check_proposal('Full', 'proposal') == 'full'
+    assert check_proposal('kdtree', 'proposal') == 'kdtree'
+    with pytest.raises(ValueError):
+        check_proposal('invalid', 'proposal')
+    with pytest.raises(ValueError):
+        check_proposal(1, 'proposal')
+
+
+# Pytest for the check_sampler function
+def test_check_sampler():
+    assert check_sampler('Sobol', 'sampler') == 'sobol'
+    assert check_sampler(np.random.rand, 'sampler') is np.random.rand
+    with pytest.raises(ValueError):
+        check_sampler('invalid', 'sampler')
+    with pytest.raises(ValueError):
+        check_sampler(1, 'sampler')
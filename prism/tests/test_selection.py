@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+
+# %% IMPORTS
+# Package imports
+import numpy as np
+import pytest
+from sklearn.linear_model import LinearRegression as LR
+from sklearn.model_selection import KFold
+from sklearn.preprocessing import PolynomialFeatures as PF
+
+# PRISM imports
+from prism.emulator._selection import (
+    get_cv_folds, select_backward, select_forward)
+
+
+# %% GLOBALS
+# Create a polynomial sample set with a known regression function
+np.random.seed(0)
+SAM_SET = np.random.rand(150, 3)*[1, 5, 10]
+POLY_TERMS = PF(3, include_bias=False).fit_transform(SAM_SET)
+MOD_SET = (np.sin(3*SAM_SET[:, 0])+0.3*SAM_SET[:, 2]**2 +
+           0.05*np.random.randn(150))
+
+
+# %% PYTEST CLASSES AND FUNCTIONS
+# Pytest for the get_cv_folds function
+@pytest.mark.parametrize('n_sam, n_cross_val', [(150, 5), (101, 3), (9, 9)])
+def test_get_cv_folds(n_sam, n_cross_val):
+    folds = get_cv_folds(n_sam, n_cross_val)
+    for fold, (_, test_idx) in zip(folds, KFold(n_cross_val).split(
+            np.zeros(n_sam))):
+        assert (np.arange(n_sam)[fold] == test_idx).all()
+    assert get_cv_folds(n_sam, 0) == [slice(0, n_sam)]
+
+
+# Pytest for the select_forward function
+class Test_select_forward(object):
+    # Check if the same terms are selected as with mlxtend
+    @pytest.mark.parametrize('n_cross_val', [0, 5])
+    def test_mlxtend(self, n_cross_val):
+        SFS = pytest.importorskip('mlxtend.feature_selection')
+        sfs_obj = SFS.SequentialFeatureSelector(
+            LR(), k_features='best', forward=True, floating=False,
+            scoring='neg_mean_squared_error', cv=n_cross_val)
+        sfs_obj.fit(POLY_TERMS, MOD_SET)
+        assert select_forward(POLY_TERMS, MOD_SET, n_cross_val) ==\
+            sorted(sfs_obj.k_feature_idx_)
+
+    # Check if an exact polynomial is recovered
+    def test_exact(self):
+        mod_set = 2+POLY_TERMS[:, 0]-3*POLY_TERMS[:, 4]
+        feature_idx = select_forward(POLY_TERMS, mod_set, 5)
+        assert 0 in feature_idx and 4 in feature_idx
+
+    # Check if linearly dependent terms are handled
+    def test_dependent(self):
+        poly_terms = np.concatenate([POLY_TERMS[:, :3], POLY_TERMS[:, :1]],
+                                    axis=1)
+        feature_idx = select_forward(poly_terms, MOD_SET, 5)
+        assert not (0 in feature_idx and 3 in feature_idx)
+
+
+# Pytest for the select_backward function
+class Test_select_backward(object):
+    # Check if the same features are selected as with mlxtend
+    @pytest.mark.parametrize('n_cross_val', [0, 5])
+    def test_mlxtend(self, n_cross_val):
+        SFS = pytest.importorskip('mlxtend.feature_selection')
+        sfs_obj = SFS.SequentialFeatureSelector(
+            LR(), k_features='parsimonious', forward=False, floating=False,
+            scoring='r2', cv=n_cross_val)
+        for X in (SAM_SET, POLY_TERMS[:, :9]):
+            sfs_obj.fit(X, MOD_SET)
+            assert select_backward(X, MOD_SET, n_cross_val) ==\
+                sorted(sfs_obj.k_feature_idx_)
+
+    # Check if multiple columns are handled independently
+    def test_multiple(self):
+        mod_sets = np.stack([MOD_SET, SAM_SET[:, 1], MOD_SET+SAM_SET[:, 1]],
+                            axis=1)
+        feature_idx = select_backward(SAM_SET, mod_sets, 5)
+        assert len(feature_idx) == 3
+        for j, idx in enumerate(feature_idx):
+            assert idx == select_backward(SAM_SET, mod_sets[:, j], 5)
+        assert feature_idx[1] == [1]
+
+    # Check if a single feature is always selected
+    def test_single(self):
+        assert select_backward(SAM_SET[:, :1], MOD_SET, 5) == [0]
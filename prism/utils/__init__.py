@@ -11,9 +11,11 @@ applications.
 
 # %% IMPORTS
 # Import utils modules
-from . import mcmc
+from . import mcmc, validation
 from .mcmc import *
+from .validation import *
 
 # All declaration
-__all__ = ['mcmc']
+__all__ = ['mcmc', 'validation']
 __all__.extend(mcmc.__all__)
+__all__.extend(validation.__all__)
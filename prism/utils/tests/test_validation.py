@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+
+# %% IMPORTS
+# Built-in imports
+from os import path
+
+# Package imports
+from e13tools.sampling import lhd
+import numpy as np
+from py.path import local
+import pytest
+
+# PRISM imports
+from prism._pipeline import Pipeline
+from prism.modellink.tests.modellink import GaussianLink2D
+from prism.utils.validation import get_impl_deviation
+
+# Set the random seed of NumPy
+np.random.seed(0)
+
+# Set the current working directory to the temporary directory
+local.get_temproot().chdir()
+
+
+# %% GLOBALS
+DIR_PATH = path.dirname(__file__)           # Path to directory of this file
+
+
+# %% CUSTOM FUNCTIONS
+# Create Pipeline object to use for testing purposes
+@pytest.fixture(scope='module')
+def pipe(tmpdir_factory):
+    tmpdir = tmpdir_factory.mktemp('test_validation')
+    root_dir = path.dirname(tmpdir.strpath)
+    working_dir = path.basename(tmpdir.strpath)
+    prism_file = path.join(DIR_PATH, 'data/prism_default.txt')
+    modellink_obj = GaussianLink2D()
+    np.random.seed(0)
+    pipeline_obj = Pipeline(modellink_obj, root_dir=root_dir,
+                            working_dir=working_dir, prism_par=prism_file)
+    pipeline_obj.construct(analyze=False)
+    return(pipeline_obj)
+
+
+# %% PYTEST CLASSES AND FUNCTIONS
+# Pytest for get_impl_deviation
+class Test_get_impl_deviation(object):
+    # Try to compare single precision with double precision
+    def test_default(self, pipe):
+        sam_set = lhd(100, pipe._modellink._n_par, pipe._modellink._par_rng)
+        results = get_impl_deviation(pipe, sam_set)
+        assert pipe._eval_dtype == 'float64'
+        if pipe._is_controller:
+            max_impl_dev, n_impl_check_dev = results
+            assert 0 <= max_impl_dev < 1e-2
+            assert n_impl_check_dev <= 1
+
+    # Try to compare double precision with itself
+    def test_float64(self, pipe):
+        sam_set = lhd(10, pipe._modellink._n_par, pipe._modellink._par_rng)
+        results = get_impl_deviation(pipe, sam_set, eval_dtype='float64')
+        if pipe._is_controller:
+            assert results == (0, 0)
+
+    # Try to evaluate the emulator in single precision
+    def test_evaluate_batch(self, pipe):
+        emul = pipe._emulator
+        emul_i = emul._emul_i
+        sam_set = np.concatenate([emul._sam_set[emul_i][:5],
+                                  emul._sam_set[emul_i][:5]+0.01])
+        adj_val = emul._evaluate_batch(emul_i, sam_set)
+        pipe.eval_dtype = 'float32'
+        adj_val2 = emul._evaluate_batch(emul_i, sam_set)
+        adj_val3 = emul._evaluate(emul_i, sam_set[0])
+        pipe.eval_dtype = 'float64'
+        assert emul._get_eval_data(emul_i)['dtype'] == np.float64
+        assert np.allclose(adj_val[0], adj_val2[0], rtol=1e-4, atol=1e-4)
+        assert np.allclose(adj_val[1], adj_val2[1], rtol=1e-2, atol=1e-4)
+        assert np.allclose(adj_val2[0][0], adj_val3[0])
+        assert np.allclose(adj_val2[1][0], adj_val3[1])
+
+    # Try to provide an invalid evaluation precision
+    def test_invalid_eval_dtype(self, pipe):
+        with pytest.raises(ValueError):
+            pipe.eval_dtype = 'float16'
+        with pytest.raises(ValueError):
+            get_impl_deviation(pipe, [[1, 1]], eval_dtype='float16')
+        assert pipe._eval_dtype == 'float64'
+
+    # Try to provide a non-Pipeline object
+    def test_no_Pipeline(self):
+        with pytest.raises(TypeError):
+            get_impl_deviation(np.array(1), [[1, 1]])
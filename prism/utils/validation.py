@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+
+"""
+Validation
+==========
+Provides several functions that allow for the approximations used in an
+emulator to be validated against the exact calculations.
+
+"""
+
+
+# %% IMPORTS
+# Package imports
+from e13tools.utils import docstring_substitute
+import numpy as np
+
+# PRISM imports
+from prism._docstrings import user_emul_i_doc
+from prism._pipeline import Pipeline
+
+# All declaration
+__all__ = ['get_impl_deviation']
+
+
+# %% FUNCTION DEFINITIONS
+# This function compares the implausibility values of two evaluation precisions
+@docstring_substitute(emul_i=user_emul_i_doc)
+def get_impl_deviation(pipeline_obj, sam_set, *, emul_i=None,
+                       eval_dtype='float32'):
+    """
+    Evaluates the provided `sam_set` in the provided `pipeline_obj` at
+    iteration `emul_i` in both double precision and the requested precision
+    `eval_dtype`, and returns how much the resulting univariate implausibility
+    values deviate from each other.
+
+    This function needs to be called by all MPI ranks.
+
+    Parameters
+    ----------
+    pipeline_obj : :obj:`~prism.Pipeline` object
+        The instance of the :class:`~prism.Pipeline` class that needs to be
+        used for evaluating `sam_set`.
+    sam_set : 2D array_like or dict
+        Array containing the model parameter value sets to evaluate.
+
+    Optional
+    --------
+    %(emul_i)s
+    eval_dtype : {'float64', 'float32'}. Default: 'float32'
+        The floating point precision that must be compared with double
+        precision.
+
+    Returns (if controller)
+    -----------------------
+    max_impl_dev : float
+        The maximum absolute difference between the univariate implausibility
+        values of all samples in `sam_set` that stopped at the same emulator
+        iteration in both precisions.
+    n_impl_check_dev : int
+        The number of samples in `sam_set` for which the plausibility or the
+        last emulator iteration at which they are still plausible differs
+        between both precisions.
+
+    See also
+    --------
+    :attr:`~prism.Pipeline.eval_dtype`
+        The floating point precision that is used for evaluating the emulator.
+
+    """
+
+    # Make abbreviation for pipeline_obj
+    pipe = pipeline_obj
+
+    # Check if provided pipeline_obj is an instance of the Pipeline class
+    if not isinstance(pipe, Pipeline):
+        raise TypeError("Input argument 'pipeline_obj' must be an instance of "
+                        "the Pipeline class!")
+
+    # Make sure that sam_set is two-dimensional if it is not a dict
+    if not isinstance(sam_set, dict):
+        sam_set = np.array(sam_set, ndmin=2)
+
+    # Save the current evaluation precision
+    old_eval_dtype = pipe._eval_dtype
+
+    # Evaluate sam_set in both precisions
+    try:
+        pipe.eval_dtype = 'float64'
+        results_ref = pipe.evaluate(sam_set, emul_i)
+        pipe.eval_dtype = eval_dtype
+        results = pipe.evaluate(sam_set, emul_i)
+
+    # Restore the evaluation precision afterward
+    finally:
+        pipe.eval_dtype = old_eval_dtype
+
+    # Only the controller obtains the results
+    if pipe._is_controller:
+        # Determine which samples were rejected in the same iteration
+        same_stop = ((np.array(results_ref['emul_i_stop']) ==
+                      np.array(results['emul_i_stop'])) *
+                     (np.array(results_ref['impl_check']) ==
+                      np.array(results['impl_check'])))
+
+        # Determine the maximum deviation of their implausibility values
+        max_impl_dev = max([0]+[
+            np.max(np.abs(np.subtract(results['uni_impl_val'][i],
+                                      results_ref['uni_impl_val'][i])))
+            for i in np.nonzero(same_stop)[0]])
+
+        # Return the results
+        return(float(max_impl_dev), int(np.sum(~same_stop)))